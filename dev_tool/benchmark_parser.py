@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+
+import re
+import sys
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+
+vint_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(vint_root))
+
+from vint._bundles import vimlparser
+from vint.ast.parsing import Parser
+from vint.linting.lint_target import LintTargetFile
+
+
+def uncompiled_eqreg(s, reg):
+    return re.search(vimlparser.pat_vim2py[reg], s, re.IGNORECASE)
+
+
+def uncompiled_eqregh(s, reg):
+    return re.search(vimlparser.pat_vim2py[reg], s)
+
+
+# NOTE: Regular expressions were compiled on each call before they were
+#       compiled at import time.
+UNCOMPILED_MATCHERS = {
+    'viml_eqreg': uncompiled_eqreg,
+    'viml_eqregh': uncompiled_eqregh,
+    'viml_eqregq': uncompiled_eqreg,
+}
+
+
+def measure_time(file_path, repeat):
+    parser = Parser()
+
+    start_time = time.time()
+    for _ in range(repeat):
+        parser.parse(LintTargetFile(file_path))
+
+    return (time.time() - start_time) / repeat
+
+
+def measure_time_by_uncompiled_matchers(file_path, repeat):
+    compiled_matchers = {name: getattr(vimlparser, name) for name in UNCOMPILED_MATCHERS}
+
+    try:
+        for name, matcher in UNCOMPILED_MATCHERS.items():
+            setattr(vimlparser, name, matcher)
+
+        return measure_time(file_path, repeat)
+    finally:
+        for name, matcher in compiled_matchers.items():
+            setattr(vimlparser, name, matcher)
+
+
+if __name__ == '__main__':
+    arg_parser = ArgumentParser(prog='benchmark_parser',
+                                description='Compare parse time by compiled and uncompiled regular expressions')
+    arg_parser.add_argument('--repeat', type=int, default=5, help='Times to repeat')
+    arg_parser.add_argument('files', nargs='+', help='File to parse')
+    namespace = vars(arg_parser.parse_args(sys.argv[1:]))
+
+    for file_path in map(Path, namespace['files']):
+        uncompiled_time = measure_time_by_uncompiled_matchers(file_path, namespace['repeat'])
+        compiled_time = measure_time(file_path, namespace['repeat'])
+
+        print('{path}: uncompiled {uncompiled_time:.3f}s, compiled {compiled_time:.3f}s ({ratio:.1f}% faster)'.format(
+            path=file_path,
+            uncompiled_time=uncompiled_time,
+            compiled_time=compiled_time,
+            ratio=(uncompiled_time - compiled_time) / uncompiled_time * 100))
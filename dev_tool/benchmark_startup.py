@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import re
+import sys
+import subprocess
+from argparse import ArgumentParser
+from pathlib import Path
+
+vint_root = Path(__file__).resolve().parent.parent
+
+IMPORT_TIME_PATTERN = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)$')
+
+
+def measure_import_times(vint_args, stdin_path):
+    """ Returns cumulative import times in microseconds by top-level module
+    names, and self import times in microseconds by module names.
+    """
+    command = [sys.executable, '-X', 'importtime', '-m', 'vint'] + vint_args
+
+    stdin = open(stdin_path, 'rb') if stdin_path else subprocess.DEVNULL
+    try:
+        process = subprocess.run(command, cwd=str(vint_root), stdin=stdin,
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    finally:
+        if stdin_path:
+            stdin.close()
+
+    top_level_times = {}
+    self_times = {}
+
+    for line in process.stderr.decode('utf-8', 'replace').splitlines():
+        matched = IMPORT_TIME_PATTERN.match(line)
+        if matched is None:
+            continue
+
+        self_time, cumulative_time, indent, module_name = matched.groups()
+        self_times[module_name] = int(self_time)
+
+        # NOTE: Top-level imports are indented by 1 space.
+        if len(indent) == 1:
+            top_level_times[module_name] = int(cumulative_time)
+
+    return top_level_times, self_times
+
+
+if __name__ == '__main__':
+    arg_parser = ArgumentParser(prog='benchmark_startup',
+                                description='Measure import times of vint by python -X importtime')
+    arg_parser.add_argument('--top', type=int, default=10, help='Number of the slowest modules to show')
+    arg_parser.add_argument('--stdin', type=str, help='File to pass to standard input (use "-" in vint args)')
+    arg_parser.add_argument('vint_args', nargs='*', default=['--version'], help='Arguments for vint')
+    namespace = vars(arg_parser.parse_args(sys.argv[1:]))
+
+    top_level_times, self_times = measure_import_times(namespace['vint_args'], namespace['stdin'])
+
+    print('vint {args}: imported {count} modules in {total:.1f}ms'.format(
+        args=' '.join(namespace['vint_args']),
+        count=len(self_times),
+        total=sum(top_level_times.values()) / 1000.0))
+
+    slowest_modules = sorted(self_times.items(), key=lambda item: item[1], reverse=True)
+    for module_name, self_time in slowest_modules[:namespace['top']]:
+        print('{time:8.1f}ms  {name}'.format(time=self_time / 1000.0, name=module_name))
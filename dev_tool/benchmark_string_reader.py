@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+
+import sys
+import time
+import tracemalloc
+from argparse import ArgumentParser
+from pathlib import Path
+
+vint_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(vint_root))
+
+from vint._bundles import vimlparser
+from vint.ast.string_reader import CompactStringReader
+from vint.encodings.decoder import Decoder
+from vint.encodings.decoding_strategy import default_decoding_strategy
+
+
+READER_CLASSES = [vimlparser.StringReader, CompactStringReader]
+
+
+def read_lines(file_path):
+    decoder = Decoder(default_decoding_strategy)
+    return decoder.decode(file_path.read_bytes()).split('\n')
+
+
+def measure_memory(reader_class, lines):
+    tracemalloc.start()
+    reader = reader_class(lines)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # NOTE: Keep the reader alive until the memory is measured.
+    del reader
+    return memory
+
+
+def measure_time(reader_class, lines, repeat):
+    start_time = time.time()
+    for _ in range(repeat):
+        reader_class(lines)
+    construction_time = (time.time() - start_time) / repeat
+
+    start_time = time.time()
+    for _ in range(repeat):
+        vimlparser.VimLParser().parse(reader_class(lines))
+    parse_time = (time.time() - start_time) / repeat
+
+    return construction_time, parse_time
+
+
+if __name__ == '__main__':
+    arg_parser = ArgumentParser(prog='benchmark_string_reader',
+                                description='Compare memory and speed of string readers')
+    arg_parser.add_argument('--repeat', type=int, default=3, help='Times to repeat')
+    arg_parser.add_argument('files', nargs='+', help='File to parse')
+    namespace = vars(arg_parser.parse_args(sys.argv[1:]))
+
+    for file_path in map(Path, namespace['files']):
+        lines = read_lines(file_path)
+        print('{path}: {size} bytes'.format(path=file_path, size=file_path.stat().st_size))
+
+        for reader_class in READER_CLASSES:
+            memory = measure_memory(reader_class, lines)
+            construction_time, parse_time = measure_time(reader_class, lines, namespace['repeat'])
+
+            print('  {name}: {memory:.1f} MiB, construct {construction_time:.3f}s, '
+                  'parse {parse_time:.3f}s'.format(
+                      name=reader_class.__name__,
+                      memory=memory / 1024.0 / 1024.0,
+                      construction_time=construction_time,
+                      parse_time=parse_time))
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+import sys
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+
+vint_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(vint_root))
+
+from vint.ast.traversing import traverse
+from vint.ast.parsing import Parser
+from vint.ast.plugin.scope_plugin import ScopePlugin
+from vint.bootstrap import import_all_policies
+from vint.linting.level import Level
+from vint.linting.linter import Linter
+from vint.linting.lint_target import LintTargetFile
+from vint.linting.policy_registry import get_policy_classes
+from vint.linting.policy_set import PolicySet
+
+
+class TraverseCallCounter(object):
+    """ A class to count calls of traverse. Each call visits one node. """
+    def __init__(self):
+        self.count = 0
+
+
+    def __enter__(self):
+        self.count = 0
+        sys.setprofile(self._profile)
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        sys.setprofile(None)
+
+
+    def _profile(self, frame, event, arg):
+        if event == 'call' and frame.f_code is traverse.__code__:
+            self.count += 1
+
+
+
+def count_nodes(ast):
+    counter = {'nodes': 0}
+
+    def increment(node):
+        counter['nodes'] += 1
+
+    traverse(ast, on_enter=increment)
+    return counter['nodes']
+
+
+def benchmark(file_path, linter):
+    lint_target = LintTargetFile(file_path)
+    ast = Parser().parse(lint_target)
+
+    with TraverseCallCounter() as scope_plugin_counter:
+        ScopePlugin().process(ast)
+
+    other_ast = Parser().parse(lint_target)
+    start_time = time.time()
+    ScopePlugin().process(other_ast)
+    scope_plugin_time = time.time() - start_time
+
+    with TraverseCallCounter() as linter_counter:
+        linter.lint(lint_target)
+
+    # NOTE: Count nodes after the plugin attached sub-ASTs of strings and redirections.
+    nodes = count_nodes(ast)
+
+    return {
+        'nodes': nodes,
+        'scope_plugin_passes': float(scope_plugin_counter.count) / nodes,
+        'scope_plugin_time': scope_plugin_time,
+        'linter_passes': float(linter_counter.count) / nodes,
+    }
+
+
+if __name__ == '__main__':
+    arg_parser = ArgumentParser(prog='benchmark_traversal',
+                                description='Show how many times the AST is traversed per file')
+    arg_parser.add_argument('files', nargs='+', help='File to lint')
+    namespace = vars(arg_parser.parse_args(sys.argv[1:]))
+
+    import_all_policies()
+    config = {'cmdargs': {'severity': Level.STYLE_PROBLEM}, 'policies': {}}
+    linter = Linter(PolicySet(get_policy_classes()), config)
+
+    for file_path in map(Path, namespace['files']):
+        result = benchmark(file_path, linter)
+
+        print('{path}: {nodes} nodes, scope plugin {scope_plugin_passes:.2f} passes '
+              '({scope_plugin_time:.3f}s), whole linting {linter_passes:.2f} passes'.format(
+                  path=file_path, **result))
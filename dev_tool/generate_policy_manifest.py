@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+
+vint_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(vint_root))
+
+from vint.bootstrap import import_all_policies
+from vint.linting.policy_registry import get_policy_classes, build_policy_manifest
+
+
+MANIFEST_PATH = Path(vint_root, 'vint', 'linting', 'policy_manifest.py')
+
+MANIFEST_HEADER = '''\
+# NOTE: This file is generated by dev_tool/generate_policy_manifest.py.
+#       Do not edit it by hand, and regenerate it when policies are changed.
+'''
+
+
+def format_policy_manifest(policy_manifest):
+    lines = [MANIFEST_HEADER, 'POLICY_MANIFEST = [']
+
+    for manifest_entry in policy_manifest:
+        lines += [
+            '    {',
+            "        'name': {!r},".format(manifest_entry['name']),
+            "        'module': {!r},".format(manifest_entry['module']),
+            "        'level': {!r},".format(manifest_entry['level']),
+            "        'listen_node_types': {!r},".format(manifest_entry['listen_node_types']),
+            "        'required_plugins': {!r},".format(manifest_entry['required_plugins']),
+            '    },',
+        ]
+
+    lines.append(']')
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':
+    arg_parser = ArgumentParser(prog='generate_policy_manifest',
+                                description='Generate the policy manifest that lets vint import only enabled policies')
+    arg_parser.add_argument('--check', action='store_true', help='Exit with 1 if the manifest is outdated')
+    namespace = vars(arg_parser.parse_args(sys.argv[1:]))
+
+    import_all_policies()
+    source = format_policy_manifest(build_policy_manifest(get_policy_classes()))
+
+    if namespace['check']:
+        is_outdated = not MANIFEST_PATH.exists() or MANIFEST_PATH.read_text() != source
+
+        if is_outdated:
+            print('{path} is outdated'.format(path=MANIFEST_PATH))
+        sys.exit(1 if is_outdated else 0)
+
+    MANIFEST_PATH.write_text(source)
+    print('{path} is generated'.format(path=MANIFEST_PATH))
@@ -113,6 +113,35 @@ class TestCLI(unittest.TestCase):
         self.assertIsInstance(json.loads(got_output), list)
 
 
+    def test_exec_vint_with_json_and_stream_flags(self):
+        invalid_file = str(Path('test', 'fixture', 'cli', 'invalid1.vim'))
+        valid_file = str(Path('test', 'fixture', 'cli', 'valid1.vim'))
+        cmd = [sys.executable, '-m', 'vint', '--json', '--stream', invalid_file, valid_file, invalid_file]
+
+        with self.assertRaises(subprocess.CalledProcessError) as context_manager:
+            subprocess.check_output(cmd,
+                                    universal_newlines=True)
+
+        got_output = context_manager.exception.output
+
+        self.assertEqual(len(json.loads(got_output)), 2)
+
+
+    def test_exec_vint_with_jsonl_flag(self):
+        invalid_file = str(Path('test', 'fixture', 'cli', 'invalid1.vim'))
+        cmd = [sys.executable, '-m', 'vint', '--jsonl', invalid_file, invalid_file]
+
+        with self.assertRaises(subprocess.CalledProcessError) as context_manager:
+            subprocess.check_output(cmd,
+                                    universal_newlines=True)
+
+        got_lines = context_manager.exception.output.splitlines()
+
+        self.assertEqual(len(got_lines), 2)
+        for got_line in got_lines:
+            self.assertIsInstance(json.loads(got_line), dict)
+
+
     def test_exec_vint_with_verbose_flag(self):
         valid_file = str(Path('test', 'fixture', 'cli', 'valid1.vim'))
         cmd = [sys.executable, '-m', 'vint', '--verbose', valid_file]
@@ -0,0 +1,124 @@
+import unittest
+import json
+import subprocess
+import sys
+import threading
+import time
+
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+
+
+DOCUMENT_URI = 'file:///path/to/plugin/test.vim'
+VALID_TEXT = 'scriptencoding utf-8\necho 1\n'
+INVALID_TEXT = "scriptencoding utf-8\necho 'a' =~ 'b'\n"
+TIMEOUT = 10
+
+
+class TestLSP(unittest.TestCase):
+    """ Tests for `vint --lsp` by a scripted client on standard inputs and outputs. """
+    def setUp(self):
+        cmd = [sys.executable, '-m', 'vint', '--lsp']
+        self.process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+
+        self.messages = queue.Queue()
+        reader_thread = threading.Thread(target=self._read_messages)
+        reader_thread.daemon = True
+        reader_thread.start()
+
+
+    def tearDown(self):
+        if self.process.poll() is None:
+            self.process.kill()
+
+        self.process.wait()
+        self.process.stdin.close()
+        self.process.stdout.close()
+
+
+    def _read_messages(self):
+        stdout = self.process.stdout
+
+        while True:
+            header_line = stdout.readline()
+            if not header_line:
+                return
+
+            content_length = int(header_line.decode('ascii').split(':')[1])
+            stdout.readline()
+
+            self.messages.put(json.loads(stdout.read(content_length).decode('utf-8')))
+
+
+    def send(self, message):
+        body = json.dumps(dict(message, jsonrpc='2.0')).encode('utf-8')
+        header = 'Content-Length: {0}\r\n\r\n'.format(len(body)).encode('ascii')
+
+        self.process.stdin.write(header + body)
+        self.process.stdin.flush()
+
+
+    def receive(self):
+        return self.messages.get(timeout=TIMEOUT)
+
+
+    def change(self, text, version):
+        self.send({
+            'method': 'textDocument/didChange',
+            'params': {
+                'textDocument': {'uri': DOCUMENT_URI, 'version': version},
+                'contentChanges': [{'text': text}],
+            },
+        })
+
+
+    def test_publish_diagnostics(self):
+        self.send({'id': 1, 'method': 'initialize', 'params': {'capabilities': {}}})
+        initialize_response = self.receive()
+        self.assertEqual(initialize_response['id'], 1)
+        self.assertEqual(initialize_response['result']['capabilities']['textDocumentSync']['change'], 1)
+
+        self.send({'method': 'initialized', 'params': {}})
+        self.send({
+            'method': 'textDocument/didOpen',
+            'params': {
+                'textDocument': {
+                    'uri': DOCUMENT_URI,
+                    'languageId': 'vim',
+                    'version': 1,
+                    'text': INVALID_TEXT,
+                },
+            },
+        })
+
+        diagnostics_on_open = self.receive()
+        self.assertEqual(diagnostics_on_open['method'], 'textDocument/publishDiagnostics')
+        self.assertEqual(diagnostics_on_open['params']['uri'], DOCUMENT_URI)
+        self.assertEqual([(diagnostic['code'], diagnostic['range']['start']) for diagnostic in diagnostics_on_open['params']['diagnostics']],
+                         [('ProhibitEqualTildeOperator', {'line': 1, 'character': 9})])
+
+        # Rapid changes should be linted once by the last text.
+        self.change(INVALID_TEXT + INVALID_TEXT, 2)
+        self.change(VALID_TEXT + INVALID_TEXT, 3)
+        self.change(VALID_TEXT, 4)
+
+        diagnostics_on_change = self.receive()
+        self.assertEqual(diagnostics_on_change['params']['diagnostics'], [])
+
+        # Unchanged texts should not be linted again.
+        self.change(VALID_TEXT, 5)
+        time.sleep(1)
+        self.send({'id': 2, 'method': 'textDocument/hover', 'params': {}})
+        self.assertEqual(self.receive()['error']['code'], -32601)
+
+        self.send({'id': 3, 'method': 'shutdown'})
+        self.assertEqual(self.receive(), {'jsonrpc': '2.0', 'id': 3, 'result': None})
+
+        self.send({'method': 'exit'})
+        self.assertEqual(self.process.wait(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,3 +5,13 @@ class FormatterAssertion(unittest.TestCase):
     def assertFormattedViolations(self, formatter, violations, expected_output):
         got_output = formatter.format_violations(violations)
         self.assertEqual(got_output, expected_output)
+
+
+    def assertStreamedViolations(self, formatter, violations_by_file, expected_output):
+        got_output = formatter.start_streaming()
+
+        for violations in violations_by_file:
+            got_output += formatter.format_violations_of_file(violations)
+
+        got_output += formatter.end_streaming()
+        self.assertEqual(got_output, expected_output)
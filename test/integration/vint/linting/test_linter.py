@@ -1,13 +1,20 @@
 import unittest
+import shutil
+import tempfile
 from pathlib import Path
 from vint.ast.node_type import NodeType
 from vint.linting.level import Level
 from vint.linting.policy.abstract_policy import AbstractPolicy
 from vint.linting.linter import Linter
-from vint.linting.lint_target import LintTargetFile
+from vint.linting.policy_set import PolicySet
+from vint.ast.plugin.scope_plugin.identifier_attribute import IDENTIFIER_ATTRIBUTE
+from vint.linting.lint_target import LintTargetFile, LintTargetBuffer
+from vint.linting.lint_result_cache import LintResultCache
+from vint.linting.policy.prohibit_no_abort_function import ProhibitNoAbortFunction
 
 INVALID_VIM_SCRIPT = Path('test', 'fixture', 'linter', 'invalid.vim')
 BROKEN_VIM_SCRIPT = Path('test', 'fixture', 'linter', 'broken.vim')
+VALID_VIM_SCRIPT = Path('test', 'fixture', 'cli', 'valid1.vim')
 
 
 class TestLinterIntegral(unittest.TestCase):
@@ -44,13 +51,27 @@ class TestLinterIntegral(unittest.TestCase):
     class StubPolicySet(object):
         def __init__(self):
             self._enabled_policies = []
+            self.update_count = 0
 
 
         def get_enabled_policies(self):
             return self._enabled_policies
 
 
+        def reset_policies(self):
+            pass
+
+
+        def get_policies_enabled_by_config(self, config_dict):
+            return []
+
+
+        def get_policies_by_names(self, policy_names):
+            return []
+
+
         def update_by_config(self, config_dict):
+            self.update_count += 1
             self._enabled_policies = []
 
             policy_enabling_map = config_dict['policies']
@@ -164,5 +185,142 @@ class TestLinterIntegral(unittest.TestCase):
         self.assertEqual(got_violations, expected_violations)
 
 
+    def test_lint_builds_listeners_map_only_when_config_changed(self):
+        policy_set = TestLinterIntegral.StubPolicySet()
+
+        config_dict_global = {
+            'cmdargs': {
+                'severity': Level.WARNING,
+            },
+            'policies': {
+                'StubPolicy1': {
+                    'enabled': True,
+                },
+                'StubPolicy2': {
+                    'enabled': False,
+                },
+            }
+        }
+
+        linter = Linter(policy_set, config_dict_global)
+
+        linter.lint(LintTargetFile(VALID_VIM_SCRIPT))
+        self.assertEqual(policy_set.update_count, 1)
+
+        # NOTE: The fixture has 2 config comments, and the initial state is already cached.
+        linter.lint(LintTargetFile(INVALID_VIM_SCRIPT))
+        self.assertEqual(policy_set.update_count, 3)
+
+
+    def test_lint_with_max_violations(self):
+        policy_set = TestLinterIntegral.StubPolicySet()
+
+        config_dict_global = {
+            'cmdargs': {
+                'severity': Level.WARNING,
+            },
+            'policies': {
+                'StubPolicy1': {
+                    'enabled': True,
+                },
+                'StubPolicy2': {
+                    'enabled': False,
+                },
+            }
+        }
+
+        linter = Linter(policy_set, config_dict_global)
+        got_violations = linter.lint(LintTargetFile(INVALID_VIM_SCRIPT), max_violations=2)
+
+        got_lines = [violation['position']['line'] for violation in got_violations]
+        self.assertEqual(got_lines, [1, 7])
+
+
+    def test_lint_ast(self):
+        policy_set = TestLinterIntegral.StubPolicySet()
+
+        config_dict_global = {
+            'cmdargs': {
+                'severity': Level.WARNING,
+            },
+            'policies': {
+                'StubPolicy1': {
+                    'enabled': True,
+                },
+                'StubPolicy2': {
+                    'enabled': False,
+                },
+            }
+        }
+
+        linter = Linter(policy_set, config_dict_global)
+
+        with INVALID_VIM_SCRIPT.open() as f:
+            content = f.read()
+
+        root_ast = linter.parse_string(content)
+        lint_target = LintTargetBuffer(INVALID_VIM_SCRIPT, content.encode('utf-8'))
+
+        self.assertEqual(linter.lint_ast(root_ast, lint_target),
+                         linter.lint(LintTargetFile(INVALID_VIM_SCRIPT)))
+
+
+
+    def test_lint_runs_scope_plugin_only_if_required(self):
+        class IdentifierPolicy(AbstractPolicy):
+            level = Level.WARNING
+
+
+            def listen_node_types(self):
+                return [NodeType.IDENTIFIER]
+
+
+            def is_valid(self, node, lint_context):
+                return IDENTIFIER_ATTRIBUTE in node
+
+
+        class ScopeRequiringPolicy(AbstractPolicy):
+            level = Level.WARNING
+            required_plugins = ['scope']
+
+
+        content = 'call map([], "v:val")\n" vint: +ScopeRequiringPolicy\n'
+        lint_target = LintTargetBuffer(INVALID_VIM_SCRIPT, content.encode('utf-8'))
+        config_dict_global = {
+            'cmdargs': {'severity': Level.WARNING},
+            'policies': {'ScopeRequiringPolicy': {'enabled': False}},
+        }
+
+        # The policy enabled by the config comment requires the scope plugin.
+        linter = Linter(PolicySet([IdentifierPolicy, ScopeRequiringPolicy]), config_dict_global)
+        self.assertEqual(linter.lint(lint_target), [])
+
+        # Identifiers in strings are checked even if the scope plugin does not run.
+        linter = Linter(PolicySet([IdentifierPolicy]), config_dict_global)
+        violations = linter.lint(LintTargetBuffer(INVALID_VIM_SCRIPT, b'call map([], "v:val")\n'))
+        self.assertEqual([violation['position']['column'] for violation in violations], [6, 14])
+
+
+    def test_lint_with_cache_does_not_share_results_between_paths(self):
+        cache_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, str(cache_dir))
+
+        # ProhibitNoAbortFunction reports only functions in autoload directories.
+        content = b'function! a#f()\nendfunction\n'
+        config_dict_global = {
+            'cmdargs': {'severity': Level.WARNING},
+            'policies': {},
+        }
+
+        for _ in range(2):
+            linter = Linter(PolicySet([ProhibitNoAbortFunction]), config_dict_global,
+                            cache=LintResultCache(cache_dir, '1.0.0'))
+
+            self.assertEqual(linter.lint(LintTargetBuffer(Path('plugin', 'a.vim'), content)), [])
+
+            violations = linter.lint(LintTargetBuffer(Path('autoload', 'a.vim'), content))
+            self.assertEqual([violation['name'] for violation in violations], ['ProhibitNoAbortFunction'])
+
+
 if __name__ == '__main__':
     unittest.main()
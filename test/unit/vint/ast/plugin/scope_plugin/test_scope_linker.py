@@ -734,5 +734,33 @@ class TestScopeLinker(unittest.TestCase):
         self.assertScopeTreeEqual(expected_scope_tree, linker.scope_tree)
 
 
+    def test_process_builds_independent_scope_trees_for_each_ast(self):
+        linker = ScopeLinker()
+
+        linker.process(self.create_ast(Fixtures.DECLARING_VAR))
+        linker.process(self.create_ast(Fixtures.DECLARING_FUNC))
+
+        fresh_linker = ScopeLinker()
+        fresh_linker.process(self.create_ast(Fixtures.DECLARING_FUNC))
+
+        self.assertEqual(len(linker.scope_tree.child_scopes), 1)
+        self.assertScopeTreeEqual(fresh_linker.scope_tree, linker.scope_tree)
+
+
+    def test_get_collected_identifiers_after_process(self):
+        ast = self.create_ast(Fixtures.DECLARING_AND_REFERENCING)
+        linker = ScopeLinker()
+
+        linker.process(ast)
+
+        function_identifiers = linker.get_collected_identifiers(ast['body'][0])
+        call_identifiers = linker.get_collected_identifiers(ast['body'][1])
+
+        self.assertEqual([id_node['value'] for id_node in function_identifiers.statically_declared_identifiers],
+                         ['s:Function'])
+        self.assertEqual([id_node['value'] for id_node in call_identifiers.statically_referencing_identifiers],
+                         ['s:Function'])
+
+
 if __name__ == '__main__':
     unittest.main()
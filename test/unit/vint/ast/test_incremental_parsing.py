@@ -0,0 +1,101 @@
+import unittest
+from vint.ast.parsing import Parser
+from vint.ast.incremental_parsing import (
+    IncrementalParseError,
+    find_changed_region,
+    collect_positions,
+    shift_positions,
+    get_line_start_position,
+)
+
+
+def parse_lines(lines):
+    parser = Parser()
+    return parser.parse_string('\n'.join(lines))
+
+
+class TestFindChangedRegion(unittest.TestCase):
+    def test_find_changed_region_returns_none_when_not_changed(self):
+        lines = ['echo 1', 'echo 2']
+        ast = parse_lines(lines)
+
+        self.assertIsNone(find_changed_region(ast['body'], lines, list(lines)))
+
+
+    def test_find_changed_region_covers_whole_function(self):
+        previous_lines = [
+            'echo 1',
+            'function! s:Func()',
+            '  return 1',
+            'endfunction',
+            'echo 2',
+            'echo 3',
+        ]
+        lines = list(previous_lines)
+        lines[2:3] = ['  let l:x = 1', '  return l:x']
+        ast = parse_lines(previous_lines)
+
+        region = find_changed_region(ast['body'], previous_lines, lines)
+
+        self.assertEqual((region.start_index, region.end_index), (1, 2))
+        self.assertEqual((region.start_lnum, region.previous_end_lnum, region.end_lnum), (2, 4, 5))
+
+
+    def test_find_changed_region_extends_to_continuation_lines(self):
+        previous_lines = [
+            'echo 1',
+            'echo 2',
+            'let s:x = 1',
+            '  \\ + 1',
+            'echo 3',
+        ]
+        lines = list(previous_lines)
+        lines[3] = '  \\ + 2'
+        ast = parse_lines(previous_lines)
+
+        region = find_changed_region(ast['body'], previous_lines, lines)
+
+        self.assertEqual((region.start_index, region.end_index), (2, 3))
+        self.assertEqual((region.start_lnum, region.end_lnum), (3, 4))
+
+
+    def test_find_changed_region_raises_when_no_statements(self):
+        with self.assertRaises(IncrementalParseError):
+            find_changed_region([], ['" comment'], ['echo 1'])
+
+
+
+class TestPositions(unittest.TestCase):
+    def test_collect_positions_includes_positions_of_excommands(self):
+        ast = parse_lines(['redir => s:output'])
+        excmd = ast['body'][0]
+
+        positions = collect_positions(ast['body'])
+
+        self.assertIn(excmd['pos'], positions)
+        self.assertIn(excmd['ea']['argpos'], positions)
+
+        # NOTE: Each position should be shifted only once.
+        self.assertEqual(len(positions), len(set(id(pos) for pos in positions)))
+
+
+    def test_shift_positions(self):
+        ast = parse_lines(['echo 1'])
+        number = ast['body'][0]['list'][0]
+
+        shift_positions(collect_positions(ast['body']), lnum_delta=2, i_delta=10, offset_delta=12)
+
+        self.assertEqual(number['pos'], {'lnum': 3, 'col': 6, 'i': 15, 'offset': 17})
+
+
+    def test_get_line_start_position_on_multibyte_line(self):
+        lines = ['echo 1', '" »', 'let s:a = "»" | echo s:a']
+        ast = parse_lines(lines)
+        echo = ast['body'][2]
+
+        # NOTE: Columns and offsets count bytes, but indices count characters.
+        self.assertEqual(get_line_start_position(echo, lines), {'i': 11, 'offset': 12})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import unittest
+import copy
+from vint.ast.node import Node, Position, create_node, _NODE_CLASSES
+from vint.ast.node_type import NodeType
+from vint.ast.parsing import Parser
+from vint.ast.plugin.scope_plugin.identifier_attribute import IDENTIFIER_ATTRIBUTE
+from vint.ast.plugin.scope_plugin.reference_reachability_tester import REACHABILITY_FLAG, REFERENCED_FLAG
+from vint.ast.plugin.scope_plugin.redir_assignment_parser import REDIR_CONTENT
+from vint.ast.plugin.scope_plugin.call_node_parser import (
+    LAMBDA_STRING_EXPR_CONTENT,
+    FUNCTION_REFERENCE_STRING_EXPR_CONTENT,
+    STRING_EXPR_CONTEXT,
+)
+
+
+class TestNode(unittest.TestCase):
+    def test_create_node(self):
+        node = create_node(NodeType.IDENTIFIER.value)
+        node.pos = {'i': 0, 'lnum': 1, 'col': 1, 'offset': 0}
+        node['value'] = 'g:foo'
+
+        self.assertEqual(node['type'], NodeType.IDENTIFIER.value)
+        self.assertEqual(node.value, 'g:foo')
+        self.assertEqual(node, {
+            'type': NodeType.IDENTIFIER.value,
+            'pos': {'i': 0, 'lnum': 1, 'col': 1, 'offset': 0},
+            'value': 'g:foo',
+        })
+
+        self.assertNotIn(REACHABILITY_FLAG, node)
+        self.assertIsNone(node.get(REACHABILITY_FLAG))
+        with self.assertRaises(KeyError):
+            node[REACHABILITY_FLAG]
+
+        node[REACHABILITY_FLAG] = True
+        self.assertIn(REACHABILITY_FLAG, node)
+
+        del node[REACHABILITY_FLAG]
+        self.assertNotIn(REACHABILITY_FLAG, node)
+
+
+    def test_unknown_keys(self):
+        node = create_node(NodeType.NUMBER.value)
+
+        node['VINT:unknown'] = 1
+        node.unknown_attribute = 2
+
+        self.assertEqual(node['VINT:unknown'], 1)
+        self.assertEqual(node.unknown_attribute, 2)
+        self.assertEqual(set(node.keys()), {'type', 'VINT:unknown', 'unknown_attribute'})
+
+        with self.assertRaises(AttributeError):
+            node.undefined_attribute
+
+
+    def test_nodes_are_smaller_than_dicts(self):
+        node = create_node(NodeType.IDENTIFIER.value)
+
+        self.assertFalse(hasattr(node, '__dict__'))
+        self.assertFalse(hasattr(Position(), '__dict__'))
+
+
+    def test_deepcopy(self):
+        node = create_node(NodeType.IDENTIFIER.value)
+        node['value'] = 'foo'
+
+        copied_node = copy.deepcopy(node)
+
+        self.assertEqual(copied_node, node)
+        self.assertNotIn('pos', copied_node)
+
+
+    def test_slots_for_annotations_of_scope_plugin(self):
+        def get_keys(node_type):
+            return _NODE_CLASSES[node_type.value]._slot_names
+
+        self.assertIn(IDENTIFIER_ATTRIBUTE, get_keys(NodeType.IDENTIFIER))
+        self.assertIn(REACHABILITY_FLAG, get_keys(NodeType.IDENTIFIER))
+        self.assertIn(REFERENCED_FLAG, get_keys(NodeType.IDENTIFIER))
+        self.assertIn(REDIR_CONTENT, get_keys(NodeType.EXCMD))
+        self.assertIn(LAMBDA_STRING_EXPR_CONTENT, get_keys(NodeType.STRING))
+        self.assertIn(FUNCTION_REFERENCE_STRING_EXPR_CONTENT, get_keys(NodeType.STRING))
+        self.assertIn(STRING_EXPR_CONTEXT, get_keys(NodeType.STRING))
+
+
+    def test_parser_builds_slotted_nodes(self):
+        ast = Parser().parse_string('echo 1')
+        echo_node = ast['body'][0]
+
+        self.assertIsInstance(echo_node, Node)
+        self.assertIsInstance(echo_node['pos'], Position)
+        self.assertEqual(echo_node['pos'], {'i': 0, 'lnum': 1, 'col': 1, 'offset': 0})
+        self.assertEqual(echo_node['ea']['argpos']['col'], 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import unittest
+from vint.ast.parsing import Parser
+from vint.ast.node_type import NodeType
+from vint.ast.node_index import NodeIndex, build_node_index, get_node_index, find_comment_nodes
+from vint.ast.plugin.scope_plugin import ScopePlugin
+
+
+class TestNodeIndex(unittest.TestCase):
+    def test_get_nodes(self):
+        ast = Parser().parse_string('let g:a = 1\nif g:a\n  echo g:b\nendif\n')
+        node_index = build_node_index(ast)
+
+        identifier_values = [node['value'] for node in node_index.get_nodes(NodeType.IDENTIFIER)]
+
+        self.assertEqual(identifier_values, ['g:a', 'g:a', 'g:b'])
+        self.assertEqual(node_index.get_nodes(NodeType.TOPLEVEL), [ast])
+        self.assertEqual(node_index.get_nodes(NodeType.WHILE), [])
+
+
+    def test_get_excommands(self):
+        ast = Parser().parse_string('scripte utf-8\nsyntax on\nscriptencoding utf-8\n')
+        node_index = build_node_index(ast)
+
+        excommand_strs = [node['str'] for node in node_index.get_excommands('scriptencoding')]
+
+        self.assertEqual(excommand_strs, ['scripte utf-8', 'scriptencoding utf-8'])
+        self.assertEqual(node_index.get_excommands('scripte'), [])
+
+
+    def test_find_comment_nodes(self):
+        ast = Parser().parse_string('\n'.join([
+            '" 1',
+            'function! F()',
+            '  " 2',
+            '  if 1',
+            '    " 3',
+            '  elseif 2',
+            '    " 4',
+            '  else',
+            '    " 5',
+            '  endif',
+            'endfunction',
+            'try',
+            '  " 6',
+            'catch',
+            '  " 7',
+            'finally',
+            '  " 8',
+            'endtry',
+            'for x in []',
+            '  " 9',
+            'endfor',
+            'let x =<< END',
+            '" not a comment',
+            'END',
+        ]))
+
+        comment_nodes = find_comment_nodes(ast)
+
+        self.assertEqual([node['str'] for node in comment_nodes], [' ' + str(i) for i in range(1, 10)])
+        self.assertEqual(comment_nodes, build_node_index(ast).get_nodes(NodeType.COMMENT))
+
+
+    def test_parser_attaches_node_index(self):
+        parser = Parser([ScopePlugin()], build_node_index=True)
+        previous_string = 'echo map([], "v:val")\n'
+        ast = parser.parse_string(previous_string)
+
+        # Nodes in string expressions that plugins attached are also indexed.
+        identifier_values = [node['value'] for node in get_node_index(ast).get_nodes(NodeType.IDENTIFIER)]
+        self.assertEqual(identifier_values, ['map', 'v:val'])
+
+        ast = parser.parse_string_incrementally(ast, previous_string, previous_string + 'echo g:a\n')
+
+        identifier_values = [node['value'] for node in get_node_index(ast).get_nodes(NodeType.IDENTIFIER)]
+        self.assertEqual(identifier_values, ['map', 'v:val', 'g:a'])
+
+
+    def test_plugins_fill_node_index_in_their_traversals(self):
+        string = '\n'.join([
+            'function! F(a) abort',
+            '  redir => s:out',
+            '  echo map([], "call(\'G\', [v:val])")',
+            'endfunction',
+            '" comment',
+        ])
+
+        for process in ['process_and_index', 'attach_sub_expressions']:
+            ast = Parser().parse_string(string)
+            node_index = NodeIndex()
+            getattr(ScopePlugin(), process)(ast, node_index)
+
+            # NOTE: Use a plain traversal over the processed AST as the expected index.
+            expected_node_index = build_node_index(ast)
+
+            for node_type in NodeType:
+                self.assertEqual([id(node) for node in node_index.get_nodes(node_type)],
+                                 [id(node) for node in expected_node_index.get_nodes(node_type)],
+                                 msg='{process}: {node_type}'.format(process=process, node_type=node_type))
+
+            self.assertEqual([node['value'] for node in node_index.get_nodes(NodeType.IDENTIFIER)],
+                             ['F', 'a', 's:out', 'map', 'call', 'G', 'v:val'])
+            self.assertEqual(node_index.get_excommands('redir'), expected_node_index.get_excommands('redir'))
+
+
+if __name__ == '__main__':
+    unittest.main()
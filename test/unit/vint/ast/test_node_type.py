@@ -1,5 +1,5 @@
 import unittest
-from vint.ast.node_type import NodeType
+from vint.ast.node_type import NodeType, get_node_type, create_node_type_table
 
 
 class TestNodeType(unittest.TestCase):
@@ -7,5 +7,17 @@ class TestNodeType(unittest.TestCase):
         self.assertIs(NodeType(1), NodeType.TOPLEVEL)
         self.assertIs(NodeType(89), NodeType.REG)
 
+
+    def test_get_node_type(self):
+        self.assertIs(get_node_type({'type': 1}), NodeType.TOPLEVEL)
+        self.assertIs(get_node_type({'type': NodeType.REG}), NodeType.REG)
+
+
+    def test_create_node_type_table(self):
+        table = create_node_type_table({NodeType.IDENTIFIER: 'id'}, default='none')
+
+        self.assertEqual(table[NodeType.IDENTIFIER.value], 'id')
+        self.assertEqual(table[NodeType.REG.value], 'none')
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,12 @@
 import unittest
+from vint._bundles import vimlparser
 from vint.ast.parsing import Parser
+from vint.ast.incremental_parsing import collect_positions
+from vint.ast.plugin.scope_plugin import ScopePlugin
+from vint.ast.plugin.scope_plugin.reference_reachability_tester import (
+    is_reachable_reference_identifier,
+    is_referenced_declarative_identifier,
+)
 from vint.ast.node_type import NodeType
 from vint.linting.lint_target import LintTargetFile
 from test.asserting.ast import get_fixture_path
@@ -102,5 +109,85 @@ class TestParser(unittest.TestCase):
         self.assertEqual(expected_pos, nodes[0]['pos'])
 
 
+    def test_parse_string_expr_by_cache(self):
+        parser = Parser()
+        string_expr_node = {
+            'type': NodeType.STRING.value,
+            'pos': {'col': 1, 'i': 1, 'lnum': 1},
+            'value': '\'v:val + 1\'',
+        }
+        same_string_expr_node = {
+            'type': NodeType.STRING.value,
+            'pos': {'col': 3, 'i': 12, 'lnum': 2},
+            'value': '\'v:val + 1\'',
+        }
+
+        nodes = parser.parse_string_expr(string_expr_node)
+        cached_nodes = parser.parse_string_expr(same_string_expr_node)
+
+        self.assertIsNot(cached_nodes[0], nodes[0])
+        self.assertIsNot(cached_nodes[0]['left']['pos'], nodes[0]['left']['pos'])
+        self.assertEqual({'col': 1, 'i': 1, 'lnum': 1, 'offset': 5}, nodes[0]['left']['pos'])
+        self.assertEqual({'col': 3, 'i': 12, 'lnum': 2, 'offset': 5}, cached_nodes[0]['left']['pos'])
+
+
+    def test_parse_string_incrementally(self):
+        previous_string = '\n'.join([
+            'let s:a = "»"',
+            'function! s:Func()',
+            '  return s:a',
+            'endfunction',
+            'redir => s:output',
+            'echo s:Func()',
+        ])
+        string = previous_string.replace('  return s:a', '  let l:b = 1\n  return s:a + l:b')
+
+        parser = Parser()
+        previous_ast = parser.parse_string(previous_string)
+        following_statements = previous_ast['body'][3:]
+
+        ast = parser.parse_string_incrementally(previous_ast, previous_string, string)
+        expected_ast = Parser().parse_string(string)
+
+        # Unchanged statements should be reused.
+        self.assertIs(ast, previous_ast)
+        self.assertIs(ast['body'][3], following_statements[0])
+        self.assertEqual([(pos['lnum'], pos['col'], pos['i'], pos.get('offset')) for pos in collect_positions([ast])],
+                         [(pos['lnum'], pos['col'], pos['i'], pos.get('offset')) for pos in collect_positions([expected_ast])])
+
+
+    def test_parse_string_incrementally_with_scope_plugin(self):
+        parser = Parser([ScopePlugin()])
+        previous_string = 'echo 1\nlet s:a = 1\n\necho s:b\n'
+        ast = parser.parse_string(previous_string)
+
+        ref_id_node = ast['body'][2]['list'][0]
+        self.assertFalse(is_reachable_reference_identifier(ref_id_node))
+
+        # References in unchanged statements should be tested again.
+        string = 'echo 1\nlet s:a = 1\nlet s:b = 2\necho s:b\n'
+        ast = parser.parse_string_incrementally(ast, previous_string, string)
+
+        self.assertIs(ast['body'][3]['list'][0], ref_id_node)
+        self.assertTrue(is_reachable_reference_identifier(ref_id_node))
+        self.assertFalse(is_referenced_declarative_identifier(ast['body'][1]['left']))
+
+        previous_string = string
+        string = 'echo 1\nlet s:a = 1\nlet s:b = 2\necho s:b + s:a\n'
+        ast = parser.parse_string_incrementally(ast, previous_string, string)
+
+        self.assertTrue(is_referenced_declarative_identifier(ast['body'][1]['left']))
+
+
+    def test_parse_does_not_change_the_bundled_parser(self):
+        ast = Parser().parse_string('echo 1')
+        self.assertNotIsInstance(ast, dict)
+
+        # Other users of the bundled parser should get dicts.
+        other_ast = vimlparser.VimLParser().parse(vimlparser.StringReader(['echo 1']))
+        self.assertIsInstance(other_ast, dict)
+        self.assertIsInstance(other_ast['body'][0]['ea'], dict)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from vint._bundles import vimlparser
+from vint.ast.string_reader import CompactStringReader
+
+
+LINES = [
+    'let s:a = "»"',
+    '  \\ . "あ"',
+    '\t\\ . "b"',
+    '',
+    'echo s:a | " »',
+    '\\',
+]
+
+
+class TestCompactStringReader(unittest.TestCase):
+    def test_getpos_is_same_as_string_reader(self):
+        expected_reader = vimlparser.StringReader(LINES)
+        reader = CompactStringReader(LINES)
+
+        self.assertEqual(len(reader.buf), len(expected_reader.buf))
+
+        for i in range(len(expected_reader.buf) + 1):
+            expected_reader.seek_set(i)
+            reader.seek_set(i)
+
+            self.assertEqual(reader.getpos(), expected_reader.getpos())
+
+
+    def test_get_is_same_as_string_reader(self):
+        expected_reader = vimlparser.StringReader(LINES)
+        reader = CompactStringReader(LINES)
+
+        expected_chars = [expected_reader.get() for _ in range(len(expected_reader.buf) + 1)]
+        chars = [reader.get() for _ in range(len(reader.buf) + 1)]
+
+        self.assertEqual(chars, expected_chars)
+
+
+    def test_getn_stops_at_eol(self):
+        reader = CompactStringReader(LINES)
+
+        self.assertEqual(reader.peekn(3), 'let')
+        self.assertEqual(reader.getn(-1), 'let s:a = "»" . "あ" . "b"')
+        self.assertEqual(reader.getn(1), '')
+        self.assertEqual(reader.get(), '<EOL>')
+
+
+    def test_getstr_converts_eol(self):
+        reader = CompactStringReader(LINES)
+        begin = reader.getpos()
+        reader.readline()
+        reader.readline()
+
+        self.assertEqual(reader.getstr(begin, reader.getpos()), 'let s:a = "»" . "あ" . "b"\n\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
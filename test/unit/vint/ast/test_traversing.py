@@ -1,9 +1,10 @@
+import sys
 import unittest
 from test.asserting.ast import get_fixture_path
 
 from vint.ast.parsing import Parser
 from vint.ast.node_type import NodeType
-from vint.ast.traversing import traverse, SKIP_CHILDREN
+from vint.ast.traversing import traverse, traverse_by_stages, SKIP_CHILDREN, UnknownNodeTypeException
 from vint.linting.lint_target import LintTargetFile
 
 FIXTURE_FILE = get_fixture_path('fixture_to_traverse.vim')
@@ -101,5 +102,68 @@ class TestTraverse(unittest.TestCase):
         self.assertEqual(actual_order_of_events, expected_order_of_events)
 
 
+    def test_traverse_by_stages(self):
+        actual_order_of_events = []
+
+        def create_stage(stage_name, skipped_node_type=None):
+            def on_enter(node):
+                node_type = NodeType(node['type'])
+                actual_order_of_events.append((stage_name, 'enter', node_type))
+
+                if node_type is skipped_node_type:
+                    return SKIP_CHILDREN
+
+            def on_leave(node):
+                actual_order_of_events.append((stage_name, 'leave', NodeType(node['type'])))
+
+            return on_enter, on_leave
+
+        # The first stage skips children of the WHILE node, but the second stage does not.
+        traverse_by_stages(self.ast['body'][1], [
+            create_stage('first', skipped_node_type=NodeType.WHILE),
+            create_stage('second'),
+        ])
+
+        expected_order_of_events = [
+            ('first', 'enter', NodeType.WHILE),
+            ('second', 'enter', NodeType.WHILE),
+            ('second', 'enter', NodeType.SMALLER),
+            ('second', 'enter', NodeType.IDENTIFIER),
+            ('second', 'leave', NodeType.IDENTIFIER),
+            ('second', 'enter', NodeType.NUMBER),
+            ('second', 'leave', NodeType.NUMBER),
+            ('second', 'leave', NodeType.SMALLER),
+        ]
+
+        self.assertEqual(actual_order_of_events[:len(expected_order_of_events)], expected_order_of_events)
+        self.assertEqual(actual_order_of_events[-2:], [
+            ('first', 'leave', NodeType.WHILE),
+            ('second', 'leave', NodeType.WHILE),
+        ])
+
+
+    def test_traverse_deeply_nested_expression(self):
+        string_count = sys.getrecursionlimit() * 2
+        ast = Parser().parse_string('echo ' + ' . '.join(["'a'"] * string_count))
+
+        node_types = []
+        traverse(ast, on_enter=lambda node: node_types.append(NodeType(node['type'])))
+
+        self.assertEqual(node_types.count(NodeType.STRING), string_count)
+
+
+    def test_traverse_hand_made_nodes(self):
+        node_types = []
+        traverse({'type': NodeType.TOPLEVEL, 'body': []}, on_enter=lambda node: node_types.append(node['type']))
+
+        self.assertEqual(node_types, [NodeType.TOPLEVEL])
+
+
+    def test_traverse_unknown_node_types(self):
+        for node_type in [9999, 0, -1, 'TOPLEVEL']:
+            with self.assertRaises(UnknownNodeTypeException):
+                traverse({'type': node_type, 'body': []})
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -96,5 +96,59 @@ class TestConfigCmdargsSource(ConfigSourceAssertion, unittest.TestCase):
         self.assertConfigDict(config_source, expected_config_dict)
 
 
+    def test_get_config_dict_with_max_violations_from_argparse(self):
+        env = {
+            'cmdargs': {
+                'max_violations': 10,
+            },
+        }
+
+        expected_config_dict = {
+            'cmdargs': {
+                'max-violations': 10,
+            },
+            'source_name': 'ConfigCmdargsSource',
+        }
+
+        config_source = self.initialize_config_source_with_env(ConfigCmdargsSource, env)
+        self.assertConfigDict(config_source, expected_config_dict)
+
+
+    def test_get_config_dict_with_jobs(self):
+        env = {
+            'cmdargs': {
+                'jobs': 'auto',
+            },
+        }
+
+        expected_config_dict = {
+            'cmdargs': {
+                'jobs': 'auto',
+            },
+            'source_name': 'ConfigCmdargsSource',
+        }
+
+        config_source = self.initialize_config_source_with_env(ConfigCmdargsSource, env)
+        self.assertConfigDict(config_source, expected_config_dict)
+
+
+    def test_get_config_dict_with_exclude(self):
+        env = {
+            'cmdargs': {
+                'exclude': ['node_modules', 'vendor/*'],
+            },
+        }
+
+        expected_config_dict = {
+            'cmdargs': {
+                'exclude': ['node_modules', 'vendor/*'],
+            },
+            'source_name': 'ConfigCmdargsSource',
+        }
+
+        config_source = self.initialize_config_source_with_env(ConfigCmdargsSource, env)
+        self.assertConfigDict(config_source, expected_config_dict)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,8 @@
 import unittest
+from vint.ast.node_type import NodeType
 from vint.linting.config.config_comment_parser import (
     parse_config_comment,
+    find_config_comments,
     ConfigComment,
 )
 
@@ -83,5 +85,18 @@ class TestConfigCommentParser(ConfigCommentAssertion, unittest.TestCase):
         self.assertIsNone(config_comment)
 
 
+    def test_find_config_comments(self):
+        comment_nodes = [
+            {'type': NodeType.COMMENT.value, 'str': ' vint: -Policy1'},
+            {'type': NodeType.COMMENT.value, 'str': ' not config comment'},
+            {'type': NodeType.COMMENT.value, 'str': ' vint: next-line +Policy1'},
+        ]
+
+        config_comments = find_config_comments(comment_nodes)
+
+        self.assertEqual([node for node, _ in config_comments], [comment_nodes[0], comment_nodes[2]])
+        self.assertEqual([config_comment.is_only_next_line for _, config_comment in config_comments], [False, True])
+
+
 if __name__ == '__main__':
     unittest.main()
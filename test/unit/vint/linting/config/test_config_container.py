@@ -10,12 +10,17 @@ class TestConfigContainer(ConfigSourceAssertion, unittest.TestCase):
     class StubConfigSource(ConfigSource):
         def __init__(self, config_dict):
             self.return_value = config_dict
+            self.version = 0
 
 
         def get_config_dict(self):
             return self.return_value
 
 
+        def get_version(self):
+            return self.version
+
+
     def test_get_config_dict(self):
         config_dicts = (
             {  # Default source
@@ -75,5 +80,21 @@ class TestConfigContainer(ConfigSourceAssertion, unittest.TestCase):
         self.assertConfigDict(config_container, expected_config_dict)
 
 
+    def test_get_config_dict_by_cache(self):
+        config_source = TestConfigContainer.StubConfigSource({'policies': {'ProhibitSomethingEvil': {'enabled': True}}})
+        config_container = ConfigContainer(config_source)
+
+        config_dict = config_container.get_config_dict()
+        self.assertIs(config_container.get_config_dict(), config_dict)
+
+        with self.assertRaises(TypeError):
+            config_dict['policies']['ProhibitSomethingEvil'] = {'enabled': False}
+
+        config_source.return_value = {'policies': {'ProhibitSomethingEvil': {'enabled': False}}}
+        config_source.version += 1
+
+        self.assertEqual(config_container.get_config_dict()['policies'], {'ProhibitSomethingEvil': {'enabled': False}})
+
+
 if __name__ == '__main__':
     unittest.main()
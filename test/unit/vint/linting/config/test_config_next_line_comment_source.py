@@ -3,6 +3,7 @@ import enum
 from vint.linting.linter import Linter
 from vint.linting.lint_target import LintTargetFile
 from vint.linting.policy_set import PolicySet
+from vint.linting.config.config_next_line_comment_source import ConfigNextLineCommentSource
 from vint.ast.node_type import NodeType
 from vint.linting.level import Level
 from vint.linting.policy.abstract_policy import AbstractPolicy
@@ -50,6 +51,22 @@ class TestConfigNextLineCommentSource(ConfigSourceAssertion, unittest.TestCase):
         ])
 
 
+    def test_update_by_node_returns_whether_config_changed(self):
+        def create_node(lnum, comment=None):
+            if comment is None:
+                return {'type': NodeType.ECHO.value, 'pos': {'lnum': lnum}}
+
+            return {'type': NodeType.COMMENT.value, 'str': comment, 'pos': {'lnum': lnum}}
+
+        config_source = ConfigNextLineCommentSource()
+
+        self.assertFalse(config_source.update_by_node(create_node(1, ' vint: next-line -Policy1')))
+        self.assertTrue(config_source.update_by_node(create_node(2)))
+        self.assertFalse(config_source.update_by_node(create_node(2)))
+        self.assertTrue(config_source.update_by_node(create_node(3)))
+        self.assertFalse(config_source.update_by_node(create_node(4)))
+
+
     class ProhibitStringPolicy(AbstractPolicy):
         def __init__(self):
             super(TestConfigNextLineCommentSource.ProhibitStringPolicy, self).__init__()
@@ -102,5 +102,27 @@ class TestToggleConfigCommentSource(ConfigSourceAssertion, unittest.TestCase):
         self.assertConfigDict(config_source, expected_config_dict)
 
 
+    def test_update_by_node_returns_whether_config_changed(self):
+        config_comment_node = {
+            'type': NodeType.COMMENT,
+            'str': ' vint: -Policy1',
+            'pos': {
+                'lnum': 10,
+            },
+        }
+        normal_comment_node = {
+            'type': NodeType.COMMENT,
+            'str': ' not a config comment',
+            'pos': {
+                'lnum': 11,
+            },
+        }
+
+        config_source = ConfigToggleCommentSource()
+
+        self.assertTrue(config_source.update_by_node(config_comment_node))
+        self.assertFalse(config_source.update_by_node(normal_comment_node))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -84,5 +84,59 @@ path/to/file2:11:21: this code is tooooo dangerous (see you)\
         self.assertFormattedViolations(formatter, violations, expected_output)
 
 
+    def test_format_violations_of_file_by_streaming(self):
+        config_dict = {}
+        formatter = Formatter(config_dict)
+
+        violations_by_file = [
+            [
+                {
+                    'name': 'ProhibitSomethingDangerous',
+                    'level': Level.WARNING,
+                    'description': 'this code is tooooo dangerous',
+                    'reference': 'you',
+                    'position': {
+                        'line': 11,
+                        'column': 21,
+                        'path': Path('path', 'to', 'file1')
+                    },
+                },
+                {
+                    'name': 'ProhibitSomethingEvil',
+                    'level': Level.WARNING,
+                    'description': 'this code is tooooo evil',
+                    'reference': 'me',
+                    'position': {
+                        'line': 1,
+                        'column': 2,
+                        'path': Path('path', 'to', 'file1')
+                    },
+                },
+            ],
+            [],
+            [
+                {
+                    'name': 'ProhibitSomethingEvil',
+                    'level': Level.WARNING,
+                    'description': 'this code is tooooo evil',
+                    'reference': 'me',
+                    'position': {
+                        'line': 3,
+                        'column': 4,
+                        'path': Path('path', 'to', 'file2')
+                    },
+                },
+            ],
+        ]
+
+        expected_output = """\
+path/to/file1:1:2: this code is tooooo evil (see me)
+path/to/file1:11:21: this code is tooooo dangerous (see you)
+path/to/file2:3:4: this code is tooooo evil (see me)
+"""
+
+        self.assertStreamedViolations(formatter, violations_by_file, expected_output)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -64,5 +64,72 @@ class TestJSONFormatter(FormatterAssertion, unittest.TestCase):
         self.assertEqual(parsed_output, expected_output)
 
 
+    def test_format_violations_of_file_by_streaming(self):
+        formatter = JSONFormatter()
+
+        violations_by_file = [
+            [
+                {
+                    'name': 'ProhibitSomethingEvil',
+                    'level': Level.WARNING,
+                    'description': 'this code is tooooo evil',
+                    'reference': 'me',
+                    'position': {
+                        'line': 1,
+                        'column': 2,
+                        'path': str(Path('path', 'to', 'file1'))
+                    },
+                },
+            ],
+            [],
+            [
+                {
+                    'name': 'ProhibitSomethingDangerous',
+                    'level': Level.WARNING,
+                    'description': 'this code is tooooo dangerous',
+                    'reference': 'you',
+                    'position': {
+                        'line': 11,
+                        'column': 21,
+                        'path': str(Path('path', 'to', 'file2'))
+                    },
+                },
+            ],
+        ]
+
+        all_violations = violations_by_file[0] + violations_by_file[2]
+        expected_output = formatter.format_violations(all_violations) + '\n'
+
+        self.assertStreamedViolations(formatter, violations_by_file, expected_output)
+
+
+    def test_format_no_violations_by_streaming(self):
+        formatter = JSONFormatter()
+        self.assertStreamedViolations(formatter, [[], []], '[]\n')
+
+
+    def test_abort_streaming(self):
+        formatter = JSONFormatter()
+        violation = {
+            'name': 'ProhibitSomethingEvil',
+            'level': Level.WARNING,
+            'description': 'this code is tooooo evil',
+            'reference': 'me',
+            'position': {
+                'line': 1,
+                'column': 2,
+                'path': str(Path('path', 'to', 'file1'))
+            },
+        }
+
+        # Nothing should be written if the streaming is aborted before any violations.
+        output = formatter.start_streaming() + formatter.format_violations_of_file([])
+        self.assertEqual(output + formatter.abort_streaming(), '')
+
+        output += formatter.format_violations_of_file([violation])
+        output += formatter.abort_streaming()
+        self.assertEqual(output, formatter.format_violations([violation]) + '\n')
+
+
 if __name__ == '__main__':
     unittest.main()
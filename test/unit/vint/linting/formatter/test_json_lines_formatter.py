@@ -0,0 +1,80 @@
+import unittest
+import json
+from pathlib import Path
+from vint.linting.formatter.json_lines_formatter import JSONLinesFormatter
+from vint.linting.level import Level
+
+
+def create_violation(path, line):
+    return {
+        'name': 'ProhibitSomethingEvil',
+        'level': Level.WARNING,
+        'description': 'this code is tooooo evil',
+        'reference': 'me',
+        'position': {
+            'line': line,
+            'column': 2,
+            'path': str(path),
+        },
+    }
+
+
+def create_normalized_violation(path, line):
+    return {
+        'policy_name': 'ProhibitSomethingEvil',
+        'severity': 'warning',
+        'description': 'this code is tooooo evil',
+        'reference': 'me',
+        'line_number': line,
+        'column_number': 2,
+        'file_path': str(path),
+    }
+
+
+class TestJSONLinesFormatter(unittest.TestCase):
+    def test_format_violations(self):
+        formatter = JSONLinesFormatter()
+
+        violations = [
+            create_violation(Path('path', 'to', 'file1'), 1),
+            create_violation(Path('path', 'to', 'file2'), 11),
+        ]
+
+        expected_objects = [
+            create_normalized_violation(Path('path', 'to', 'file1'), 1),
+            create_normalized_violation(Path('path', 'to', 'file2'), 11),
+        ]
+
+        output = formatter.format_violations(violations)
+        parsed_objects = [json.loads(line) for line in output.split('\n')]
+
+        self.assertEqual(parsed_objects, expected_objects)
+
+
+    def test_format_violations_of_file_by_streaming(self):
+        formatter = JSONLinesFormatter()
+
+        violations_by_file = [
+            [create_violation(Path('path', 'to', 'file1'), 1)],
+            [],
+            [create_violation(Path('path', 'to', 'file2'), 11)],
+        ]
+
+        expected_objects = [
+            create_normalized_violation(Path('path', 'to', 'file1'), 1),
+            create_normalized_violation(Path('path', 'to', 'file2'), 11),
+        ]
+
+        output = formatter.start_streaming()
+        for violations in violations_by_file:
+            output += formatter.format_violations_of_file(violations)
+        output += formatter.end_streaming()
+
+        self.assertTrue(output.endswith('\n'))
+
+        parsed_objects = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(parsed_objects, expected_objects)
+
+
+if __name__ == '__main__':
+    unittest.main()
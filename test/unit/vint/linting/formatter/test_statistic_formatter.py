@@ -0,0 +1,58 @@
+import unittest
+from pathlib import Path
+from test.asserting.formatter import FormatterAssertion
+from vint.linting.formatter.statistic_formatter import StatisticFormatter
+from vint.linting.level import Level
+
+
+def create_violation(path, line):
+    return {
+        'name': 'ProhibitSomethingEvil',
+        'level': Level.WARNING,
+        'description': 'this code is tooooo evil',
+        'reference': 'me',
+        'position': {
+            'line': line,
+            'column': 2,
+            'path': path,
+        },
+    }
+
+
+class TestStatisticFormatter(FormatterAssertion, unittest.TestCase):
+    def test_format_violations(self):
+        formatter = StatisticFormatter({})
+
+        violations = [
+            create_violation(Path('path', 'to', 'file1'), 1),
+            create_violation(Path('path', 'to', 'file2'), 3),
+        ]
+
+        expected_output = """\
+path/to/file1:1:2: this code is tooooo evil (see me)
+path/to/file2:3:2: this code is tooooo evil (see me)
+Total violations: 2\
+"""
+
+        self.assertFormattedViolations(formatter, violations, expected_output)
+
+
+    def test_format_violations_of_file_by_streaming(self):
+        formatter = StatisticFormatter({})
+
+        violations_by_file = [
+            [create_violation(Path('path', 'to', 'file1'), 1)],
+            [create_violation(Path('path', 'to', 'file2'), 3)],
+        ]
+
+        expected_output = """\
+path/to/file1:1:2: this code is tooooo evil (see me)
+path/to/file2:3:2: this code is tooooo evil (see me)
+Total violations: 2
+"""
+
+        self.assertStreamedViolations(formatter, violations_by_file, expected_output)
+
+
+if __name__ == '__main__':
+    unittest.main()
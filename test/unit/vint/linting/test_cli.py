@@ -1,8 +1,16 @@
 import unittest
+import os
+import json
+import shutil
+import itertools
+import tempfile
 from vint.compat.unittest import mock
 
-from vint.linting.cli import start_cli
+from io import StringIO
+from pathlib import Path
+from vint.linting.cli import start_cli, _lint_all, _lint_each_file_in_parallel, _LintSummary
 from vint.bootstrap import import_all_policies
+from vint.linting.level import Level
 
 
 class TestCLI(unittest.TestCase):
@@ -66,5 +74,276 @@ class TestCLI(unittest.TestCase):
         self.assertExitWithFailure(argv)
 
 
+    def test_start_with_jobs(self):
+        argv = ['bin/vint', '--jobs', '2', 'test/fixture/cli/valid1.vim', 'test/fixture/cli/invalid1.vim']
+        self.assertExitWithFailure(argv)
+
+
+    def test_start_with_invalid_jobs(self):
+        argv = ['bin/vint', '--jobs', '0', 'test/fixture/cli/valid1.vim']
+        self.assertExitWithFailure(argv)
+
+
+    def test_start_with_invalid_max_violations(self):
+        self.assertExitWithFailure(['bin/vint', '--max-violations', '0', 'test/fixture/cli/invalid1.vim'])
+        self.assertExitWithFailure(['bin/vint', '--max-violations', 'a', 'test/fixture/cli/valid1.vim'])
+
+
+    def create_files_from(self, content):
+        fd, files_from = tempfile.mkstemp()
+        self.addCleanup(os.remove, files_from)
+
+        with os.fdopen(fd, 'wb') as file_obj:
+            file_obj.write(content)
+
+        return files_from
+
+
+    def test_start_with_files_from(self):
+        files_from = self.create_files_from(b'test/fixture/cli/valid1.vim\n\n')
+        self.assertExitWithSuccess(['bin/vint', '--files-from', files_from])
+
+        files_from = self.create_files_from(b'test/fixture/cli/valid1.vim\r\ntest/fixture/cli/invalid1.vim\n')
+        self.assertExitWithFailure(['bin/vint', '--files-from', files_from])
+
+
+    def test_start_with_null_separated_files_from(self):
+        files_from = self.create_files_from(b'test/fixture/cli/valid1.vim\0')
+        self.assertExitWithSuccess(['bin/vint', '-0', '--files-from', files_from])
+        self.assertExitWithFailure(['bin/vint', '-0', 'test/fixture/cli/valid1.vim'])
+
+
+    def test_start_with_unexistent_path_in_files_from(self):
+        files_from = self.create_files_from(b'test/fixture/cli/valid1.vim\npath/to/unexistent\n')
+        self.assertExitWithFailure(['bin/vint', '--files-from', files_from])
+        self.assertExitWithFailure(['bin/vint', '--files-from', 'path/to/unexistent'])
+
+
+    def test_start_with_unexistent_path_in_files_from_keeps_violations(self):
+        files_from = self.create_files_from(b'test/fixture/cli/invalid1.vim\0path/to/unexistent\0')
+
+        with mock.patch('sys.stdout', new_callable=StringIO) as stdout:
+            self.assertExitWithFailure(['bin/vint', '--json', '-0', '--files-from', files_from])
+
+        self.assertEqual([violation['file_path'] for violation in json.loads(stdout.getvalue())],
+                         [str(Path('test', 'fixture', 'cli', 'invalid1.vim'))])
+
+        # The unexistent path should fail even if no violations are found.
+        files_from = self.create_files_from(b'test/fixture/cli/valid1.vim\0path/to/unexistent\0')
+        self.assertExitWithFailure(['bin/vint', '-0', '--files-from', files_from])
+
+
+    def test_start_with_streaming_json_exits_on_the_way(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+
+        with mock.patch('sys.stdout', new_callable=StringIO) as stdout:
+            self.assertExitWithFailure(['bin/vint', '--stream', '--json', tmp_dir])
+
+        self.assertEqual(stdout.getvalue(), '')
+
+        files_from = self.create_files_from(b'test/fixture/cli/invalid1.vim\npath/to/unexistent\n')
+
+        with mock.patch('sys.stdout', new_callable=StringIO) as stdout:
+            self.assertExitWithFailure(['bin/vint', '--stream', '--json', '--files-from', files_from])
+
+        self.assertEqual([violation['file_path'] for violation in json.loads(stdout.getvalue())],
+                         [str(Path('test', 'fixture', 'cli', 'invalid1.vim'))])
+
+
+    def test_lint_all_in_parallel_keeps_the_order_of_paths(self):
+        paths = [
+            Path('test', 'fixture', 'cli', 'invalid1.vim'),
+            Path('test', 'fixture', 'linter', 'broken.vim'),
+            Path('test', 'fixture', 'cli', 'valid1.vim'),
+            Path('test', 'fixture', 'cli', 'invalid1.vim'),
+        ]
+        config_dict = {
+            'cmdargs': {
+                'severity': Level.STYLE_PROBLEM,
+            },
+            'policies': {},
+        }
+
+        serial_violations = _lint_all({'file_paths': paths}, config_dict)
+
+        config_dict['cmdargs']['jobs'] = 2
+        parallel_violations = _lint_all({'file_paths': paths}, config_dict)
+
+        self.assertEqual(len(serial_violations), 3)
+        self.assertEqual(parallel_violations, serial_violations)
+
+
+    def test_lint_each_file_in_parallel_before_reading_all_paths(self):
+        config_dict = {
+            'cmdargs': {
+                'severity': Level.STYLE_PROBLEM,
+            },
+            'policies': {},
+        }
+
+        # The paths never end, so the first file should be linted while reading paths.
+        paths = itertools.repeat(Path('test', 'fixture', 'cli', 'invalid1.vim'))
+        violations_by_file = _lint_each_file_in_parallel(paths, config_dict, 2, None)
+
+        try:
+            violations_of_file = next(violations_by_file)
+        finally:
+            violations_by_file.close()
+
+        self.assertEqual([violation['name'] for violation in violations_of_file], ['ProhibitEqualTildeOperator'])
+
+
+    def test_lint_all_does_not_depend_on_other_files(self):
+        tmp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp_dir)
+
+        # ProhibitEncodingOptionAfterScriptEncoding keeps a state while linting a file.
+        scriptencoding_path = Path(tmp_dir, 'scriptencoding.vim')
+        encoding_path = Path(tmp_dir, 'encoding.vim')
+
+        with scriptencoding_path.open('w') as f:
+            f.write(u'scriptencoding utf-8\n')
+
+        with encoding_path.open('w') as f:
+            f.write(u'set encoding=utf-8\nscriptencoding utf-8\nset encoding=utf-8\n')
+
+        paths = [scriptencoding_path, encoding_path, scriptencoding_path, encoding_path, encoding_path]
+        config_dict = {
+            'cmdargs': {
+                'severity': Level.STYLE_PROBLEM,
+            },
+            'policies': {},
+        }
+
+        serial_violations = _lint_all({'file_paths': paths}, config_dict)
+
+        config_dict['cmdargs']['jobs'] = 2
+        parallel_violations = _lint_all({'file_paths': paths}, config_dict)
+
+        self.assertEqual([(str(violation['position']['path']), violation['position']['line'])
+                          for violation in serial_violations],
+                         [(str(encoding_path), 3)] * 3)
+        self.assertEqual(parallel_violations, serial_violations)
+
+
+    def test_lint_all_stops_by_max_violations(self):
+        paths = [
+            Path('test', 'fixture', 'cli', 'invalid1.vim'),
+            Path('test', 'fixture', 'cli', 'invalid1.vim'),
+            Path('test', 'fixture', 'cli', 'invalid1.vim'),
+        ]
+        config_dict = {
+            'cmdargs': {
+                'severity': Level.STYLE_PROBLEM,
+                'max-violations': 2,
+            },
+            'policies': {},
+        }
+
+        self.assertEqual(len(_lint_all({'file_paths': paths}, config_dict)), 2)
+
+        config_dict['cmdargs']['jobs'] = 2
+        self.assertEqual(len(_lint_all({'file_paths': paths}, config_dict)), 2)
+
+
+    def test_lint_all_tells_whether_violations_are_skipped_by_max_violations(self):
+        fd, file_path = tempfile.mkstemp(suffix='.vim')
+        self.addCleanup(os.remove, file_path)
+
+        with os.fdopen(fd, 'w') as file_obj:
+            file_obj.write("echo 'a' =~ 'a'\necho 'b' =~ 'b'\n")
+
+        two_violations_path = Path(file_path)
+        one_violation_path = Path('test', 'fixture', 'cli', 'invalid1.vim')
+        valid_path = Path('test', 'fixture', 'cli', 'valid1.vim')
+
+        for jobs in [1, 2]:
+            config_dict = {
+                'cmdargs': {
+                    'severity': Level.STYLE_PROBLEM,
+                    'max-violations': 2,
+                    'jobs': jobs,
+                },
+                'policies': {},
+            }
+
+            for paths, expected_is_truncated in [
+                ([two_violations_path], False),
+                ([one_violation_path, valid_path], False),
+                ([one_violation_path, one_violation_path], False),
+                ([one_violation_path, two_violations_path], True),
+                ([two_violations_path, valid_path], True),
+            ]:
+                summary = _LintSummary()
+                violations = _lint_all({'file_paths': paths}, config_dict, summary=summary)
+
+                self.assertLessEqual(len(violations), 2)
+                self.assertEqual(summary.is_truncated, expected_is_truncated, msg='{jobs}: {paths}'.format(
+                    jobs=jobs,
+                    paths=paths))
+
+
+    def test_start_warns_only_if_violations_are_skipped(self):
+        argv = ['bin/vint', '--max-violations', '1', 'test/fixture/cli/invalid1.vim']
+
+        with mock.patch('logging.warning') as warning:
+            self.assertExitWithFailure(argv)
+
+        warning.assert_not_called()
+
+        with mock.patch('logging.warning') as warning:
+            self.assertExitWithFailure(argv + ['test/fixture/cli/invalid1.vim'])
+
+        warning.assert_called_once_with('stopped checking because of reaching max violations: 1')
+
+
+    def test_lint_all_with_max_violations_on_changed_lines(self):
+        fd, file_path = tempfile.mkstemp(suffix='.vim')
+        self.addCleanup(os.remove, file_path)
+
+        with os.fdopen(fd, 'w') as file_obj:
+            file_obj.write("echo 'a' =~ 'a'\necho 'b' =~ 'b'\n")
+
+        path = Path(file_path)
+        config_dict = {
+            'cmdargs': {
+                'severity': Level.STYLE_PROBLEM,
+                'max-violations': 1,
+                'changed_since': 'HEAD',
+                'changed_lines_only': True,
+            },
+            'policies': {},
+        }
+
+        # Only the second line is changed, so the violation on the first line should not use up the limit.
+        with mock.patch('vint.linting.cli._find_changed_files_to_lint', return_value=[path]), \
+                mock.patch('vint.linting.cli._get_changed_line_numbers', return_value={str(path): {2}}):
+            violations = _lint_all({'file_paths': []}, config_dict)
+
+        self.assertEqual([violation['position']['line'] for violation in violations], [2])
+
+
+    def test_lint_all_by_client_without_server_lints_in_process(self):
+        paths = [
+            Path('test', 'fixture', 'cli', 'invalid1.vim'),
+            Path('test', 'fixture', 'cli', 'valid1.vim'),
+        ]
+        config_dict = {
+            'cmdargs': {
+                'severity': Level.STYLE_PROBLEM,
+            },
+            'policies': {},
+        }
+
+        serial_violations = _lint_all({'file_paths': paths}, config_dict)
+
+        config_dict['cmdargs']['client'] = True
+        config_dict['cmdargs']['socket'] = str(Path('path', 'to', 'unexistent.sock'))
+        client_violations = _lint_all({'file_paths': paths, 'cwd': Path.cwd(), 'cmdargs': {}}, config_dict)
+
+        self.assertEqual(client_violations, serial_violations)
+
+
 if __name__ == '__main__':
     unittest.main()
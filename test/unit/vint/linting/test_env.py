@@ -12,6 +12,7 @@ class TestEnv(unittest.TestCase):
         cwd = Path('path', 'to', 'cwd')
         home = Path('/', 'home', 'user')
         xdg_config_home = Path('/', 'home', 'user', '.config')
+        xdg_cache_home = Path('/', 'home', 'user', '.cache')
 
         cmdargs = {
             'verbose': True,
@@ -27,14 +28,13 @@ class TestEnv(unittest.TestCase):
                 'warning': True,
                 'max_violations': 10,
             },
+            # NOTE: Files in the directories are found while linting.
             'file_paths': [
-                Path(FIXTURE_PATH, '1.vim'),
-                Path(FIXTURE_PATH, '2.vim'),
-                Path(FIXTURE_PATH, 'sub', '3.vim'),
-                Path(FIXTURE_PATH, 'sub', '4.vim'),
+                FIXTURE_PATH,
             ],
             'home_path': home,
             'xdg_config_home': xdg_config_home,
+            'xdg_cache_home': xdg_cache_home,
             'cwd': cwd,
         }
 
@@ -45,7 +45,8 @@ class TestEnv(unittest.TestCase):
             with mock.patch('os.path.expanduser') as mocked_expanduser:
                 mocked_expanduser.return_value = str(home)
 
-                with mock.patch.dict('os.environ', {'XDG_CONFIG_HOME': '/home/user/.config'}):
+                with mock.patch.dict('os.environ', {'XDG_CONFIG_HOME': '/home/user/.config',
+                                                    'XDG_CACHE_HOME': '/home/user/.cache'}):
                     env = build_environment(cmdargs)
 
         self.maxDiff = 1000
@@ -1,7 +1,7 @@
 import unittest
 import os.path
 from pathlib import Path
-from vint.linting.file_filter import find_vim_script
+from vint.linting.file_filter import find_vim_script, filter_vim_script
 
 
 FIXTURE_PATH_BASE = Path('test', 'fixture', 'file_filter')
@@ -85,5 +85,46 @@ class TestFileFilter(unittest.TestCase):
         self.assertEqual(set(expected_file_paths), set(got_file_paths))
 
 
+    def test_find_vim_script_by_given_nested_dir_in_order(self):
+        file_paths_to_find = [
+            FIXTURE_PATH_BASE,
+        ]
+
+        got_file_paths = list(find_vim_script(file_paths_to_find))
+
+        self.assertEqual(sorted(got_file_paths), got_file_paths)
+
+
+    def test_find_vim_script_with_exclude_patterns(self):
+        file_paths_to_find = [
+            FIXTURE_PATH_BASE,
+            # Given paths should not be excluded.
+            get_fixture_path('sub/3.vim'),
+        ]
+
+        got_file_paths = map(str, find_vim_script(file_paths_to_find, ['_*', '*/file_filter/2.vim', 'sub/']))
+
+        expected_file_paths = map(str, map(get_fixture_path, [
+            '.gvimrc',
+            '.vimrc',
+            '1.vim',
+            os.path.join('sub', '3.vim'),
+        ]))
+        self.assertEqual(set(expected_file_paths), set(got_file_paths))
+
+
+    def test_filter_vim_script(self):
+        file_paths_to_filter = [
+            Path('plugin', 'a.vim'),
+            Path('vendor', 'plugin', 'b.vim'),
+            Path('README.md'),
+            Path('.vimrc'),
+        ]
+
+        got_file_paths = list(filter_vim_script(file_paths_to_filter, ['vendor']))
+
+        self.assertEqual(got_file_paths, [Path('plugin', 'a.vim'), Path('.vimrc')])
+
+
 if __name__ == '__main__':
     unittest.main()
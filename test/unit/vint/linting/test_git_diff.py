@@ -0,0 +1,73 @@
+import unittest
+import os
+import shutil
+import tempfile
+import subprocess
+from pathlib import Path
+from vint.linting.git_diff import get_changed_file_paths, get_changed_line_numbers, GitError
+
+
+def _is_git_available():
+    try:
+        subprocess.check_output(['git', '--version'])
+        return True
+    except (OSError, subprocess.CalledProcessError):
+        return False
+
+
+@unittest.skipUnless(_is_git_available(), 'git is not available')
+class TestGitDiff(unittest.TestCase):
+    def setUp(self):
+        self.repo_path = Path(tempfile.mkdtemp())
+
+        self.git('init', '-q')
+        self.write_file('modified.vim', 'echo 1\necho 2\necho 3\n')
+        self.write_file('deleted.vim', 'echo 1\n')
+        self.write_file('unchanged.vim', 'echo 1\n')
+        self.git('add', '.')
+        self.git('commit', '-q', '-m', 'Initial commit')
+
+        self.write_file('modified.vim', 'echo 1\necho 20\necho 3\necho 4\n')
+        os.remove(str(self.repo_path / 'deleted.vim'))
+        self.write_file('untracked.vim', 'echo 1\n')
+
+
+    def tearDown(self):
+        shutil.rmtree(str(self.repo_path))
+
+
+    def git(self, *args):
+        subprocess.check_output(['git', '-c', 'user.name=vint', '-c', 'user.email=vint@example.com'] + list(args),
+                                cwd=str(self.repo_path))
+
+
+    def write_file(self, file_path, content):
+        with (self.repo_path / file_path).open('w') as file_obj:
+            file_obj.write(content)
+
+
+    def test_get_changed_file_paths(self):
+        changed_file_paths = get_changed_file_paths('HEAD', self.repo_path)
+
+        self.assertEqual(sorted(changed_file_paths), [Path('modified.vim'), Path('untracked.vim')])
+
+
+    def test_get_changed_line_numbers(self):
+        changed_line_numbers = get_changed_line_numbers('HEAD', self.repo_path)
+
+        self.assertEqual(changed_line_numbers, {
+            'modified.vim': {2, 4},
+            'untracked.vim': None,
+        })
+
+
+    def test_get_changed_file_paths_by_invalid_revision(self):
+        with self.assertRaises(GitError):
+            get_changed_file_paths('unexistent-revision', self.repo_path)
+
+        with self.assertRaises(GitError):
+            get_changed_file_paths('--output=unexpected-file', self.repo_path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from vint.linting.gitignore import GitIgnore
+from vint.linting.file_filter import find_vim_script
+
+
+class TestGitIgnore(unittest.TestCase):
+    def test_match(self):
+        gitignore = GitIgnore([
+            '# comment',
+            '',
+            '*.generated.vim',
+            'build/',
+            '/vendor/*',
+            '!/vendor/keep.vim',
+            'doc/**/tags',
+            '\\#*',
+        ])
+
+        test_cases = [
+            ('a.generated.vim', False, True),
+            ('plugin/a.generated.vim', False, True),
+            ('plugin/a.vim', False, None),
+            ('build', True, True),
+            ('plugin/build', True, True),
+            ('build', False, None),
+            ('vendor/a.vim', False, True),
+            ('vendor/keep.vim', False, False),
+            ('plugin/vendor/a.vim', False, None),
+            ('doc/tags', False, True),
+            ('doc/ja/tags', False, True),
+            ('#a.vim', False, True),
+            ('comment', False, None),
+        ]
+
+        for path, is_dir, expected_result in test_cases:
+            self.assertEqual(gitignore.match(path, is_dir), expected_result, path)
+
+
+
+class TestFindVimScriptRespectingGitIgnore(unittest.TestCase):
+    def setUp(self):
+        self.root_dir = tempfile.mkdtemp()
+
+
+    def tearDown(self):
+        shutil.rmtree(self.root_dir)
+
+
+    def create_file(self, file_path, content='" vim\n'):
+        path = os.path.join(self.root_dir, file_path)
+
+        if not os.path.isdir(os.path.dirname(path)):
+            os.makedirs(os.path.dirname(path))
+
+        with open(path, 'w') as file_obj:
+            file_obj.write(content)
+
+
+    def test_find_vim_script(self):
+        self.create_file('.gitignore', 'build/\n*.local.vim\n')
+        self.create_file('plugin/a.vim')
+        self.create_file('plugin/a.local.vim')
+        self.create_file('build/b.vim')
+        self.create_file('sub/.gitignore', '*.vim\n!keep.vim\n')
+        self.create_file('sub/c.vim')
+        self.create_file('sub/keep.vim')
+        self.create_file('.git/hooks/d.vim')
+
+        root_path = Path(self.root_dir)
+        got_file_paths = list(find_vim_script([root_path], respect_gitignore=True))
+
+        expected_file_paths = [
+            Path(root_path, 'plugin', 'a.vim'),
+            Path(root_path, 'sub', 'keep.vim'),
+        ]
+        self.assertEqual(got_file_paths, expected_file_paths)
+
+
+    def test_find_vim_script_in_sub_directory(self):
+        self.create_file('.git/HEAD', 'ref: refs/heads/master\n')
+        self.create_file('.gitignore', 'plugin/generated/\n')
+        self.create_file('plugin/a.vim')
+        self.create_file('plugin/generated/b.vim')
+
+        got_file_paths = list(find_vim_script([Path(self.root_dir, 'plugin')], respect_gitignore=True))
+
+        self.assertEqual(got_file_paths, [Path(self.root_dir, 'plugin', 'a.vim')])
+
+
+if __name__ == '__main__':
+    unittest.main()
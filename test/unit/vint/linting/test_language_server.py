@@ -0,0 +1,136 @@
+import unittest
+import json
+from io import BytesIO
+from pathlib import Path
+from vint.compat.unittest import mock
+
+from vint.bootstrap import import_all_policies
+from vint.linting.level import Level
+from vint.linting.linter import Linter
+from vint.linting.policy_set import PolicySet
+from vint.linting.policy_registry import get_policy_classes
+from vint.linting.language_server import LanguageServer
+
+
+INVALID_VIM_SCRIPT = Path('test', 'fixture', 'cli', 'invalid1.vim')
+
+
+def encode_messages(messages):
+    encoded_messages = b''
+
+    for message in messages:
+        body = json.dumps(message).encode('utf-8')
+        encoded_messages += 'Content-Length: {length}\r\n\r\n'.format(length=len(body)).encode('ascii') + body
+
+    return encoded_messages
+
+
+def decode_messages(encoded_messages):
+    messages = []
+
+    while encoded_messages:
+        header, _, encoded_messages = encoded_messages.partition(b'\r\n\r\n')
+        content_length = int(header.decode('ascii').split(':')[1])
+
+        messages.append(json.loads(encoded_messages[:content_length].decode('utf-8')))
+        encoded_messages = encoded_messages[content_length:]
+
+    return messages
+
+
+
+class TestLanguageServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        import_all_policies()
+
+
+    def setUp(self):
+        config_dict = {
+            'cmdargs': {
+                'severity': Level.STYLE_PROBLEM,
+            },
+            'policies': {},
+        }
+        self.linter = Linter(PolicySet(get_policy_classes()), config_dict)
+
+        with INVALID_VIM_SCRIPT.open() as f:
+            self.text = f.read()
+
+
+    def serve(self, messages):
+        writer = BytesIO()
+        server = LanguageServer(self.linter, BytesIO(encode_messages(messages)), writer)
+
+        exit_status = server.serve()
+
+        return exit_status, decode_messages(writer.getvalue())
+
+
+    def test_serve(self):
+        exit_status, messages = self.serve([
+            {'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {}},
+            {'jsonrpc': '2.0', 'method': 'textDocument/didOpen', 'params': {
+                'textDocument': {'uri': 'file:///tmp/a.vim', 'text': self.text},
+            }},
+            {'jsonrpc': '2.0', 'id': 2, 'method': 'shutdown'},
+            {'jsonrpc': '2.0', 'method': 'exit'},
+        ])
+
+        self.assertEqual(exit_status, 0)
+        self.assertEqual([message.get('id') for message in messages], [1, None, 2])
+        self.assertEqual([diagnostic['code'] for diagnostic in messages[1]['params']['diagnostics']],
+                         ['ProhibitEqualTildeOperator'])
+
+
+    def test_serve_with_multibyte_characters(self):
+        exit_status, messages = self.serve([
+            {'jsonrpc': '2.0', 'method': 'textDocument/didOpen', 'params': {
+                'textDocument': {'uri': 'file:///tmp/a.vim', 'text': u"echo '\u00e4\U0001f600' =~ 'a'\n"},
+            }},
+            {'jsonrpc': '2.0', 'id': 1, 'method': 'shutdown'},
+            {'jsonrpc': '2.0', 'method': 'exit'},
+        ])
+
+        diagnostics = [diagnostic for diagnostic in messages[0]['params']['diagnostics']
+                       if diagnostic['code'] == 'ProhibitEqualTildeOperator']
+
+        # NOTE: LSP counts UTF-16 code units, so the emoji is 2 and the umlaut is 1.
+        self.assertEqual(exit_status, 0)
+        self.assertEqual(diagnostics[0]['range']['start'], {'line': 0, 'character': 11})
+
+
+    def test_serve_after_broken_messages(self):
+        exit_status, messages = self.serve([
+            # The notification has no text.
+            {'jsonrpc': '2.0', 'method': 'textDocument/didOpen', 'params': {
+                'textDocument': {'uri': 'file:///tmp/a.vim'},
+            }},
+            # The request has no params.
+            {'jsonrpc': '2.0', 'id': 1, 'method': 'textDocument/didClose'},
+            {'jsonrpc': '2.0', 'id': 2, 'method': 'shutdown'},
+            {'jsonrpc': '2.0', 'method': 'exit'},
+        ])
+
+        self.assertEqual(exit_status, 0)
+        self.assertEqual(messages[0]['id'], 1)
+        self.assertEqual(messages[0]['error']['code'], -32603)
+        self.assertEqual(messages[1], {'jsonrpc': '2.0', 'id': 2, 'result': None})
+
+
+    def test_serve_after_linting_error(self):
+        with mock.patch.object(self.linter, 'lint_ast', side_effect=RuntimeError('unexpected')):
+            exit_status, messages = self.serve([
+                {'jsonrpc': '2.0', 'method': 'textDocument/didOpen', 'params': {
+                    'textDocument': {'uri': 'file:///tmp/a.vim', 'text': self.text},
+                }},
+                {'jsonrpc': '2.0', 'id': 1, 'method': 'shutdown'},
+                {'jsonrpc': '2.0', 'method': 'exit'},
+            ])
+
+        self.assertEqual(exit_status, 0)
+        self.assertEqual(messages, [{'jsonrpc': '2.0', 'id': 1, 'result': None}])
+
+
+if __name__ == '__main__':
+    unittest.main()
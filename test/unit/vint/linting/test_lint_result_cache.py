@@ -0,0 +1,103 @@
+import unittest
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from vint.linting.level import Level
+from vint.linting.lint_result_cache import LintResultCache
+
+
+def create_violation(path):
+    return {
+        'name': 'ProhibitSomethingEvil',
+        'level': Level.WARNING,
+        'description': 'this code is tooooo evil',
+        'reference': 'me',
+        'position': {
+            'line': 1,
+            'column': 2,
+            'path': path,
+        },
+    }
+
+
+class TestLintResultCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = Path(tempfile.mkdtemp())
+
+
+    def tearDown(self):
+        shutil.rmtree(str(self.cache_dir))
+
+
+    def test_get_returns_none_when_not_cached(self):
+        cache = LintResultCache(self.cache_dir, '1.0.0')
+        key = cache.build_key(b'echo 1', Path('file.vim'), {})
+
+        self.assertIsNone(cache.get(key, Path('path', 'to', 'file.vim')))
+        self.assertEqual(cache.stats.misses, 1)
+
+
+    def test_get_returns_put_violations(self):
+        cache = LintResultCache(self.cache_dir, '1.0.0')
+        key = cache.build_key(b'echo 1', Path('file.vim'), {})
+        cache.put(key, [create_violation(Path('path', 'to', 'file.vim'))])
+
+        # The same content on the other path should be reported with the other path.
+        other_path = Path('path', 'to', 'other.vim')
+
+        self.assertEqual(cache.get(key, other_path), [create_violation(other_path)])
+        self.assertEqual(cache.stats.hits, 1)
+
+
+    def test_build_key_depends_on_content_and_path_and_fingerprint_and_version(self):
+        cache = LintResultCache(self.cache_dir, '1.0.0')
+        other_version_cache = LintResultCache(self.cache_dir, '2.0.0')
+        key = cache.build_key(b'echo 1', Path('file.vim'), {'severity': Level.WARNING})
+
+        self.assertEqual(key, cache.build_key(b'echo 1', Path('file.vim'), {'severity': Level.WARNING}))
+        self.assertNotEqual(key, cache.build_key(b'echo 2', Path('file.vim'), {'severity': Level.WARNING}))
+        self.assertNotEqual(key, cache.build_key(b'echo 1', Path('autoload', 'file.vim'), {'severity': Level.WARNING}))
+        self.assertNotEqual(key, cache.build_key(b'echo 1', Path('file.vim'), {'severity': Level.ERROR}))
+        self.assertNotEqual(key, other_version_cache.build_key(b'echo 1', Path('file.vim'), {'severity': Level.WARNING}))
+
+
+    def test_get_treats_broken_cache_as_miss(self):
+        cache = LintResultCache(self.cache_dir, '1.0.0')
+        key = cache.build_key(b'echo 1', Path('file.vim'), {})
+        cache.put(key, [])
+
+        for dir_path, _, file_names in os.walk(str(self.cache_dir)):
+            for file_name in file_names:
+                with open(os.path.join(dir_path, file_name), 'w') as f:
+                    f.write('{broken')
+
+        self.assertIsNone(cache.get(key, Path('file.vim')))
+
+
+    def test_evict_removes_least_recently_used_caches(self):
+        violations = [create_violation(Path('file.vim'))] * 10
+        cache = LintResultCache(self.cache_dir, '1.0.0')
+
+        old_key = cache.build_key(b'old', Path('old.vim'), {})
+        cache.put(old_key, violations)
+        os.utime(str(self._find_cache_file()), (0, 0))
+
+        new_key = cache.build_key(b'new', Path('new.vim'), {})
+        cache.put(new_key, violations)
+
+        cache_size = self._find_cache_file().stat().st_size
+        small_cache = LintResultCache(self.cache_dir, '1.0.0', max_size=int(cache_size * 1.5))
+        small_cache.evict()
+
+        self.assertIsNone(small_cache.get(old_key, Path('file.vim')))
+        self.assertIsNotNone(small_cache.get(new_key, Path('file.vim')))
+
+
+    def _find_cache_file(self):
+        cache_files = sorted(self.cache_dir.glob('*/*.json'), key=lambda path: path.stat().st_mtime)
+        return cache_files[0]
+
+
+if __name__ == '__main__':
+    unittest.main()
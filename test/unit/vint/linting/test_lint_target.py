@@ -8,6 +8,7 @@ from vint.linting.lint_target import (
     AbstractLintTarget,
     LintTargetFile,
     LintTargetBufferedStream,
+    LintTargetBuffer,
     CachedLintTarget,
 )
 
@@ -38,6 +39,17 @@ class TestLintTarget(unittest.TestCase):
         self.assertEqual(alternate_path, lint_target.path)
 
 
+    def test_buffer(self):
+        alternate_path = Path('dummy')
+        lint_target = LintTargetBuffer(
+            alternate_path=alternate_path,
+            content_bytes=b'echo 1'
+        )
+
+        self.assertEqual(b'echo 1', lint_target.read())
+        self.assertEqual(alternate_path, lint_target.path)
+
+
     def test_cached(self):
         path_stub = Path('stub')
         lint_target = CachedLintTarget(LintTargetStub(path_stub, bytes()))
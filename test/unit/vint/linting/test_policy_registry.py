@@ -0,0 +1,82 @@
+import unittest
+from pathlib import Path
+
+from vint.ast.node_type import NodeType
+from vint.bootstrap import import_all_policies
+from vint.linting.level import Level
+from vint.linting.linter import Linter
+from vint.linting.lint_target import LintTargetBuffer
+from vint.linting.policy_set import PolicySet
+from vint.linting.policy_manifest import POLICY_MANIFEST
+from vint.linting.policy_registry import (
+    LazyPolicyClass,
+    get_policy_classes,
+    build_policy_manifest,
+)
+
+
+class TestPolicyRegistry(unittest.TestCase):
+    def test_policy_manifest_is_up_to_date(self):
+        import_all_policies()
+        policy_classes = [PolicyClass for PolicyClass in get_policy_classes()
+                          if not isinstance(PolicyClass, LazyPolicyClass)]
+
+        self.assertEqual(build_policy_manifest(policy_classes), POLICY_MANIFEST,
+                         'Run dev_tool/generate_policy_manifest.py to update the manifest')
+
+
+    def test_lazy_policy_class(self):
+        LazyPolicy = LazyPolicyClass({
+            'name': 'ProhibitSetNoCompatible',
+            'module': 'vint.linting.policy.prohibit_set_nocompatible',
+            'level': 'WARNING',
+            'listen_node_types': ['EXCMD'],
+            'required_plugins': [],
+        })
+
+        self.assertEqual(LazyPolicy.__name__, 'ProhibitSetNoCompatible')
+        self.assertEqual(LazyPolicy.level, Level.WARNING)
+
+        policy = LazyPolicy()
+        self.assertEqual(policy.name, 'ProhibitSetNoCompatible')
+        self.assertEqual(policy.listen_node_types(), [NodeType.EXCMD])
+
+        # The actual policy is used for anything else.
+        self.assertEqual(policy.description, 'Do not use nocompatible which has unexpected effects')
+
+
+    def test_policy_set_does_not_import_disabled_policies(self):
+        LazyPolicy = LazyPolicyClass({
+            'name': 'ProhibitSomethingUnimportable',
+            'module': 'vint.linting.policy.unexistent_module',
+            'level': 'STYLE_PROBLEM',
+            'listen_node_types': [],
+            'required_plugins': [],
+        })
+
+        policy_set = PolicySet([LazyPolicy])
+        policy_set.update_by_config({'cmdargs': {'severity': Level.WARNING}})
+
+        self.assertEqual(policy_set.get_enabled_policies(), [])
+
+
+    def test_linter_does_not_import_policies_that_listen_no_nodes_in_files(self):
+        LazyPolicy = LazyPolicyClass({
+            'name': 'ProhibitSomethingUnimportable',
+            'module': 'vint.linting.policy.unexistent_module',
+            'level': 'WARNING',
+            'listen_node_types': ['WHILE'],
+            'required_plugins': [],
+        })
+
+        linter = Linter(PolicySet([LazyPolicy]), {'cmdargs': {'severity': Level.WARNING}, 'policies': {}})
+        violations = linter.lint(LintTargetBuffer(Path('file.vim'), b'echo 1\n'))
+
+        self.assertEqual(violations, [])
+
+        with self.assertRaises(ImportError):
+            linter.lint(LintTargetBuffer(Path('file.vim'), b'while 1\nendwhile\n'))
+
+
+if __name__ == '__main__':
+    unittest.main()
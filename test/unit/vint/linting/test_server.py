@@ -0,0 +1,164 @@
+import unittest
+import os
+import stat
+import base64
+import time
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from vint.compat.unittest import mock
+
+from vint.bootstrap import import_all_policies
+from vint.linting.level import Level
+from vint.linting.server import (
+    LintServer,
+    LintServerError,
+    LintServerUnavailableError,
+    LintClient,
+)
+
+
+INVALID_VIM_SCRIPT = Path('test', 'fixture', 'cli', 'invalid1.vim')
+
+
+class TestLintServer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        import_all_policies()
+
+
+    def setUp(self):
+        self.socket_dir = Path(tempfile.mkdtemp())
+        self.socket_path = Path(self.socket_dir, 'server.sock')
+        self.server = None
+
+
+    def tearDown(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server_thread.join()
+
+        shutil.rmtree(str(self.socket_dir))
+
+
+    def start_server(self):
+        self.server = LintServer(self.socket_path)
+        self.server_thread = threading.Thread(target=self.server.serve_forever)
+        self.server_thread.daemon = True
+        self.server_thread.start()
+
+        for _ in range(100):
+            if self.socket_path.exists():
+                return
+
+            time.sleep(0.01)
+
+        self.fail('the server did not start')
+
+
+    def test_lint_content(self):
+        self.start_server()
+
+        client = LintClient(self.socket_path)
+        try:
+            with INVALID_VIM_SCRIPT.open('rb') as f:
+                content_bytes = f.read()
+
+            display_path = Path('path', 'to', 'buffer.vim')
+            violations = client.lint(display_path, content_bytes, Path.cwd(), {})
+
+            # NOTE: A connection can be used for several requests.
+            violations_of_valid_content = client.lint(display_path, b'echo 1\n', Path.cwd(), {})
+        finally:
+            client.close()
+
+        self.assertEqual(len(violations), 1)
+        self.assertEqual(violations[0]['name'], 'ProhibitEqualTildeOperator')
+        self.assertEqual(violations[0]['level'], Level.WARNING)
+        self.assertEqual(violations[0]['position'], {'line': 1, 'column': 13, 'path': display_path})
+        self.assertEqual(violations_of_valid_content, [])
+
+
+    def test_serve_forever_creates_socket_only_for_the_user(self):
+        self.socket_path = Path(self.socket_dir, 'sub', 'server.sock')
+
+        # The socket should not be accessible even before changing permissions.
+        with mock.patch('os.chmod'):
+            self.start_server()
+
+        self.assertEqual(stat.S_IMODE(os.stat(str(self.socket_path)).st_mode), 0o600)
+        self.assertEqual(stat.S_IMODE(os.stat(str(self.socket_path.parent)).st_mode) & 0o077, 0)
+
+
+    def test_lint_with_cmdargs(self):
+        self.start_server()
+
+        client = LintClient(self.socket_path)
+        try:
+            violations = client.lint(INVALID_VIM_SCRIPT, b'echo 1 =~ 2\n', Path.cwd(), {'error': True})
+        finally:
+            client.close()
+
+        self.assertEqual(violations, [])
+
+
+    def test_handle_request_with_path(self):
+        server = LintServer(self.socket_path)
+        response = server.handle_request({
+            'cwd': str(Path.cwd()),
+            'cmdargs': {},
+            'path': str(INVALID_VIM_SCRIPT),
+        })
+
+        self.assertEqual([violation['path'] for violation in response['violations']], [str(INVALID_VIM_SCRIPT)])
+
+
+    def test_handle_request_with_unexistent_path(self):
+        server = LintServer(self.socket_path)
+        response = server.handle_request({
+            'cwd': str(Path.cwd()),
+            'cmdargs': {},
+            'path': 'path/to/unexistent.vim',
+        })
+
+        self.assertIn('error', response)
+
+
+    def test_handle_request_after_creating_project_config(self):
+        project_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, str(project_dir))
+
+        server = LintServer(self.socket_path)
+        request = {
+            'cwd': str(project_dir),
+            'cmdargs': {'style_problem': True},
+            'path': 'a.vim',
+            'content': base64.b64encode(b"echo 'a' =~ 'a'\n").decode('ascii'),
+        }
+
+        response = server.handle_request(request)
+        self.assertEqual([violation['name'] for violation in response['violations']], ['ProhibitEqualTildeOperator'])
+
+        # NOTE: The project had no config files when the server loaded configs.
+        with Path(project_dir, '.vintrc.yaml').open('w') as f:
+            f.write(u'policies:\n  ProhibitEqualTildeOperator:\n    enabled: false\n')
+
+        response = server.handle_request(request)
+        self.assertEqual(response['violations'], [])
+
+
+    def test_client_raises_if_server_is_not_running(self):
+        with self.assertRaises(LintServerUnavailableError):
+            LintClient(self.socket_path)
+
+
+    def test_serve_forever_raises_if_another_server_is_running(self):
+        self.start_server()
+
+        with self.assertRaises(LintServerError):
+            LintServer(self.socket_path).serve_forever()
+
+
+if __name__ == '__main__':
+    unittest.main()
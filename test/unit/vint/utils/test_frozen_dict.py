@@ -0,0 +1,36 @@
+import unittest
+import pickle
+from vint.utils.frozen_dict import FrozenDict, freeze_dict_deeply
+
+
+class TestFrozenDict(unittest.TestCase):
+    def test_freeze_dict_deeply(self):
+        frozen_dict = freeze_dict_deeply({'a': {'b': [1]}})
+
+        self.assertEqual(frozen_dict, {'a': {'b': [1]}})
+        self.assertIsInstance(frozen_dict['a'], FrozenDict)
+
+        with self.assertRaises(TypeError):
+            frozen_dict['a']['b'] = 2
+
+        with self.assertRaises(TypeError):
+            frozen_dict.update({'c': 3})
+
+    def test_in_place_operators(self):
+        frozen_dict = FrozenDict({'a': 1})
+
+        with self.assertRaises(TypeError):
+            frozen_dict |= {'b': 2}
+
+        self.assertEqual(frozen_dict, {'a': 1})
+
+    def test_copy(self):
+        copied_dict = FrozenDict({'a': 1}).copy()
+        copied_dict['b'] = 2
+
+        self.assertEqual(copied_dict, {'a': 1, 'b': 2})
+
+    def test_pickle(self):
+        frozen_dict = freeze_dict_deeply({'a': {'b': 1}})
+
+        self.assertEqual(pickle.loads(pickle.dumps(frozen_dict)), frozen_dict)
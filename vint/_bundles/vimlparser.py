@@ -114,16 +114,51 @@ def viml_equalci(a, b):
     return a.lower() == b.lower()
 
 
+def _is_anchored(pattern):
+    # Whether every top-level alternative of the pattern begins with "^".
+    depth = 0
+    is_alternative_start = True
+    escaped = False
+    for c in pattern:
+        if is_alternative_start and c != "^":
+            return False
+        is_alternative_start = False
+        if escaped:
+            escaped = False
+        elif c == "\\":
+            escaped = True
+        elif c == "(":
+            depth += 1
+        elif c == ")":
+            depth -= 1
+        elif c == "|" and depth == 0:
+            is_alternative_start = True
+    return not is_alternative_start
+
+
+def _compile_vim2py(flags):
+    # Anchored patterns are matched only at the beginning, so .match is enough.
+    matchers = {}
+    for reg, pattern in pat_vim2py.items():
+        compiled = re.compile(pattern, flags)
+        matchers[reg] = compiled.match if _is_anchored(pattern) else compiled.search
+    return matchers
+
+
+matcher_vim2py = _compile_vim2py(0)
+matcher_vim2py_ignorecase = _compile_vim2py(re.IGNORECASE)
+
+
 def viml_eqreg(s, reg):
-    return re.search(pat_vim2py[reg], s, re.IGNORECASE)
+    return matcher_vim2py_ignorecase[reg](s)
 
 
 def viml_eqregh(s, reg):
-    return re.search(pat_vim2py[reg], s)
+    return matcher_vim2py[reg](s)
 
 
 def viml_eqregq(s, reg):
-    return re.search(pat_vim2py[reg], s, re.IGNORECASE)
+    return matcher_vim2py_ignorecase[reg](s)
 
 
 def viml_escape(s, chars):
@@ -0,0 +1,206 @@
+from typing import Dict, Any, List, Optional  # noqa: F401
+import re
+import bisect
+from vint._bundles.vimlparser import viml_len
+from vint.ast.node import SlottedMapping, Position
+
+
+# NOTE: vimlparser joins lines beginning with a backslash to the previous line.
+_LINE_CONTINUATION_PATTERN = re.compile(r'^\s*\\')
+
+_CONTAINER_TYPES = (dict, list, SlottedMapping)
+
+
+class IncrementalParseError(Exception):
+    """ Raised when changed lines cannot be parsed separately. """
+    pass
+
+
+class ChangedRegion(object):
+    """ A class for regions of top-level statements that contain changed lines.
+    The region covers the statements from start_index to end_index (exclusive)
+    of the previous TOPLEVEL body. Lines before the region are unchanged, and
+    lines after the region are unchanged but moved.
+    """
+    def __init__(self, start_index, end_index, start_lnum, previous_end_lnum, end_lnum):
+        # type: (int, int, int, int, int) -> None
+        self.start_index = start_index
+        self.end_index = end_index
+
+        # NOTE: Line numbers are 1-based and inclusive.
+        self.start_lnum = start_lnum
+        self.previous_end_lnum = previous_end_lnum
+        self.end_lnum = end_lnum
+
+
+def find_changed_region(statements, previous_lines, lines):
+    # type: (List[Dict[str, Any]], List[str], List[str]) -> Optional[ChangedRegion]
+    """ Returns the region of top-level statements that should be parsed
+    again, or None if nothing is changed. A statement spans from its first
+    line to the line before the next statement, so a whole block such as
+    function ... endfunction is one statement.
+    """
+    if previous_lines == lines:
+        return None
+
+    if len(statements) == 0:
+        raise IncrementalParseError('no statements to reuse')
+
+    common_lines_count = min(len(previous_lines), len(lines))
+
+    prefix_count = 0
+    while prefix_count < common_lines_count and previous_lines[prefix_count] == lines[prefix_count]:
+        prefix_count += 1
+
+    suffix_count = 0
+    while suffix_count < common_lines_count - prefix_count \
+            and previous_lines[-1 - suffix_count] == lines[-1 - suffix_count]:
+        suffix_count += 1
+
+    # NOTE: Statements on the same line such as "echo 1 | echo 2" are grouped.
+    group_start_indices = []  # type: List[int]
+    group_start_lnums = []  # type: List[int]
+
+    for index, statement in enumerate(statements):
+        lnum = statement['pos']['lnum']
+
+        if len(group_start_lnums) == 0 or group_start_lnums[-1] != lnum:
+            group_start_indices.append(index)
+            group_start_lnums.append(lnum)
+
+    # NOTE: Lines before the first statement belong to the first group.
+    group_start_lnums[0] = 1
+
+    # NOTE: Include the line before the changed lines. Inserted lines may
+    #       continue the previous statement.
+    first_changed_lnum = prefix_count + 1
+    last_changed_lnum = max(len(previous_lines) - suffix_count, first_changed_lnum - 1)
+
+    start_group = _find_group(group_start_lnums, max(1, first_changed_lnum - 1))
+    end_group = _find_group(group_start_lnums, max(1, last_changed_lnum))
+
+    line_delta = len(lines) - len(previous_lines)
+
+    while True:
+        start_lnum = group_start_lnums[start_group]
+        previous_end_lnum = _get_group_end_lnum(group_start_lnums, end_group, len(previous_lines))
+
+        # NOTE: The region cannot start or end in the middle of continued lines.
+        if _is_continuation_line(lines, start_lnum):
+            if start_group == 0:
+                raise IncrementalParseError('the first line is a continuation line')
+
+            start_group -= 1
+            continue
+
+        if _is_continuation_line(lines, previous_end_lnum + line_delta + 1):
+            end_group += 1
+            continue
+
+        break
+
+    end_index = group_start_indices[end_group + 1] if end_group + 1 < len(group_start_indices) else len(statements)
+
+    return ChangedRegion(
+        start_index=group_start_indices[start_group],
+        end_index=end_index,
+        start_lnum=start_lnum,
+        previous_end_lnum=previous_end_lnum,
+        end_lnum=previous_end_lnum + line_delta,
+    )
+
+
+def collect_positions(nodes):  # type: (List[Dict[str, Any]]) -> List[Dict[str, int]]
+    """ Returns positions of the nodes and their descendants. Positions of
+    sub-ASTs that plugins attached are also collected.
+    """
+    # NOTE: vimlparser shares a position object among some nodes, so check
+    #       visited objects to collect each position only once.
+    visited_ids = set()
+    positions = []  # type: List[Dict[str, int]]
+    stack = list(nodes)  # type: List[Any]
+
+    while stack:
+        value = stack.pop()
+
+        if id(value) in visited_ids:
+            continue
+
+        visited_ids.add(id(value))
+
+        if isinstance(value, (dict, SlottedMapping)):
+            # NOTE: Positions are not only in "pos" but also in "ea" of
+            #       excommands such as "argpos".
+            if _is_position(value):
+                positions.append(value)
+                continue
+
+            stack.extend(child for child in value.values() if isinstance(child, _CONTAINER_TYPES))
+        else:
+            stack.extend(child for child in value if isinstance(child, _CONTAINER_TYPES))
+
+    return positions
+
+
+def shift_positions(positions, lnum_delta, i_delta, offset_delta):
+    # type: (List[Dict[str, int]], int, int, int) -> None
+    for pos in positions:
+        pos['lnum'] += lnum_delta
+        pos['i'] += i_delta
+
+        if 'offset' in pos:
+            pos['offset'] += offset_delta
+
+
+def get_line_start_position(statement, lines):  # type: (Dict[str, Any], List[str]) -> Dict[str, int]
+    """ Returns the position of the beginning of the line that the statement starts at. """
+    pos = statement['pos']
+
+    if 'offset' not in pos:
+        raise IncrementalParseError('the statement has no offset')
+
+    # NOTE: Columns and offsets are counted by viml_len (bytes of UTF-8), but
+    #       indices are counted by characters. They can be converted on lines
+    #       that are not continuation lines.
+    line = lines[pos['lnum'] - 1]
+    chars_count = 0
+    columns_count = 0
+
+    while columns_count < pos['col'] - 1:
+        columns_count += viml_len(line[chars_count])
+        chars_count += 1
+
+    return {
+        'i': pos['i'] - chars_count,
+        'offset': pos['offset'] - columns_count,
+    }
+
+
+def get_offset_length(lines):  # type: (List[str]) -> int
+    """ Returns the length of the lines that is counted as offsets. """
+    return sum(viml_len(line) + 1 for line in lines)
+
+
+def _is_position(value):  # type: (Dict[str, Any]) -> bool
+    if isinstance(value, Position):
+        return True
+
+    return 'lnum' in value and 'i' in value and 'type' not in value
+
+
+def _find_group(group_start_lnums, lnum):  # type: (List[int], int) -> int
+    return max(0, bisect.bisect_right(group_start_lnums, lnum) - 1)
+
+
+def _get_group_end_lnum(group_start_lnums, group, lines_count):  # type: (List[int], int, int) -> int
+    if group + 1 < len(group_start_lnums):
+        return group_start_lnums[group + 1] - 1
+
+    return lines_count
+
+
+def _is_continuation_line(lines, lnum):  # type: (List[str], int) -> bool
+    if lnum < 1 or lnum > len(lines):
+        return False
+
+    return _LINE_CONTINUATION_PATTERN.match(lines[lnum - 1]) is not None
@@ -0,0 +1,346 @@
+from typing import Dict, Any, List, Optional, Tuple, Type  # noqa: F401
+from vint._bundles.vimlparser import AttributeDict
+from vint.ast.node_type import NodeType
+
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    # NOTE: Python 2 has abstract base classes in collections.
+    from collections import MutableMapping  # type: ignore
+
+
+class _Missing(object):
+    """ A class for the value of slots that are not set. Nodes initialize all
+    slots by it, because checking unset slots by exceptions is slow.
+    """
+    def __deepcopy__(self, memo):
+        return self
+
+
+    def __reduce__(self):
+        return '_MISSING'
+
+
+_MISSING = _Missing()
+
+
+class SlottedMapping(MutableMapping):
+    """ A base class for mappings that store values of known keys in slots.
+    It is smaller than a dict, and it can be used as a dict such as
+    pos['lnum']. Values are also accessible as attributes such as pos.lnum,
+    because vimlparser builds ASTs by attributes. Values of unknown keys are
+    stored in a dict that is created on demand.
+    """
+    __slots__ = ('_extra',)
+
+    # NOTE: Subclasses created by define_slotted_mapping override them.
+    _slot_names = {}  # type: Dict[str, str]
+    _keys = ()  # type: Tuple[str, ...]
+
+
+    def __getitem__(self, key):
+        slot_name = self._slot_names.get(key)
+
+        if slot_name is None:
+            return self._get_extra()[key]
+
+        value = getattr(self, slot_name, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+
+        return value
+
+
+    def __setitem__(self, key, value):
+        slot_name = self._slot_names.get(key)
+
+        if slot_name is None:
+            self._get_extra(create=True)[key] = value
+        else:
+            object.__setattr__(self, slot_name, value)
+
+
+    def __delitem__(self, key):
+        slot_name = self._slot_names.get(key)
+
+        if slot_name is None:
+            del self._get_extra()[key]
+            return
+
+        if getattr(self, slot_name, _MISSING) is _MISSING:
+            raise KeyError(key)
+
+        object.__setattr__(self, slot_name, _MISSING)
+
+
+    def __contains__(self, key):
+        slot_name = self._slot_names.get(key)
+
+        if slot_name is None:
+            return key in self._get_extra()
+
+        return getattr(self, slot_name, _MISSING) is not _MISSING
+
+
+    def get(self, key, default=None):
+        slot_name = self._slot_names.get(key)
+
+        if slot_name is None:
+            return self._get_extra().get(key, default)
+
+        value = getattr(self, slot_name, _MISSING)
+        return default if value is _MISSING else value
+
+
+    def __iter__(self):
+        for key in self._keys:
+            if getattr(self, self._slot_names[key], _MISSING) is not _MISSING:
+                yield key
+
+        for key in list(self._get_extra()):
+            yield key
+
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+
+    def __repr__(self):
+        return repr(dict(self.items()))
+
+
+    def _get_extra(self, create=False):  # type: (bool) -> Dict[str, Any]
+        extra = getattr(self, '_extra', None)
+
+        if extra is None:
+            extra = {}
+
+            if create:
+                object.__setattr__(self, '_extra', extra)
+
+        return extra
+
+
+
+class Node(SlottedMapping):
+    """ A base class for AST nodes. Slots of nodes are defined for each node
+    type, so attributes that are not in slots are stored as unknown keys.
+    """
+    __slots__ = ()
+
+
+    def __getattr__(self, name):
+        # NOTE: This is called only when the attribute is not found in slots.
+        if name == '_extra':
+            raise AttributeError(name)
+
+        extra = self._get_extra()
+
+        if name not in extra:
+            raise AttributeError(name)
+
+        return extra[name]
+
+
+    def __setattr__(self, name, value):
+        try:
+            object.__setattr__(self, name, value)
+        except AttributeError:
+            # NOTE: vimlparser can set attributes that are not in slots.
+            self._get_extra(create=True)[name] = value
+
+
+
+def define_slotted_mapping(name, keys, base=SlottedMapping):
+    # type: (str, Tuple[str, ...], Type[SlottedMapping]) -> Type[SlottedMapping]
+    """ Returns a subclass of SlottedMapping that has slots for the keys.
+    Keys that are not identifiers such as "VINT:is_reachable" are stored in
+    slots named like "VINT_is_reachable".
+    """
+    slot_names = dict((key, key.replace(':', '_')) for key in keys)
+
+    return type(name, (base,), {
+        '__slots__': tuple(slot_names[key] for key in keys),
+        '_slot_names': slot_names,
+        '_keys': keys,
+    })
+
+
+Position = define_slotted_mapping('Position', ('i', 'lnum', 'col', 'offset'))
+
+
+_EXCOMMAND_ARGUMENT_KEYS = (
+    'forceit', 'addr_count', 'line1', 'line2', 'flags', 'do_ecmd_cmd',
+    'do_ecmd_lnum', 'append', 'usefilter', 'amount', 'regname', 'force_bin',
+    'read_edit', 'force_ff', 'force_enc', 'bad_char', 'linepos', 'cmdpos',
+    'argpos', 'cmd', 'modifiers', 'range', 'argopt', 'argcmd',
+)
+
+ExcommandArguments = define_slotted_mapping('ExcommandArguments', _EXCOMMAND_ARGUMENT_KEYS)
+
+
+def create_excommand_arguments():  # type: () -> SlottedMapping
+    """ Returns arguments of an excommand same as vimlparser.ExArg. """
+    ea = ExcommandArguments()
+    ea.forceit = 0
+    ea.addr_count = 0
+    ea.line1 = 0
+    ea.line2 = 0
+    ea.flags = 0
+    ea.do_ecmd_cmd = ''
+    ea.do_ecmd_lnum = 0
+    ea.append = 0
+    ea.usefilter = 0
+    ea.amount = 0
+    ea.regname = 0
+    ea.force_bin = 0
+    ea.read_edit = 0
+    ea.force_ff = 0
+    ea.force_enc = 0
+    ea.bad_char = 0
+    ea.linepos = AttributeDict({})
+    ea.cmdpos = []
+    ea.argpos = []
+    ea.cmd = AttributeDict({})
+    ea.modifiers = []
+    ea.range = []
+    ea.argopt = AttributeDict({})
+    ea.argcmd = AttributeDict({})
+    return ea
+
+
+# NOTE: Slots reserved for annotations of the scope plugin and the node index.
+#       Other annotations are stored out of slots.
+_TOPLEVEL_ANNOTATION_KEYS = ('VINT:node_index',)
+_IDENTIFIER_ANNOTATION_KEYS = ('VINT:identifier_attribute', 'VINT:is_reachable', 'VINT:is_referenced')
+_STRING_ANNOTATION_KEYS = (
+    'VINT:identifier_attribute',
+    'VINT:lambda_string_expression',
+    'VINT:function_reference_expression',
+    'VINT:string_expression_context',
+)
+_EXCMD_ANNOTATION_KEYS = ('VINT:redir_content',)
+
+_BINARY_OPERATOR_KEYS = ('left', 'right')
+
+# SEE: https://github.com/vim-jp/vim-vimlparser/blob/master/py/vimlparser.py
+_NODE_KEYS_MAP = {
+    NodeType.TOPLEVEL: ('body',) + _TOPLEVEL_ANNOTATION_KEYS,
+    NodeType.COMMENT: ('str',),
+    NodeType.EXCMD: ('ea', 'str') + _EXCMD_ANNOTATION_KEYS,
+    NodeType.FUNCTION: ('ea', 'body', 'left', 'rlist', 'default_args', 'attr', 'endfunction'),
+    NodeType.ENDFUNCTION: ('ea',),
+    NodeType.DELFUNCTION: ('ea', 'left'),
+    NodeType.RETURN: ('ea', 'left'),
+    NodeType.EXCALL: ('ea', 'left'),
+    NodeType.LET: ('ea', 'op', 'left', 'list', 'rest', 'right'),
+    NodeType.CONST: ('ea', 'op', 'left', 'list', 'rest', 'right'),
+    NodeType.UNLET: ('ea', 'list'),
+    NodeType.LOCKVAR: ('ea', 'depth', 'list'),
+    NodeType.UNLOCKVAR: ('ea', 'depth', 'list'),
+    NodeType.IF: ('ea', 'body', 'cond', 'elseif', 'else_', 'endif'),
+    NodeType.ELSEIF: ('ea', 'body', 'cond'),
+    NodeType.ELSE: ('ea', 'body'),
+    NodeType.ENDIF: ('ea',),
+    NodeType.WHILE: ('ea', 'body', 'cond', 'endwhile'),
+    NodeType.ENDWHILE: ('ea',),
+    NodeType.FOR: ('ea', 'body', 'left', 'list', 'rest', 'right', 'endfor'),
+    NodeType.ENDFOR: ('ea',),
+    NodeType.CONTINUE: ('ea',),
+    NodeType.BREAK: ('ea',),
+    NodeType.TRY: ('ea', 'body', 'catch', 'finally_', 'endtry'),
+    NodeType.CATCH: ('ea', 'body', 'pattern'),
+    NodeType.FINALLY: ('ea', 'body'),
+    NodeType.ENDTRY: ('ea',),
+    NodeType.THROW: ('ea', 'left'),
+    NodeType.EVAL: ('ea', 'left'),
+    NodeType.ECHO: ('ea', 'list'),
+    NodeType.ECHON: ('ea', 'list'),
+    NodeType.ECHOHL: ('ea', 'str'),
+    NodeType.ECHOMSG: ('ea', 'list'),
+    NodeType.ECHOERR: ('ea', 'list'),
+    NodeType.ECHOCONSOLE: ('ea', 'list'),
+    NodeType.EXECUTE: ('ea', 'list'),
+    NodeType.TERNARY: ('cond', 'left', 'right'),
+    NodeType.NOT: ('left',),
+    NodeType.MINUS: ('left',),
+    NodeType.PLUS: ('left',),
+    NodeType.SLICE: ('left', 'rlist'),
+    NodeType.CALL: ('left', 'rlist'),
+    NodeType.NUMBER: ('value', 'VINT:identifier_attribute'),
+    NodeType.STRING: ('value',) + _STRING_ANNOTATION_KEYS,
+    NodeType.LIST: ('value',),
+    NodeType.DICT: ('value',),
+    NodeType.BLOB: ('value',),
+    NodeType.NESTING: ('left',),
+    NodeType.OPTION: ('value',) + _IDENTIFIER_ANNOTATION_KEYS,
+    NodeType.IDENTIFIER: ('value',) + _IDENTIFIER_ANNOTATION_KEYS,
+    NodeType.CURLYNAME: ('value',) + _IDENTIFIER_ANNOTATION_KEYS,
+    NodeType.ENV: ('value',) + _IDENTIFIER_ANNOTATION_KEYS,
+    NodeType.REG: ('value',) + _IDENTIFIER_ANNOTATION_KEYS,
+    NodeType.CURLYNAMEPART: ('value', 'curly'),
+    NodeType.CURLYNAMEEXPR: ('value', 'curly'),
+    NodeType.LAMBDA: ('rlist', 'left'),
+    NodeType.HEREDOC: ('rlist', 'op', 'body'),
+}  # type: Dict[NodeType, Tuple[str, ...]]
+
+
+def _build_node_classes():  # type: () -> Dict[int, Type[SlottedMapping]]
+    node_classes = {}  # type: Dict[int, Type[SlottedMapping]]
+
+    # NOTE: Node types that have the same keys share the class.
+    node_classes_by_keys = {}  # type: Dict[Tuple[str, ...], Type[SlottedMapping]]
+
+    for node_type in NodeType:
+        keys = ('type', 'pos') + _NODE_KEYS_MAP.get(node_type, _BINARY_OPERATOR_KEYS)
+
+        if keys not in node_classes_by_keys:
+            node_classes_by_keys[keys] = define_slotted_mapping(node_type.name.capitalize() + 'Node', keys, base=Node)
+
+        node_classes[node_type.value] = node_classes_by_keys[keys]
+
+    return node_classes
+
+
+_NODE_CLASSES = _build_node_classes()
+
+_UNKNOWN_NODE_CLASS = define_slotted_mapping('UnknownNode', ('type', 'pos'), base=Node)
+
+
+def create_node(node_type):  # type: (int) -> Node
+    """ Returns a node of the type same as vimlparser.Node. """
+    node_class = _NODE_CLASSES.get(node_type, _UNKNOWN_NODE_CLASS)
+    node = node_class()
+
+    for slot_name in node_class.__slots__:
+        object.__setattr__(node, slot_name, _MISSING)
+
+    object.__setattr__(node, '_extra', None)
+    object.__setattr__(node, 'type', node_type)
+    return node
+
+
+def copy_ast(value):  # type: (Any) -> Any
+    """ Returns a deep copy of the AST faster than copy.deepcopy. Nodes,
+    positions, dicts and lists are copied, and other values are shared because
+    they are immutable.
+    """
+    if isinstance(value, list):
+        return [copy_ast(element) for element in value]
+
+    if isinstance(value, SlottedMapping):
+        value_class = type(value)
+        copied = value_class.__new__(value_class)
+
+        for slot_name in value_class._slot_names.values():
+            # NOTE: Unset slots are copied as _MISSING, and it means unset too.
+            object.__setattr__(copied, slot_name, copy_ast(getattr(value, slot_name, _MISSING)))
+
+        extra = getattr(value, '_extra', None)
+        object.__setattr__(copied, '_extra', None if extra is None else copy_ast(extra))
+        return copied
+
+    if isinstance(value, dict):
+        return type(value)((key, copy_ast(element)) for key, element in value.items())
+
+    return value
@@ -0,0 +1,94 @@
+from typing import Dict, Any, List, Optional  # noqa: F401
+from vint.ast.node_type import NodeType
+from vint.ast.traversing import traverse
+
+NODE_INDEX = 'VINT:node_index'
+
+# NOTE: Keys of statements that have child statements such as "body" of :if.
+_STATEMENT_CHILD_KEYS = ('body', 'elseif', 'else_', 'catch', 'finally_')
+
+
+class NodeIndex(object):
+    """ An index from node types to nodes in the document order. Excommand
+    nodes are also indexed by the command names such as "scriptencoding".
+    It lets consumers iterate only the nodes they care about instead of
+    traversing the whole AST.
+    """
+    def __init__(self):
+        self._nodes_map = {}  # type: Dict[int, List[Dict[str, Any]]]
+        self._excommands_map = {}  # type: Dict[str, List[Dict[str, Any]]]
+
+
+    def add(self, node):  # type: (Dict[str, Any]) -> None
+        node_type = node['type']
+        self._nodes_map.setdefault(node_type, []).append(node)
+
+        if node_type == NodeType.EXCMD.value:
+            command_name = node['ea']['cmd'].get('name')
+
+            if command_name is not None:
+                self._excommands_map.setdefault(command_name, []).append(node)
+
+
+    def get_nodes(self, node_type):  # type: (NodeType) -> List[Dict[str, Any]]
+        """ Returns nodes of the node type in the document order. """
+        return self._nodes_map.get(node_type.value, [])
+
+
+    def get_excommands(self, command_name):  # type: (str) -> List[Dict[str, Any]]
+        """ Returns excommand nodes of the full command name such as
+        "scriptencoding" (not "scripte") in the document order.
+        """
+        return self._excommands_map.get(command_name, [])
+
+
+
+def build_node_index(ast):  # type: (Dict[str, Any]) -> NodeIndex
+    """ Returns the index of the AST. Nodes that plugins attached such as
+    string expressions are also indexed.
+    """
+    node_index = NodeIndex()
+    traverse(ast, on_enter=node_index.add)
+    return node_index
+
+
+def attach_node_index(ast, node_index=None):  # type: (Dict[str, Any], Optional[NodeIndex]) -> NodeIndex
+    """ Attaches the index to the AST. The index is built if it is not
+    specified, but callers that already traverse the AST should fill the
+    index in the traversal instead (see AbstractASTPlugin.process_and_index).
+    """
+    if node_index is None:
+        node_index = build_node_index(ast)
+
+    ast[NODE_INDEX] = node_index
+    return node_index
+
+
+def get_node_index(ast):  # type: (Dict[str, Any]) -> Optional[NodeIndex]
+    return ast.get(NODE_INDEX)
+
+
+def find_comment_nodes(ast):  # type: (Dict[str, Any]) -> List[Dict[str, Any]]
+    """ Returns comment nodes in the document order without the index.
+    Comments are always statements, so it visits only statements instead of
+    traversing the whole AST.
+    """
+    comment_nodes = []  # type: List[Dict[str, Any]]
+    _collect_comment_nodes(ast['body'], comment_nodes)
+    return comment_nodes
+
+
+def _collect_comment_nodes(statements, comment_nodes):
+    # type: (List[Dict[str, Any]], List[Dict[str, Any]]) -> None
+    for statement in statements:
+        if statement['type'] == NodeType.COMMENT.value:
+            comment_nodes.append(statement)
+            continue
+
+        for key in _STATEMENT_CHILD_KEYS:
+            child = statement.get(key)
+
+            if isinstance(child, list):
+                _collect_comment_nodes(child, comment_nodes)
+            elif child is not None:
+                _collect_comment_nodes([child], comment_nodes)
@@ -1,3 +1,4 @@
+from typing import Dict, Any, Tuple  # noqa: F401
 from enum import Enum, unique
 
 
@@ -101,3 +102,31 @@ class NodeType(Enum):
     HEREDOC = 96
     METHOD = 97
     ECHOCONSOLE = 98
+
+
+def create_node_type_table(values_map, default=None):
+    # type: (Dict[NodeType, Any], Any) -> Tuple[Any, ...]
+    """ Returns a tuple that is indexed by values of node types such as
+    table[node['type']]. It is faster than dicts keyed by NodeType, because
+    NodeType(node['type']) is slow.
+    """
+    table = [default] * (max(node_type.value for node_type in NodeType) + 1)
+
+    for node_type, value in values_map.items():
+        table[node_type.value] = value
+
+    return tuple(table)
+
+
+_NODE_TYPE_TABLE = create_node_type_table(dict((node_type, node_type) for node_type in NodeType))
+
+
+def get_node_type(node):  # type: (Dict[str, Any]) -> NodeType
+    """ Returns the type of the node same as NodeType(node['type']), but faster. """
+    node_type = node['type']
+
+    try:
+        return _NODE_TYPE_TABLE[node_type]
+    except TypeError:
+        # NOTE: Hand-made nodes can have NodeType instead of the value.
+        return NodeType(node_type)
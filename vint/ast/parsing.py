@@ -1,19 +1,91 @@
-from typing import Dict, Any  # noqa: F401
+from typing import Dict, Any, List, Optional, Tuple  # noqa: F401
 import re
+import types
+import logging
+from collections import OrderedDict
 from vint._bundles import vimlparser
 from vint.ast.traversing import traverse
+from vint.ast.string_reader import CompactStringReader
+from vint.ast.node import create_node, create_excommand_arguments, copy_ast
+from vint.ast.node_index import NodeIndex, attach_node_index
+from vint.ast.incremental_parsing import (
+    IncrementalParseError,
+    find_changed_region,
+    collect_positions,
+    shift_positions,
+    get_line_start_position,
+    get_offset_length,
+)
 from vint.encodings.decoder import Decoder
 from vint.encodings.decoding_strategy import default_decoding_strategy
 from vint.linting.lint_target import AbstractLintTarget
 
 
+# NOTE: Plugins parse the same expressions in strings many times, such as
+#       map(list, 'v:val') in heavily functional plugins.
+SUB_EXPRESSION_CACHE_SIZE = 256
+
+
+def _build_slotted_parser_classes():  # type: () -> Dict[str, Any]
+    """ Returns copies of the classes of the bundled parser that build ASTs
+    by slotted nodes instead of dicts to reduce memory. Methods of the
+    bundled parser call Node and ExArg of the module, so the methods are
+    copied with module globals that have the factories of slotted nodes.
+    The bundled parser module itself is not changed.
+    """
+    slotted_globals = dict(vars(vimlparser))
+    slotted_globals['Node'] = create_node
+    slotted_globals['ExArg'] = create_excommand_arguments
+
+    for class_name in ('VimLParser', 'ExprTokenizer', 'ExprParser', 'LvalueParser'):
+        parser_class = getattr(vimlparser, class_name)
+        methods = {}  # type: Dict[str, Any]
+
+        # NOTE: Inherited methods are copied too, or they use the original globals.
+        for klass in reversed(_get_class_hierarchy(parser_class)):
+            for name, value in vars(klass).items():
+                if isinstance(value, types.FunctionType):
+                    methods[name] = types.FunctionType(value.__code__, slotted_globals, value.__name__,
+                                                       value.__defaults__, value.__closure__)
+
+        # NOTE: Classes of the bundled parser are old-style classes on Python 2.
+        slotted_globals[class_name] = type(parser_class)('Slotted' + class_name, (parser_class,), methods)
+
+    return slotted_globals
+
+
+def _get_class_hierarchy(klass):  # type: (Any) -> List[Any]
+    """ Returns the class and its base classes from the class. """
+    class_hierarchy = [klass]
+
+    for base_class in klass.__bases__:
+        class_hierarchy += _get_class_hierarchy(base_class)
+
+    return class_hierarchy
+
+
+_SlottedVimLParser = _build_slotted_parser_classes()['VimLParser']
+
+
 class Parser(object):
-    def __init__(self, plugins=None, enable_neovim=False):
+    def __init__(self, plugins=None, enable_neovim=False, build_node_index=False):
         """ Initialize Parser with the specified plugins.
-        The plugins can add attributes to the AST.
+        The plugins can add attributes to the AST. If build_node_index is
+        True, the index of nodes is attached to the AST (see node_index).
         """
         self.plugins = plugins if plugins else []
         self._enable_neovim = enable_neovim
+        self._build_node_index = build_node_index
+
+        # NOTE: Positions of top-level statements are cached to shift them
+        #       quickly. The cache is only for the latest AST, because plugins
+        #       attach sub-ASTs again when they process other ASTs.
+        self._latest_ast = None  # type: Optional[Dict[str, Any]]
+        self._statement_positions_map = {}  # type: Dict[int, List[Dict[str, int]]]
+
+        # NOTE: Arguments of :echo parsed from expressions. The least recently
+        #       used expression is dropped when the cache is full.
+        self._sub_expression_cache = OrderedDict()  # type: Dict[str, List[Dict[str, Any]]]
 
 
     def parse(self, lint_target):  # type: (AbstractLintTarget) -> Dict[str, Any]
@@ -28,18 +100,137 @@ class Parser(object):
     def parse_string(self, string):  # type: (str) -> Dict[str, Any]
         """ Parse vim script string and return the AST. """
         lines = string.split('\n')
+        ast, _ = self._parse_lines(lines)
+
+        if self._build_node_index and len(self.plugins) > 0:
+            # NOTE: The last plugin fills the index in its traversal, so nodes
+            #       that the plugins attached are also indexed without one more
+            #       traversal.
+            for plugin in self.plugins[:-1]:
+                plugin.process(ast)
+
+            node_index = NodeIndex()
+            self.plugins[-1].process_and_index(ast, node_index)
+            attach_node_index(ast, node_index)
+        else:
+            for plugin in self.plugins:
+                plugin.process(ast)
+
+            if self._build_node_index:
+                attach_node_index(ast)
+
+        self._latest_ast = ast
+        self._statement_positions_map = {}
+
+        return ast
+
+
+    def parse_string_incrementally(self, previous_ast, previous_string, string):
+        # type: (Dict[str, Any], str, str) -> Dict[str, Any]
+        """ Parse vim script string by reusing the AST of the previous string.
+        Only top-level statements on changed lines are parsed again, and
+        positions of the following statements are shifted. The previous AST
+        is updated and returned. The whole string is parsed if the changed
+        lines cannot be parsed separately.
+        """
+        is_latest_ast = previous_ast is self._latest_ast
+        if not is_latest_ast:
+            self._statement_positions_map = {}
+
+        try:
+            removed_statements, added_statements = self._reparse_changed_statements(
+                previous_ast, previous_string.split('\n'), string.split('\n'))
+        except (IncrementalParseError, vimlparser.VimLParserException) as err:
+            logging.debug('{cls}: parse the whole string: {err}'.format(
+                cls=self.__class__.__name__,
+                err=err))
+            return self.parse_string(string)
+
+        for plugin in self.plugins:
+            plugin.process_incrementally(previous_ast, removed_statements, added_statements)
+
+        if self._build_node_index:
+            attach_node_index(previous_ast)
+
+        for removed_statement in removed_statements:
+            self._statement_positions_map.pop(id(removed_statement), None)
+
+        if not is_latest_ast:
+            # NOTE: Plugins processed the whole AST, so the cached positions are stale.
+            self._statement_positions_map = {}
+
+        self._latest_ast = previous_ast
+
+        return previous_ast
+
+
+    def _reparse_changed_statements(self, previous_ast, previous_lines, lines):
+        # type: (Dict[str, Any], List[str], List[str]) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]
+        statements = previous_ast['body']
+
+        region = find_changed_region(statements, previous_lines, lines)
+        if region is None:
+            return [], []
+
+        region_lines = lines[region.start_lnum - 1:region.end_lnum]
+        region_ast, region_reader = self._parse_lines(region_lines)
+
+        if region.start_lnum == 1:
+            start_position = {'i': 0, 'offset': 0}
+        else:
+            start_position = get_line_start_position(statements[region.start_index], lines)
+
+        following_statements = statements[region.end_index:]
+
+        # NOTE: Shift after parsing to keep the previous AST when the parsing failed.
+        if len(following_statements) > 0:
+            previous_following_position = get_line_start_position(following_statements[0], previous_lines)
+            region_offset_length = get_offset_length(region_lines)
+
+            shift_positions(self._get_statement_positions(following_statements),
+                            lnum_delta=len(lines) - len(previous_lines),
+                            i_delta=start_position['i'] + len(region_reader.buf) - previous_following_position['i'],
+                            offset_delta=start_position['offset'] + region_offset_length - previous_following_position['offset'])
+
+        added_statements = region_ast['body']
+        # NOTE: Do not cache positions of the added statements, because plugins
+        #       have not attached sub-ASTs to them yet.
+        shift_positions(collect_positions(added_statements),
+                        lnum_delta=region.start_lnum - 1,
+                        i_delta=start_position['i'],
+                        offset_delta=start_position['offset'])
+
+        removed_statements = statements[region.start_index:region.end_index]
+        statements[region.start_index:region.end_index] = added_statements
+
+        return removed_statements, added_statements
+
+
+    def _get_statement_positions(self, statements):
+        # type: (List[Dict[str, Any]]) -> List[Dict[str, int]]
+        positions = []  # type: List[Dict[str, int]]
 
-        reader = vimlparser.StringReader(lines)
-        parser = vimlparser.VimLParser(self._enable_neovim)
+        for statement in statements:
+            statement_positions = self._statement_positions_map.get(id(statement))
+
+            if statement_positions is None:
+                statement_positions = collect_positions([statement])
+                self._statement_positions_map[id(statement)] = statement_positions
+
+            positions.extend(statement_positions)
+
+        return positions
+
+
+    def _parse_lines(self, lines):  # type: (List[str]) -> Tuple[Dict[str, Any], CompactStringReader]
+        reader = CompactStringReader(lines)
+        parser = _SlottedVimLParser(self._enable_neovim)
         ast = parser.parse(reader)
 
         # TOPLEVEL does not have a pos, but we need pos for all nodes
         ast['pos'] = {'col': 1, 'i': 0, 'lnum': 1}
 
-        for plugin in self.plugins:
-            plugin.process(ast)
-
-        return ast
+        return ast, reader
 
 
     def parse_redir(self, redir_cmd):
@@ -61,10 +252,8 @@ class Parser(object):
             }
 
             # NOTE: This is a hack to parse variable node.
-            raw_ast = self.parse_string('echo ' + redir_cmd_body)
-
             # We need the left node of ECHO node
-            redir_cmd_ast = raw_ast['body'][0]['list'][0]
+            redir_cmd_ast = self._parse_echo_arguments(redir_cmd_body)[0]
 
             def adjust_position(node):
                 pos = node['pos']
@@ -96,10 +285,8 @@ class Parser(object):
             string_expr_str = string_expr_str.replace('\\"', '"')
 
         # NOTE: This is a hack to parse expr1. See :help expr1
-        raw_ast = self.parse_string('echo ' + string_expr_str)
-
         # We need the left node of ECHO node
-        parsed_string_expr_nodes = raw_ast['body'][0]['list']
+        parsed_string_expr_nodes = self._parse_echo_arguments(string_expr_str)
 
         start_pos = string_expr_node['pos']
 
@@ -119,3 +306,44 @@ class Parser(object):
             traverse(parsed_string_expr_node, on_enter=adjust_position)
 
         return parsed_string_expr_nodes
+
+
+    def _parse_echo_arguments(self, string):  # type: (str) -> List[Dict[str, Any]]
+        """ Parse the string as arguments of :echo and return copies of the
+        nodes, so callers can shift positions of them freely.
+        """
+        cache = self._sub_expression_cache
+
+        nodes = cache.pop(string, None)
+        if nodes is None:
+            ast, _ = self._parse_lines(['echo ' + string])
+
+            for plugin in self.plugins:
+                plugin.process(ast)
+
+            nodes = ast['body'][0]['list']
+
+            if len(cache) >= SUB_EXPRESSION_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        # NOTE: Re-insert to mark the expression as the most recently used.
+        cache[string] = nodes
+
+        return copy_ast(nodes)
+
+
+
+_sub_expression_parser = None  # type: Optional[Parser]
+
+
+def get_sub_expression_parser():  # type: () -> Parser
+    """ Returns the parser shared to parse expressions in strings and :redir
+    contents, so they share the cache of parsed expressions.
+    """
+    global _sub_expression_parser
+
+    if _sub_expression_parser is None:
+        _sub_expression_parser = Parser()
+
+    return _sub_expression_parser
+
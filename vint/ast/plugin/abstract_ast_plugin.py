@@ -1,3 +1,6 @@
+from vint.ast.traversing import traverse
+
+
 class AbstractASTPlugin(object):
     """ An abstract class for AST plugins. AST plugins can add attributes to
     the AST. But for maintainability reason, overwriting or deleting any
@@ -6,3 +9,21 @@ class AbstractASTPlugin(object):
 
     def process(self, ast):
         return ast
+
+
+    def process_incrementally(self, ast, removed_statements, added_statements):
+        """ Process the AST that the removed top-level statements are replaced
+        with the added statements. Plugins can override it to process only the
+        changed statements.
+        """
+        return self.process(ast)
+
+
+    def process_and_index(self, ast, node_index):
+        """ Process the AST and add all nodes of the AST to the node index,
+        including nodes that plugins attached. Plugins that traverse the whole
+        AST can override it to fill the index in the same traversal.
+        """
+        self.process(ast)
+        traverse(ast, on_enter=node_index.add)
+        return ast
@@ -1,4 +1,7 @@
+from vint.ast.traversing import traverse_by_stages
 from vint.ast.plugin.abstract_ast_plugin import AbstractASTPlugin
+from vint.ast.plugin.scope_plugin.redir_assignment_parser import RedirAssignmentParser
+from vint.ast.plugin.scope_plugin.call_node_parser import CallNodeParser
 from vint.ast.plugin.scope_plugin.reference_reachability_tester import (
     ReferenceReachabilityTester,
     is_reference_identifier as _is_reference_identifier,
@@ -35,6 +38,35 @@ class ScopePlugin(AbstractASTPlugin):
         return processed_ast
 
 
+    def process_and_index(self, ast, node_index):
+        self._ref_tester.process(ast, node_index)
+        return ast
+
+
+    def process_incrementally(self, ast, removed_statements, added_statements):
+        self._ref_tester.process_incrementally(ast, removed_statements, added_statements)
+        return ast
+
+
+    def attach_sub_expressions(self, ast, node_index=None):
+        """ Attach only the contents of string expressions and :redir
+        assignments without analyzing scopes. The contents are same as process
+        attaches, so policies that do not need scopes check the same nodes.
+        If node_index is specified, all nodes including the attached ones are
+        added to it in the same traversal.
+        """
+        stages = [
+            (RedirAssignmentParser().enter_handler, None),
+            (CallNodeParser().enter_handler, None),
+        ]
+
+        if node_index is not None:
+            stages.append((node_index.add, None))
+
+        traverse_by_stages(ast, stages)
+        return ast
+
+
     def _get_link_registry(self):
         # NOTE: This is a hack for performance. We should build LinkRegistry
         # by this method if ReferenceReachabilityTester hide the link_registry.
@@ -1,6 +1,6 @@
-from vint.ast.node_type import NodeType
-from vint.ast.traversing import traverse, register_traverser_extension
-from vint.ast.parsing import Parser
+from vint.ast.node_type import NodeType, get_node_type
+from vint.ast.traversing import traverse, register_child_node_extension
+from vint.ast.parsing import get_sub_expression_parser
 
 LAMBDA_STRING_EXPR_CONTENT = 'VINT:lambda_string_expression'
 FUNCTION_REFERENCE_STRING_EXPR_CONTENT = 'VINT:function_reference_expression'
@@ -13,29 +13,33 @@ class CallNodeParser(object):
     """ A class to make string expression in map and filter function parseable.
     """
     def process(self, ast):
-        def enter_handler(node):
-            node_type = NodeType(node['type'])
-            if node_type is not NodeType.CALL:
-                return
+        traverse(ast, on_enter=self.enter_handler)
 
-            called_function_identifier = node['left']
+        return ast
 
-            # The name node type of "map" or "filter" or "call" are always IDENTIFIER.
-            if NodeType(called_function_identifier['type']) is not NodeType.IDENTIFIER:
-                return
 
-            called_function_identifier_value = called_function_identifier.get('value')
+    def enter_handler(self, node):
+        """ Attach the parsed string expression to string arguments of the
+        node. It can be used as a stage of traverse_by_stages.
+        """
+        node_type = get_node_type(node)
+        if node_type is not NodeType.CALL:
+            return
 
-            if called_function_identifier_value in ['map', 'filter']:
-                # Analyze second argument of "map" or "filter" if the node type is STRING.
-                self._attach_string_expr_content_to_map_or_func(node)
-            elif called_function_identifier_value in ['call', 'function']:
-                # Analyze first argument of "call" or "function" if the node type is STRING.
-                self._attach_string_expr_content_to_call_or_function(node)
+        called_function_identifier = node['left']
 
-        traverse(ast, on_enter=enter_handler)
+        # The name node type of "map" or "filter" or "call" are always IDENTIFIER.
+        if get_node_type(called_function_identifier) is not NodeType.IDENTIFIER:
+            return
 
-        return ast
+        called_function_identifier_value = called_function_identifier.get('value')
+
+        if called_function_identifier_value in ['map', 'filter']:
+            # Analyze second argument of "map" or "filter" if the node type is STRING.
+            self._attach_string_expr_content_to_map_or_func(node)
+        elif called_function_identifier_value in ['call', 'function']:
+            # Analyze first argument of "call" or "function" if the node type is STRING.
+            self._attach_string_expr_content_to_call_or_function(node)
 
 
     def _attach_string_expr_content_to_map_or_func(self, map_or_func_call_node):
@@ -48,10 +52,10 @@ class CallNodeParser(object):
         string_expr_node = args[1]
 
         # We can statically analyze only STRING nodes
-        if NodeType(string_expr_node['type']) is not NodeType.STRING:
+        if get_node_type(string_expr_node) is not NodeType.STRING:
             return
 
-        parser = Parser()
+        parser = get_sub_expression_parser()
         string_expr_content_nodes = parser.parse_string_expr(string_expr_node)
 
         # Set a flag that means whether the expression is in other string literals.
@@ -65,7 +69,7 @@ class CallNodeParser(object):
         def enter_handler(node):
             # NOTE: We need this flag only string nodes, because this flag is only for
             # ProhibitUnnecessaryDoubleQuote.
-            if NodeType(node['type']) is NodeType.STRING:
+            if get_node_type(node) is NodeType.STRING:
                 node[STRING_EXPR_CONTEXT] = {
                     STRING_EXPR_CONTEXT_FLAG: True,
                 }
@@ -85,14 +89,14 @@ class CallNodeParser(object):
         # We can statically analyze only STRING node
         string_expr_node = args[0]
 
-        if NodeType(string_expr_node['type']) is not NodeType.STRING:
+        if get_node_type(string_expr_node) is not NodeType.STRING:
             return
 
-        parser = Parser()
+        parser = get_sub_expression_parser()
         string_expr_content_nodes = parser.parse_string_expr(string_expr_node)
 
         func_ref_nodes = list(filter(
-            lambda node: NodeType(node['type']) is NodeType.IDENTIFIER,
+            lambda node: get_node_type(node) is NodeType.IDENTIFIER,
             string_expr_content_nodes
         ))
 
@@ -112,14 +116,15 @@ def is_on_string_expr_context(node):
         .get(STRING_EXPR_CONTEXT_FLAG, False)
 
 
-@register_traverser_extension
-def traverse_string_expr_content(node, on_enter=None, on_leave=None):
+@register_child_node_extension([NodeType.STRING])
+def get_string_expr_content(node):
     lambda_string_expr_content_nodes = get_lambda_string_expr_content(node)
-    if lambda_string_expr_content_nodes is not None:
-        for child_node in lambda_string_expr_content_nodes:
-            traverse(child_node, on_enter=on_enter, on_leave=on_leave)
-
     func_ref_string_expr_content_nodes = get_function_reference_string_expr_content(node)
-    if func_ref_string_expr_content_nodes is not None:
-        for child_node in func_ref_string_expr_content_nodes:
-            traverse(child_node, on_enter=on_enter, on_leave=on_leave)
+
+    if lambda_string_expr_content_nodes is None:
+        return func_ref_string_expr_content_nodes
+
+    if func_ref_string_expr_content_nodes is None:
+        return lambda_string_expr_content_nodes
+
+    return lambda_string_expr_content_nodes + func_ref_string_expr_content_nodes
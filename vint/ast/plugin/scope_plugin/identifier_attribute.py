@@ -1,4 +1,5 @@
 from typing import Dict, Any, Optional  # noqa: F401
+from vint.ast.node import SlottedMapping, define_slotted_mapping  # noqa: F401
 
 
 IDENTIFIER_ATTRIBUTE = 'VINT:identifier_attribute'
@@ -13,6 +14,23 @@ IDENTIFIER_ATTRIBUTE_VARIADIC_SYMBOL_FLAG = 'is_variadic_symbol'
 IDENTIFIER_ATTRIBUTE_LAMBDA_ARGUMENT_FLAG = 'is_lambda_argument'
 IDENTIFIER_ATTRIBUTE_LAMBDA_BODY_CONTEXT = 'is_on_lambda_body'
 
+# NOTE: Identifier attributes are attached to many nodes, so they are slotted
+#       mappings that are smaller than dicts.
+_IDENTIFIER_ATTRIBUTE_FLAGS = (
+    IDENTIFIER_ATTRIBUTE_DECLARATION_FLAG,
+    IDENTIFIER_ATTRIBUTE_DYNAMIC_FLAG,
+    IDENTIFIER_ATTRIBUTE_MEMBER_FLAG,
+    IDENTIFIER_ATTRIBUTE_FUNCTION_FLAG,
+    IDENTIFIER_ATTRIBUTE_AUTOLOAD_FLAG,
+    IDENTIFIER_ATTRIBUTE_FUNCTION_ARGUMENT_FLAG,
+    IDENTIFIER_ATTRIBUTE_LAMBDA_STRING_CONTEXT,
+    IDENTIFIER_ATTRIBUTE_VARIADIC_SYMBOL_FLAG,
+    IDENTIFIER_ATTRIBUTE_LAMBDA_ARGUMENT_FLAG,
+    IDENTIFIER_ATTRIBUTE_LAMBDA_BODY_CONTEXT,
+)
+
+IdentifierAttribute = define_slotted_mapping('IdentifierAttribute', _IDENTIFIER_ATTRIBUTE_FLAGS)
+
 
 def is_identifier_like_node(node):  # type: (Dict[str, Any]) -> bool
     return IDENTIFIER_ATTRIBUTE in node
@@ -92,18 +110,11 @@ def is_on_lambda_body_context(node):  # type: (Dict[str, Any]) -> bool
 def set_identifier_attribute(node, is_on_lambda_body, is_on_lambda_str, is_declarative=None, is_dynamic=None, is_member=None, is_function=None, is_autoload=None,
         is_declarative_parameter=None, is_variadic=None, is_lambda_argument=None):
     # type: (Dict[str, Any], Optional[bool], Optional[bool], Optional[bool], Optional[bool], Optional[bool], Optional[bool], Optional[bool], Optional[bool], Optional[bool], Optional[bool]) -> None
-    id_attr = node.setdefault(IDENTIFIER_ATTRIBUTE, {
-        IDENTIFIER_ATTRIBUTE_DECLARATION_FLAG: False,
-        IDENTIFIER_ATTRIBUTE_DYNAMIC_FLAG: False,
-        IDENTIFIER_ATTRIBUTE_MEMBER_FLAG: False,
-        IDENTIFIER_ATTRIBUTE_FUNCTION_FLAG: False,
-        IDENTIFIER_ATTRIBUTE_AUTOLOAD_FLAG: False,
-        IDENTIFIER_ATTRIBUTE_FUNCTION_ARGUMENT_FLAG: False,
-        IDENTIFIER_ATTRIBUTE_LAMBDA_STRING_CONTEXT: False,
-        IDENTIFIER_ATTRIBUTE_VARIADIC_SYMBOL_FLAG: False,
-        IDENTIFIER_ATTRIBUTE_LAMBDA_ARGUMENT_FLAG: False,
-        IDENTIFIER_ATTRIBUTE_LAMBDA_BODY_CONTEXT: False
-    })
+    id_attr = node.get(IDENTIFIER_ATTRIBUTE)
+
+    if id_attr is None:
+        id_attr = _create_identifier_attribute()
+        node[IDENTIFIER_ATTRIBUTE] = id_attr
 
     if is_declarative is not None:
         id_attr[IDENTIFIER_ATTRIBUTE_DECLARATION_FLAG] = is_declarative
@@ -134,3 +145,12 @@ def set_identifier_attribute(node, is_on_lambda_body, is_on_lambda_str, is_decla
 
     if is_on_lambda_body is not None:
         id_attr[IDENTIFIER_ATTRIBUTE_LAMBDA_BODY_CONTEXT] = is_on_lambda_body
+
+
+def _create_identifier_attribute():  # type: () -> SlottedMapping
+    id_attr = IdentifierAttribute()
+
+    for flag in _IDENTIFIER_ATTRIBUTE_FLAGS:
+        id_attr[flag] = False
+
+    return id_attr
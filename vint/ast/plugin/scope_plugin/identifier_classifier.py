@@ -1,5 +1,5 @@
-from typing import List, Dict, Any  # noqa: F401
-from vint.ast.traversing import traverse, SKIP_CHILDREN
+from typing import List, Dict, Any, Optional, Set, Tuple  # noqa: F401
+from vint.ast.traversing import traverse, traverse_by_stages, SKIP_CHILDREN
 from vint.ast.plugin.scope_plugin.redir_assignment_parser import (
     RedirAssignmentParser,
     get_redir_content,
@@ -17,7 +17,7 @@ from vint.ast.plugin.scope_plugin.identifier_attribute import (
     is_declarative_identifier as _is_declarative_identifier,
     set_identifier_attribute as _set_identifier_attribute,
 )
-from vint.ast.node_type import NodeType
+from vint.ast.node_type import NodeType, get_node_type
 
 
 REFERENCING_IDENTIFIERS = 'VINT:referencing_identifiers'
@@ -84,24 +84,33 @@ class IdentifierClassifier(object):
         """
 
         def __init__(self):
-            self._static_referencing_identifiers = None  # type: List[Dict[str, Any]]
-            self._static_declaring_identifiers = None  # type: List[Dict[str, Any]]
+            self._static_referencing_identifiers = []  # type: List[Dict[str, Any]]
+            self._static_declaring_identifiers = []  # type: List[Dict[str, Any]]
 
 
         def collect_identifiers(self, ast):  # type: (Dict[str, Any]) -> CollectedIdentifiers
-            self._static_referencing_identifiers = []
-            self._static_declaring_identifiers = []
+            traverse(ast, on_enter=self.enter_handler)
+
+            return self.pop_collected_identifiers()
 
-            # TODO: Make more performance efficiency.
-            traverse(ast, on_enter=self._enter_handler)
 
-            return CollectedIdentifiers(
+        def pop_collected_identifiers(self):  # type: () -> CollectedIdentifiers
+            """ Returns identifiers that enter_handler collected, and start collecting again. """
+            collected_identifiers = CollectedIdentifiers(
                 self._static_declaring_identifiers,
                 self._static_referencing_identifiers
             )
 
+            self._static_referencing_identifiers = []
+            self._static_declaring_identifiers = []
+
+            return collected_identifiers
+
 
-        def _enter_handler(self, node):
+        def enter_handler(self, node):
+            """ Collect the node if it is a static identifier. It can be used as
+            a stage of traverse_by_stages that follows the stages of IdentifierClassifier.
+            """
             if not _is_identifier_like_node(node):
                 return
 
@@ -115,6 +124,19 @@ class IdentifierClassifier(object):
                 self._static_referencing_identifiers.append(node)
 
 
+    def __init__(self):
+        # NOTE: The stack of contexts that are pairs of is_on_lambda_body and
+        #       is_on_lambda_str with the nodes that the contexts started at.
+        self._context_stack = [(None, None, None)]  # type: List[Tuple[Optional[Dict[str, Any]], Optional[bool], Optional[bool]]]
+
+        # NOTE: Contexts of nodes that should be classified on other contexts
+        #       than their parents such as lambda bodies.
+        self._child_contexts = {}  # type: Dict[int, Tuple[Optional[bool], Optional[bool]]]
+
+        # NOTE: Nodes that were classified by their parents such as lambda arguments.
+        self._classified_node_ids = set()  # type: Set[int]
+
+
     def attach_identifier_attributes(self, ast):  # type: (Dict[str, Any]) -> Dict[str, Any]
         """ Attach 5 flags to the AST.
 
@@ -132,26 +154,51 @@ class IdentifierClassifier(object):
             string content on the 2nd argument of the map or filter function.
         - is lambda argument: True if the identifier is a lambda argument.
         """
-        redir_assignment_parser = RedirAssignmentParser()
-        ast_with_parsed_redir = redir_assignment_parser.process(ast)
+        traverse_by_stages(ast, self.get_stages())
+        return ast
 
+
+    def get_stages(self):  # type: () -> List[Tuple[Any, Any]]
+        """ Returns stages of traverse_by_stages to attach the flags. Stages
+        that depend on the flags can follow the stages in the same traversal.
+        """
+        # NOTE: Parse redir assignments and string expressions before
+        #       classifying, because the parsed nodes are also classified.
+        redir_assignment_parser = RedirAssignmentParser()
         map_and_filter_parser = CallNodeParser()
-        ast_with_parse_map_and_filter_and_redir = \
-            map_and_filter_parser.process(ast_with_parsed_redir)
 
-        traverse(
-            ast_with_parse_map_and_filter_and_redir,
-            on_enter=lambda node: self._enter_handler(
-                node,
-                is_on_lambda_str=None,
-                is_on_lambda_body=None,
-            )
+        return [
+            (redir_assignment_parser.enter_handler, None),
+            (map_and_filter_parser.enter_handler, None),
+            (self._enter_handler, self._leave_handler),
+        ]
+
+
+    def _enter_handler(self, node):
+        if id(node) in self._classified_node_ids:
+            self._classified_node_ids.remove(id(node))
+            return SKIP_CHILDREN
+
+        context = self._child_contexts.pop(id(node), None)
+        if context is not None:
+            self._context_stack.append((node,) + context)
+
+        _, is_on_lambda_body, is_on_lambda_str = self._context_stack[-1]
+
+        self._classify_node(
+            node,
+            is_on_lambda_body=is_on_lambda_body,
+            is_on_lambda_str=is_on_lambda_str,
         )
-        return ast
 
 
-    def _enter_handler(self, node, is_on_lambda_body, is_on_lambda_str):
-        node_type = NodeType(node['type'])
+    def _leave_handler(self, node):
+        if self._context_stack[-1][0] is node:
+            self._context_stack.pop()
+
+
+    def _classify_node(self, node, is_on_lambda_body, is_on_lambda_str):
+        node_type = get_node_type(node)
 
         if node_type in IdentifierTerminateNodeTypes:
             # Attach identifier attributes to all IdentifierTerminateNodeTypes.
@@ -197,7 +244,7 @@ class IdentifierClassifier(object):
             )
 
         if node_type is NodeType.LAMBDA:
-            return self._enter_lambda_node(
+            self._enter_lambda_node(
                 node,
                 is_on_lambda_str=is_on_lambda_str,
                 is_on_lambda_body=is_on_lambda_body,
@@ -205,10 +252,10 @@ class IdentifierClassifier(object):
 
 
     def _pre_mark_accessor_children(self, node, is_on_lambda_body, is_on_lambda_str):
-        node_type = NodeType(node['type'])
+        node_type = get_node_type(node)
         dict_node = node['left']
 
-        if NodeType(dict_node['type']) in AccessorLikeNodeTypes:
+        if get_node_type(dict_node) in AccessorLikeNodeTypes:
             self._pre_mark_accessor_children(
                 dict_node,
                 is_on_lambda_str=is_on_lambda_str,
@@ -222,7 +269,7 @@ class IdentifierClassifier(object):
                 if type(member_node) is list:
                     continue
 
-                if NodeType(member_node['type']) is NodeType.IDENTIFIER:
+                if get_node_type(member_node) is NodeType.IDENTIFIER:
                     # Only the identifier should be flagged as a member that
                     # the variable is an accessor for a list or dictionary.
                     # For example, the variable that is "l:end" in list[0 : l:end]
@@ -239,7 +286,7 @@ class IdentifierClassifier(object):
 
         member_node = node['right']
         if node_type is NodeType.SUBSCRIPT:
-            if NodeType(member_node['type']) is NodeType.IDENTIFIER:
+            if get_node_type(member_node) is NodeType.IDENTIFIER:
                 # Only the identifier should be flagged as a member that
                 # the variable is an accessor for a list or dictionary.
                 # For example, the variable that is "l:key" in dict[l:key]
@@ -255,7 +302,7 @@ class IdentifierClassifier(object):
 
 
     def _pre_mark_member_node(self, member_node, is_on_lambda_body, is_on_lambda_str):
-        member_node_type = NodeType(member_node['type'])
+        member_node_type = get_node_type(member_node)
 
         if member_node_type in IdentifierTerminateNodeTypes or \
                 member_node_type in AnalyzableSubScriptChildNodeTypes:
@@ -269,7 +316,7 @@ class IdentifierClassifier(object):
 
     def _enter_identifier_like_node(self, node, is_on_lambda_body, is_on_lambda_str, is_declarative=None,
                                     is_function=None, is_declarative_parameter=None):
-        node_type = NodeType(node['type'])
+        node_type = get_node_type(node)
 
         if node_type in AccessorLikeNodeTypes:
             id_like_node = node
@@ -350,7 +397,7 @@ class IdentifierClassifier(object):
 
     def _enter_identifier_terminate_node(self, id_term_node, is_on_lambda_body, is_on_lambda_str, is_declarative=None,
                                          is_function=None, is_declarative_parameter=None, is_lambda_argument=None):
-        node_type = NodeType(id_term_node['type'])
+        node_type = get_node_type(id_term_node)
 
         if node_type is NodeType.CURLYNAME:
             self._enter_curlyname_node(
@@ -380,7 +427,7 @@ class IdentifierClassifier(object):
 
     def _enter_accessor_node(self, accessor_node, is_on_lambda_body, is_on_lambda_str, is_declarative=None,
                              is_function=None, is_declarative_parameter=None):
-        accessor_node_type = NodeType(accessor_node['type'])
+        accessor_node_type = get_node_type(accessor_node)
 
         if accessor_node_type is NodeType.DOT:
             _set_identifier_attribute(
@@ -395,7 +442,7 @@ class IdentifierClassifier(object):
             return
 
         if accessor_node_type is NodeType.SUBSCRIPT:
-            subscript_right_type = NodeType(accessor_node['right']['type'])
+            subscript_right_type = get_node_type(accessor_node['right'])
 
             # We can do static analysis NodeType.SUBSCRIPT such as:
             #   let object['name'] = 0
@@ -423,7 +470,7 @@ class IdentifierClassifier(object):
                     #   list[1:] => {rlist: [node, []]}
                     continue
 
-                elem_node_type = NodeType(elem_node['type'])
+                elem_node_type = get_node_type(elem_node)
 
                 # We can do static analysis NodeType.SLICE such as:
                 #   let object[0:1] = 0
@@ -510,7 +557,7 @@ class IdentifierClassifier(object):
 
 
     def _enter_declarative_node(self, node, is_on_lambda_body, is_on_lambda_str):
-        node_type = NodeType(node['type'])
+        node_type = get_node_type(node)
 
         if node_type is NodeType.FUNCTION:
             self._enter_function_node(
@@ -569,19 +616,12 @@ class IdentifierClassifier(object):
                 is_on_lambda_body=is_on_lambda_body
             )
 
-        return SKIP_CHILDREN
-
 
     def _enter_lambda_str_expr_content_node(self, lambda_string_expr_content_nodes, is_on_lambda_body):
+        # NOTE: The content nodes are classified on the string expression
+        #       context when the traversal enters them.
         for string_expr_content_node in lambda_string_expr_content_nodes:
-            traverse(
-                string_expr_content_node,
-                on_enter=lambda node: self._enter_handler(
-                    node,
-                    is_on_lambda_str=True,
-                    is_on_lambda_body=is_on_lambda_body,
-                )
-            )
+            self._child_contexts[id(string_expr_content_node)] = (is_on_lambda_body, True)
 
 
     def _enter_func_ref_str_expr_content_node(self, func_ref_id_nodes, is_on_lambda_str, is_on_lambda_body):
@@ -593,6 +633,8 @@ class IdentifierClassifier(object):
                 is_on_lambda_body=is_on_lambda_body
             )
 
+            self._classified_node_ids.add(id(func_ref_id_node))
+
 
     def _enter_excmd_node(self, cmd_node, is_on_lambda_body, is_on_lambda_str):
         # Care an assignment by using command ":redir"
@@ -622,16 +664,9 @@ class IdentifierClassifier(object):
                 is_on_lambda_body=is_on_lambda_body,
             )
 
-        # Traversing on lambda body context.
-        traverse(
-            lambda_node['left'],
-            on_enter=lambda node: self._enter_handler(
-                node,
-                is_on_lambda_body=True,
-                is_on_lambda_str=is_on_lambda_str,
-            )
-        )
+            self._classified_node_ids.add(id(lambda_argument_node))
 
-        # NOTE: Traversing to the lambda args and children was continued by the above traversing.
-        return SKIP_CHILDREN
+        # NOTE: The lambda body is classified on the lambda body context when
+        #       the traversal enters it.
+        self._child_contexts[id(lambda_node['left'])] = (True, is_on_lambda_str)
 
@@ -1,7 +1,7 @@
-from vint.ast.traversing import traverse, register_traverser_extension
+from vint.ast.traversing import traverse, register_child_node_extension
 
-from vint.ast.parsing import Parser
-from vint.ast.node_type import NodeType
+from vint.ast.parsing import get_sub_expression_parser
+from vint.ast.node_type import NodeType, get_node_type
 
 REDIR_CONTENT = 'VINT:redir_content'
 
@@ -12,27 +12,31 @@ class RedirAssignmentParser(object):
 
 
     def process(self, ast):
-        def enter_handler(node):
-            node_type = NodeType(node['type'])
-            if node_type is not NodeType.EXCMD:
-                return
+        traverse(ast, on_enter=self.enter_handler)
 
-            is_redir_command = node['ea']['cmd'].get('name') == 'redir'
-            if not is_redir_command:
-                return
+        return ast
 
-            redir_cmd_str = node['str']
-            is_redir_assignment = '=>' in redir_cmd_str
-            if not is_redir_assignment:
-                return
 
-            parser = Parser()
-            redir_content_node = parser.parse_redir(node)
-            node[REDIR_CONTENT] = redir_content_node
+    def enter_handler(self, node):
+        """ Attach the content of the redir assignment to the node. It can be
+        used as a stage of traverse_by_stages.
+        """
+        node_type = get_node_type(node)
+        if node_type is not NodeType.EXCMD:
+            return
 
-        traverse(ast, on_enter=enter_handler)
+        is_redir_command = node['ea']['cmd'].get('name') == 'redir'
+        if not is_redir_command:
+            return
 
-        return ast
+        redir_cmd_str = node['str']
+        is_redir_assignment = '=>' in redir_cmd_str
+        if not is_redir_assignment:
+            return
+
+        parser = get_sub_expression_parser()
+        redir_content_node = parser.parse_redir(node)
+        node[REDIR_CONTENT] = redir_content_node
 
 
 def get_redir_content(node):
@@ -40,9 +44,10 @@ def get_redir_content(node):
 
 
 
-@register_traverser_extension
-def traverse_redir_content(node, on_enter=None, on_leave=None):
-    if REDIR_CONTENT not in node:
-        return
+@register_child_node_extension([NodeType.EXCMD])
+def get_redir_content_as_child_nodes(node):
+    redir_content_node = get_redir_content(node)
+    if redir_content_node is None:
+        return None
 
-    traverse(node[REDIR_CONTENT], on_enter=on_enter, on_leave=on_leave)
+    return [redir_content_node]
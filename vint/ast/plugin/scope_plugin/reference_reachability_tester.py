@@ -1,6 +1,7 @@
-from typing import Dict, Any, List, Union  # noqa: F401
+from typing import Dict, Any, List, Set, Union  # noqa: F401
 from vint.ast.plugin.scope_plugin.scope import (
     Scope,
+    ScopeVisibility,
     VariableDeclaration,
     GlobalVariableDeclaration,
     GLOBAL_VARIABLE_DECLARATION,
@@ -25,6 +26,11 @@ from vint.ast.plugin.scope_plugin.identifier_attribute import (
 REACHABILITY_FLAG = 'VINT:is_reachable'
 REFERENCED_FLAG = 'VINT:is_referenced'
 
+FunctionLikeScopeVisibilities = {
+    ScopeVisibility.FUNCTION_LOCAL: True,
+    ScopeVisibility.LAMBDA: True,
+}
+
 
 class ReferenceReachabilityTesterError(Exception):
     pass
@@ -56,29 +62,162 @@ class ReferenceReachabilityTester(object):
             return scope_tree
 
 
+    class StatementIdentifiers(object):
+        """ A class for identifiers in a top-level statement. """
+
+        def __init__(self, declarative_identifiers, referencing_identifiers):
+            # type: (List[Dict[str, Any]], List[Dict[str, Any]]) -> None
+            self.declarative_identifiers = declarative_identifiers
+            self.referencing_identifiers = referencing_identifiers
+
+            # NOTE: References that are not resolved in function scopes can be
+            #       affected by changes of other top-level statements.
+            self.outer_referencing_identifiers = []  # type: List[Dict[str, Any]]
+
+
     def __init__(self):
         self._scope_linker = ScopeLinker()  # type: ScopeLinker
+        self._processed_ast = None  # type: Union[Dict[str, Any], None]
+        self._statement_identifiers_map = {}  # type: Dict[int, ReferenceReachabilityTester.StatementIdentifiers]
 
 
-    def process(self, ast):
-        self._scope_linker.process(ast)
-
-        id_collector = IdentifierClassifier.IdentifierCollector()
-        classified_id_group = id_collector.collect_identifiers(ast)
-        dec_id_nodes = classified_id_group.statically_declared_identifiers
-        ref_id_nodes = classified_id_group.statically_referencing_identifiers
+    def process(self, ast, node_index=None):
+        self._scope_linker.process(ast, node_index)
 
         # Attach a parent_scope accessor to the scope tree
         ReferenceReachabilityTester.TwoWayScopeReferenceAttacher.attach(self._scope_linker.scope_tree)
 
+        self._processed_ast = ast
+        self._statement_identifiers_map = {}
+
+        statement_identifiers_list = self._collect_statement_identifiers(ast['body'])
+
         # Reset REFERENCED_FLAG to False
-        for dec_id_node in dec_id_nodes:
+        for statement_identifiers in statement_identifiers_list:
+            for dec_id_node in statement_identifiers.declarative_identifiers:
+                dec_id_node[REFERENCED_FLAG] = False
+
+        for statement_identifiers in statement_identifiers_list:
+            self._check_statement_references(statement_identifiers)
+
+
+    def process_incrementally(self, ast, removed_statements, added_statements):
+        # type: (Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]) -> None
+        """ Test reachabilities of the ast that the removed top-level statements
+        are replaced with the added statements. Only references in the added
+        statements and references to the outer scopes that have the same names
+        as changed identifiers are tested again.
+        """
+        if ast is not self._processed_ast:
+            self.process(ast)
+            return
+
+        self._scope_linker.process_incrementally(ast, removed_statements, added_statements)
+        ReferenceReachabilityTester.TwoWayScopeReferenceAttacher.attach(self._scope_linker.scope_tree)
+
+        removed_statement_identifiers_list = [self._statement_identifiers_map.pop(id(removed_statement))
+                                              for removed_statement in removed_statements]
+        unchanged_statement_identifiers_list = list(self._statement_identifiers_map.values())
+        added_statement_identifiers_list = self._collect_statement_identifiers(added_statements)
+
+        # NOTE: Reachabilities of references and referenced flags of declarations
+        #       only depend on identifiers that have the same name.
+        changed_names = set()
+
+        for statement_identifiers in removed_statement_identifiers_list + added_statement_identifiers_list:
+            changed_names.update(_get_variable_name(dec_id_node)
+                                 for dec_id_node in statement_identifiers.declarative_identifiers)
+
+        for statement_identifiers in removed_statement_identifiers_list:
+            changed_names.update(_get_variable_name(ref_id_node)
+                                 for ref_id_node in statement_identifiers.outer_referencing_identifiers)
+
+        # NOTE: Declarations in the global and script local scopes can be
+        #       referenced by any statements, so test them again.
+        for dec_id_node in self._get_declarative_identifiers_on_outer_scopes(changed_names):
             dec_id_node[REFERENCED_FLAG] = False
 
-        for ref_id_node in ref_id_nodes:
+        for statement_identifiers in added_statement_identifiers_list:
+            for dec_id_node in statement_identifiers.declarative_identifiers:
+                dec_id_node[REFERENCED_FLAG] = False
+
+        for statement_identifiers in added_statement_identifiers_list:
+            self._check_statement_references(statement_identifiers)
+
+        for statement_identifiers in unchanged_statement_identifiers_list:
+            for ref_id_node in statement_identifiers.outer_referencing_identifiers:
+                if _get_variable_name(ref_id_node) in changed_names:
+                    ref_id_node[REACHABILITY_FLAG] = self.check_reachability(ref_id_node)
+
+
+    def _collect_statement_identifiers(self, statements):
+        # type: (List[Dict[str, Any]]) -> List[ReferenceReachabilityTester.StatementIdentifiers]
+        statement_identifiers_list = []
+
+        for statement in statements:
+            # NOTE: The scope linker collected identifiers while linking, so
+            #       the statement is not traversed again.
+            classified_id_group = self._scope_linker.get_collected_identifiers(statement)
+            statement_identifiers = ReferenceReachabilityTester.StatementIdentifiers(
+                classified_id_group.statically_declared_identifiers,
+                classified_id_group.statically_referencing_identifiers
+            )
+
+            self._statement_identifiers_map[id(statement)] = statement_identifiers
+            statement_identifiers_list.append(statement_identifiers)
+
+        return statement_identifiers_list
+
+
+    def _check_statement_references(self, statement_identifiers):
+        # type: (ReferenceReachabilityTester.StatementIdentifiers) -> None
+        for ref_id_node in statement_identifiers.referencing_identifiers:
             is_reachable = self.check_reachability(ref_id_node)
             ref_id_node[REACHABILITY_FLAG] = is_reachable
 
+        statement_identifiers.outer_referencing_identifiers = [
+            ref_id_node for ref_id_node in statement_identifiers.referencing_identifiers
+            if not self._is_resolved_in_function_scopes(ref_id_node)
+        ]
+
+
+    def _is_resolved_in_function_scopes(self, ref_id_node):  # type: (Dict[str, Any]) -> bool
+        # NOTE: Dynamic identifiers are always reachable. See check_reachability.
+        if is_dynamic_identifier(ref_id_node):
+            return True
+
+        scope = self._scope_linker.link_registry.get_context_scope_by_identifier(ref_id_node)
+        var_name = remove_optional_scope_prefix(ref_id_node['value'])
+        is_func_id = is_function_identifier(ref_id_node)
+
+        while scope is not None and scope.scope_visibility in FunctionLikeScopeVisibilities:
+            if is_func_id and var_name in scope.functions:
+                return True
+
+            if var_name in scope.variables:
+                return True
+
+            scope = scope.parent
+
+        return False
+
+
+    def _get_declarative_identifiers_on_outer_scopes(self, names):  # type: (Set[str]) -> List[Dict[str, Any]]
+        global_scope = self._scope_linker.scope_tree
+        outer_scopes = [global_scope] + [scope for scope in global_scope.child_scopes
+                                         if scope.scope_visibility is ScopeVisibility.SCRIPT_LOCAL]
+
+        link_registry = self._scope_linker.link_registry
+        dec_id_nodes = []
+
+        for outer_scope in outer_scopes:
+            for variable_table in (outer_scope.functions, outer_scope.variables):
+                for name in names:
+                    for variable in variable_table.get(name, []):
+                        dec_id_nodes.append(link_registry.get_declarative_identifier_by_variable(variable))
+
+        return dec_id_nodes
+
 
     def get_objective_scope_visibility(self, decl_or_ref_id_node):  # type: (Dict[str, Any]) -> ScopeVisibilityHint
         """ Returns a objective scope visibility by a declarative identifier node or a reference identifier node. """
@@ -222,3 +361,8 @@ def is_declarative_identifier(node):
 
 def is_referenced_declarative_identifier(node):
     return node.get(REFERENCED_FLAG, False)
+
+
+def _get_variable_name(decl_or_ref_id_node):  # type: (Dict[str, Any]) -> str
+    # NOTE: Variables are registered to scopes by the name without optional scope prefixes.
+    return remove_optional_scope_prefix(decl_or_ref_id_node['value'])
@@ -4,7 +4,7 @@ from vint.ast.plugin.scope_plugin.scope import (
     ExplicityOfScopeVisibility,
     Scope,
 )
-from vint.ast.node_type import NodeType
+from vint.ast.node_type import NodeType, get_node_type
 from vint.ast.dictionary.builtins import (
     BuiltinVariablesCanHaveImplicitScope,
     BuiltinFunctions,
@@ -69,7 +69,7 @@ IdentifierLikeNodeTypes = {
 def is_builtin_variable(id_node):  # type: (Dict[str, Any]) -> bool
     """ Whether the specified node is a builtin identifier. """
     # Builtin variables are always IDENTIFIER.
-    if NodeType(id_node['type']) is not NodeType.IDENTIFIER:
+    if get_node_type(id_node) is not NodeType.IDENTIFIER:
         return False
 
     id_value = id_node['value']
@@ -95,7 +95,7 @@ def is_builtin_function(id_node):  # type: (Dict[str, Any]) -> bool
     The given identifier should be a child node of NodeType.CALL.
     """
     # Builtin functions are always IDENTIFIER.
-    if NodeType(id_node['type']) is not NodeType.IDENTIFIER:
+    if get_node_type(id_node) is not NodeType.IDENTIFIER:
         return False
 
     id_value = id_node['value']
@@ -151,7 +151,7 @@ def detect_possible_scope_visibility(node, context_scope):  # type: (Dict[str, A
     """ Returns a *possible* variable visibility by the specified node.
     The "possible" means that we can not determine a scope visibility of lambda arguments until reachability check.
     """
-    node_type = NodeType(node['type'])
+    node_type = get_node_type(node)
 
     if not is_analyzable_identifier(node):
         return ScopeVisibilityHint(
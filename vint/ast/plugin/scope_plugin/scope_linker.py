@@ -1,6 +1,7 @@
-from typing import Dict, Any, Union, Optional  # noqa: F401
-from vint.ast.traversing import traverse, SKIP_CHILDREN
-from vint.ast.node_type import NodeType
+from typing import Dict, Any, List, Union, Optional, Set, Tuple  # noqa: F401
+from vint.ast.traversing import traverse, traverse_by_stages, SKIP_CHILDREN
+from vint.ast.node_type import NodeType, get_node_type
+from vint.ast.node_index import NodeIndex  # noqa: F401
 from vint.ast.plugin.scope_plugin.identifier_syntax import remove_optional_scope_prefix
 from vint.ast.plugin.scope_plugin.scope import Scope, VariableDeclaration
 from vint.ast.plugin.scope_plugin.scope_detector import (
@@ -12,7 +13,10 @@ from vint.ast.plugin.scope_plugin.scope_detector import (
     is_builtin_variable,
     is_function_identifier,
 )
-from vint.ast.plugin.scope_plugin.identifier_classifier import IdentifierClassifier
+from vint.ast.plugin.scope_plugin.identifier_classifier import (
+    IdentifierClassifier,
+    CollectedIdentifiers,
+)
 
 
 DeclarativeNodeTypes = {
@@ -49,17 +53,56 @@ class ScopeLinker(object):
 
         def __init__(self):
             self.link_registry = ScopeLinker.ScopeLinkRegistry()
+            self._journal = None  # type: Optional[ScopeLinker.StatementJournal]
 
             global_scope = Scope(ScopeVisibility.GLOBAL_LIKE)
             self._scope_stack = [global_scope]
             self._add_symbol_table_variables(global_scope)
 
 
+        def start_journal(self, statement):  # type: (Dict[str, Any]) -> None
+            """ Start recording what the top-level statement adds to the scope tree. """
+            self._journal = ScopeLinker.StatementJournal(statement)
+
+
+        def stop_journal(self):  # type: () -> ScopeLinker.StatementJournal
+            journal = self._journal
+            self._journal = None
+            return journal
+
+
+        def revert(self, journal):  # type: (ScopeLinker.StatementJournal) -> None
+            """ Remove what the top-level statement added to the scope tree. """
+            for parent_scope, child_scope in journal.child_scopes:
+                parent_scope.child_scopes = [scope for scope in parent_scope.child_scopes
+                                             if scope is not child_scope]
+
+            for variable_table, variable_name, variable in journal.variables:
+                same_name_variables = [same_name_variable
+                                       for same_name_variable in variable_table.get(variable_name, [])
+                                       if same_name_variable is not variable]
+
+                if len(same_name_variables) > 0:
+                    variable_table[variable_name] = same_name_variables
+                else:
+                    variable_table.pop(variable_name, None)
+
+                self.link_registry.unlink_variable(variable)
+
+            for id_node in journal.linked_identifiers:
+                self.link_registry.unlink_identifier(id_node)
+
+
         def enter_new_scope(self, scope_visibility):  # type: (ScopeVisibility) -> None
             current_scope = self.get_current_scope()
             new_scope = Scope(scope_visibility)
             self._add_symbol_table_variables(new_scope)
 
+            # NOTE: Scopes in the new scope are removed with the new scope, so
+            #       only scopes that are children of the script local scope are recorded.
+            if self._journal is not None and current_scope is self.get_script_local_scope():
+                self._journal.child_scopes.append((current_scope, new_scope))
+
             # Build a lexical scope chain
             current_scope.child_scopes.append(new_scope)
             self._scope_stack.append(new_scope)
@@ -169,7 +212,7 @@ class ScopeLinker(object):
         def handle_referencing_identifier_found(self, node):  # type: (Dict[str, Any]) -> None
             current_scope = self.get_current_scope()
 
-            self.link_registry.link_identifier_to_context_scope(node, current_scope)
+            self._link_identifier_to_context_scope(node, current_scope)
 
 
         def _add_parameter(self, objective_scope, id_node, is_explicit_lambda_argument):
@@ -275,10 +318,20 @@ class ScopeLinker(object):
             same_name_variables = objective_variable_list.setdefault(variable_name, [])
             same_name_variables.append(variable)
 
+            if self._journal is not None:
+                self._journal.variables.append((objective_variable_list, variable_name, variable))
+
             self.link_registry.link_variable_to_declarative_identifier(variable, node)
 
             current_scope = self.get_current_scope()
-            self.link_registry.link_identifier_to_context_scope(node, current_scope)
+            self._link_identifier_to_context_scope(node, current_scope)
+
+
+        def _link_identifier_to_context_scope(self, node, scope):  # type: (Dict[str, Any], Scope) -> None
+            if self._journal is not None:
+                self._journal.linked_identifiers.append(node)
+
+            self.link_registry.link_identifier_to_context_scope(node, scope)
 
 
 
@@ -316,32 +369,113 @@ class ScopeLinker(object):
             return self._ids_to_scopes_map.get(node_id)
 
 
+        def unlink_variable(self, variable):  # type: (VariableDeclaration) -> None
+            self._vars_to_declarative_ids_map.pop(id(variable), None)
+
+
+        def unlink_identifier(self, decl_or_ref_id_node):  # type: (Dict[str, Any]) -> None
+            self._ids_to_scopes_map.pop(id(decl_or_ref_id_node), None)
+
+
+
+    class StatementJournal(object):
+        """ A class for records of what a top-level statement added to the
+        scope tree. It is used to remove the statement from the scope tree
+        without building the whole tree again. It also keeps identifiers that
+        were collected from the statement.
+        """
+
+        def __init__(self, statement):  # type: (Dict[str, Any]) -> None
+            self.statement = statement
+            self.child_scopes = []  # type: List[Tuple[Scope, Scope]]
+            self.variables = []  # type: List[Tuple[Dict[str, List[VariableDeclaration]], str, VariableDeclaration]]
+            self.linked_identifiers = []  # type: List[Dict[str, Any]]
+            self.collected_identifiers = None  # type: Optional[CollectedIdentifiers]
+
+
     def __init__(self):
         self.scope_tree = None  # type: Union[Scope, None]
         self.link_registry = None  # type: ScopeLinker.ScopeLinkRegistry
 
-        self._scope_tree_builder = ScopeLinker.ScopeTreeBuilder()
+        self._scope_tree_builder = None  # type: Union[ScopeLinker.ScopeTreeBuilder, None]
+        self._journals = {}  # type: Dict[int, ScopeLinker.StatementJournal]
+        self._handled_node_ids = set()  # type: Set[int]
+        self._function_nodes_by_name_id = {}  # type: Dict[int, Dict[str, Any]]
 
 
-    def process(self, ast):  # type: (Dict[str, Any]) -> None
+    def process(self, ast, node_index=None):  # type: (Dict[str, Any], Optional[NodeIndex]) -> None
         """ Build a scope tree and links between scopes and identifiers by the
         specified ast. You can access the built scope tree and the built links
-        by .scope_tree and .link_registry.
+        by .scope_tree and .link_registry. If node_index is specified, all
+        nodes of the ast are added to it in the same traversal.
         """
-        id_classifier = IdentifierClassifier()
-        attached_ast = id_classifier.attach_identifier_attributes(ast)
+        # NOTE: Build a scope tree for each AST. Otherwise, scopes and links of
+        #       the previous ASTs leak into the next one when the linker is reused.
+        self._scope_tree_builder = ScopeLinker.ScopeTreeBuilder()
+        self._journals = {}
 
         # We are already in script local scope.
         self._scope_tree_builder.enter_new_scope(ScopeVisibility.SCRIPT_LOCAL)
 
-        traverse(attached_ast,
-                 on_enter=self._enter_handler,
-                 on_leave=self._leave_handler)
+        if node_index is not None:
+            node_index.add(ast)
+
+        self._link_statements(ast['body'], node_index)
 
         self.scope_tree = self._scope_tree_builder.get_global_scope()
         self.link_registry = self._scope_tree_builder.link_registry
 
 
+    def process_incrementally(self, ast, removed_statements, added_statements):
+        # type: (Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]) -> None
+        """ Update the scope tree and the links for the ast that the removed
+        top-level statements are replaced with the added statements.
+        The ast must be processed by this linker before.
+        """
+        for removed_statement in removed_statements:
+            journal = self._journals.pop(id(removed_statement))
+            self._scope_tree_builder.revert(journal)
+
+        # NOTE: Identifier attributes only depend on the statement, so attach
+        #       them to only the added statements.
+        self._link_statements(added_statements)
+
+
+    def get_collected_identifiers(self, statement):  # type: (Dict[str, Any]) -> CollectedIdentifiers
+        """ Returns static identifiers in the top-level statement that were
+        collected while linking.
+        """
+        return self._journals[id(statement)].collected_identifiers
+
+
+    def _link_statements(self, statements, node_index=None):
+        # type: (List[Dict[str, Any]], Optional[NodeIndex]) -> None
+        id_classifier = IdentifierClassifier()
+        id_collector = IdentifierClassifier.IdentifierCollector()
+
+        # NOTE: Attach identifier attributes, link identifiers and collect
+        #       identifiers in one traversal. Each stage depends on the attributes
+        #       that the previous stages attached to the node and its ancestors.
+        stages = id_classifier.get_stages() + [
+            (self._enter_handler, self._leave_handler),
+            (id_collector.enter_handler, None),
+        ]
+
+        # NOTE: The index stage follows the stages that attach sub-expressions,
+        #       so the attached nodes are also indexed.
+        if node_index is not None:
+            stages.append((node_index.add, None))
+
+        for statement in statements:
+            self._scope_tree_builder.start_journal(statement)
+
+            traverse_by_stages(statement, stages)
+
+            journal = self._scope_tree_builder.stop_journal()
+            journal.collected_identifiers = id_collector.pop_collected_identifiers()
+            self._journals[id(statement)] = journal
+
+
     def _find_variable_like_nodes(self, node):  # type: (Dict[str, Any]) -> None
         if not is_analyzable_identifier(node):
             return
@@ -353,21 +487,27 @@ class ScopeLinker(object):
         self._scope_tree_builder.handle_referencing_identifier_found(node)
 
 
-    def _enter_handler(self, node):  # type: (Dict[str, Any]) -> None
-        node_type = NodeType(node['type'])
+    def _enter_handler(self, node):  # type: (Dict[str, Any]) -> Optional[str]
+        # NOTE: Function names and parameters were handled when entering the function.
+        if id(node) in self._handled_node_ids:
+            self._handled_node_ids.remove(id(node))
+            return SKIP_CHILDREN
+
+        node_type = get_node_type(node)
 
         if node_type is NodeType.FUNCTION:
-            return self._handle_function_node(node)
+            self._handle_function_node(node)
         elif node_type is NodeType.LAMBDA:
-            return self._handle_lambda_node(node)
+            self._handle_lambda_node(node)
+        else:
+            self._find_variable_like_nodes(node)
 
-        self._find_variable_like_nodes(node)
+        return None
 
 
     def _handle_function_node(self, func_node):  # type: (Dict[str, Any]) -> None
-        # We should interrupt traversing, because a node of the function
-        # name should be added to the parent scope before the current
-        # scope switched to a new scope of the function.
+        # A node of the function name should be added to the parent scope
+        # before the current scope switched to a new scope of the function.
         # We approach to it by the following 5 steps.
         #   1. Add the function to the current scope
         #   2. Create a new scope of the function
@@ -375,9 +515,15 @@ class ScopeLinker(object):
         #   4. Add parameters to the new scope
         #   5. Add variables in the function body to the new scope
 
-        # 1. Add the function to the current scope
+        # 1. The function will be added to the current scope by traversing the
+        #    function name, and then the other steps follow when leaving it.
+        #    Identifier attributes of the function name are attached on the
+        #    traversal, so it cannot be handled here.
+        self._function_nodes_by_name_id[id(func_node['left'])] = func_node
+
+
+    def _handle_function_name_left(self, func_node):  # type: (Dict[str, Any]) -> None
         func_name_node = func_node['left']
-        traverse(func_name_node, on_enter=self._find_variable_like_nodes)
 
         # 2. Create a new scope of the function
         # 3. The current scope point to the new scope
@@ -394,6 +540,8 @@ class ScopeLinker(object):
                 # the param_node type is always NodeType.IDENTIFIER
                 self._scope_tree_builder.handle_new_parameter_found(param_node, is_lambda_argument=False)
 
+            self._handled_node_ids.add(id(param_node))
+
         # We can always access a:0, a:000
         self._scope_tree_builder.handle_new_parameters_list_and_length_found()
 
@@ -414,24 +562,17 @@ class ScopeLinker(object):
         # the function is a member of a dict. See :help self
         is_declared_with_dict = (
             attr["dict"] != 0
-            or NodeType(func_name_node["type"])
+            or get_node_type(func_name_node)
             in FunctionNameNodesDeclaringVariableSelf
         )
         if is_declared_with_dict:
             self._scope_tree_builder.handle_new_dict_parameter_found()
 
-        # 5. Add variables in the function body to the new scope
-        func_body_nodes = func_node['body']
-        for func_body_node in func_body_nodes:
-            traverse(func_body_node,
-                     on_enter=self._enter_handler,
-                     on_leave=self._leave_handler)
-
-        # Skip child nodes traversing
-        return SKIP_CHILDREN
+        # 5. Variables in the function body will be added to the new scope
+        #    by traversing children.
 
 
-    def _handle_lambda_node(self, lambda_node):  # type: (Dict[str, Any]) -> Optional[str]
+    def _handle_lambda_node(self, lambda_node):  # type: (Dict[str, Any]) -> None
         # This method do the following 4 steps:
         #   1. Create a new scope of the lambda
         #   2. The current scope point to the new scope
@@ -452,6 +593,8 @@ class ScopeLinker(object):
                 # the param_node type is always NodeType.IDENTIFIER
                 self._scope_tree_builder.handle_new_parameter_found(param_node, is_lambda_argument=True)
 
+            self._handled_node_ids.add(id(param_node))
+
         # We can access a:0 and a:000 when the number of arguments is less than actual parameters.
         self._scope_tree_builder.handle_new_parameters_list_and_length_found()
 
@@ -464,17 +607,17 @@ class ScopeLinker(object):
 
         self._scope_tree_builder.handle_new_index_parameters_found(lambda_args_len)
 
-        # 4. Add variables in the function body to the new scope
-        traverse(lambda_node['left'],
-                 on_enter=self._enter_handler,
-                 on_leave=self._leave_handler)
-
-        # Skip child nodes traversing
-        return SKIP_CHILDREN
+        # 4. Variables in the lambda body will be added to the new scope by
+        #    traversing children.
 
 
     def _leave_handler(self, node):  # type: (Dict[str, Any]) -> None
-        node_type = NodeType(node['type'])
+        func_node = self._function_nodes_by_name_id.pop(id(node), None)
+        if func_node is not None:
+            self._handle_function_name_left(func_node)
+            return
+
+        node_type = get_node_type(node)
 
         if node_type is NodeType.FUNCTION:
             self._scope_tree_builder.leave_current_scope()
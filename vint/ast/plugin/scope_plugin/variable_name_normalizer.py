@@ -1,5 +1,5 @@
 from typing import Dict, Any, Optional  # noqa: F401
-from vint.ast.node_type import NodeType
+from vint.ast.node_type import NodeType, get_node_type
 from vint.ast.plugin.scope_plugin.scope import (
     ScopeVisibility,
     ExplicityOfScopeVisibility,
@@ -31,7 +31,7 @@ def normalize_variable_name(node, reachability_tester):
     - the node is named dynamically
     """
 
-    node_type = NodeType(node['type'])
+    node_type = get_node_type(node)
 
     if not is_analyzable_identifier(node):
         return None
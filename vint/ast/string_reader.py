@@ -0,0 +1,175 @@
+from typing import List  # noqa: F401
+import re
+import bisect
+from array import array
+from vint._bundles import vimlparser
+from vint._bundles.vimlparser import viml_len
+from vint.ast.node import Position
+
+
+# NOTE: The same pattern as vimlparser.StringReader uses to join lines.
+_LINE_CONTINUATION_PATTERN = re.compile(r'^\s*\\')
+
+_EOL = '\n'
+
+
+class CompactStringReader(vimlparser.StringReader):
+    """ A StringReader that keeps the source as one string instead of a list
+    of characters, and computes positions lazily from segments. A segment is
+    the characters of one physical line, so a line continued by backslashes
+    has a segment for each physical line.
+
+    It returns the same characters and positions as vimlparser.StringReader
+    except that positions are slotted mappings. The buf attribute is the
+    joined string, where "\\n" stands for "<EOL>".
+    """
+    def __init__(self, lines):  # type: (List[str]) -> None
+        chunks = []  # type: List[str]
+
+        # NOTE: Segments are sorted by their indices in buf. Columns and offsets
+        #       count bytes like vimlparser.StringReader does.
+        self._segment_indices = array('l')
+        self._segment_lnums = array('l')
+        self._segment_cols = array('l')
+        self._segment_offsets = array('l')
+        self._segment_is_ascii = array('b')
+
+        index = 0
+        offset = 0
+        lnum = 0
+        lines_count = len(lines)
+
+        while lnum < lines_count:
+            line = lines[lnum]
+            line_length = viml_len(line)
+            self._add_segment(index, lnum + 1, 1, offset, line_length == len(line))
+
+            chunks.append(line)
+            index += len(line)
+            offset += line_length
+            last_line_length = line_length
+            is_continued = False
+
+            while lnum + 1 < lines_count and _LINE_CONTINUATION_PATTERN.match(lines[lnum + 1]):
+                continued_line = lines[lnum + 1]
+                continued_line_length = viml_len(continued_line)
+
+                # NOTE: Characters until the first backslash are skipped.
+                skipped = continued_line[:continued_line.index('\\') + 1]
+                skipped_length = viml_len(skipped)
+
+                self._add_segment(index, lnum + 2, skipped_length + 1, offset + skipped_length,
+                                  continued_line_length == len(continued_line))
+
+                chunks.append(continued_line[len(skipped):])
+                index += len(continued_line) - len(skipped)
+                offset += continued_line_length + 1
+                last_line_length = continued_line_length
+                is_continued = True
+                lnum += 1
+
+            # NOTE: <EOL> is at the end of the last segment, but the offset of
+            #       <EOL> after continued lines counts the last newline.
+            if is_continued:
+                self._add_segment(index, lnum + 1, last_line_length + 1, offset, True)
+
+            chunks.append(_EOL)
+            index += 1
+            offset += 1
+            lnum += 1
+
+        self.buf = ''.join(chunks)
+        self._eof_lnum = lnum + 1
+        self._eof_offset = offset
+        self.i = 0
+
+
+    def _add_segment(self, index, lnum, col, offset, is_ascii):
+        # type: (int, int, int, int, bool) -> None
+        self._segment_indices.append(index)
+        self._segment_lnums.append(lnum)
+        self._segment_cols.append(col)
+        self._segment_offsets.append(offset)
+        self._segment_is_ascii.append(1 if is_ascii else 0)
+
+
+    def p(self, i):
+        if self.i >= len(self.buf):
+            return '<EOF>'
+        return _to_token(self.buf[self.i + i])
+
+
+    def peek(self):
+        if self.i >= len(self.buf):
+            return '<EOF>'
+        return _to_token(self.buf[self.i])
+
+
+    def get(self):
+        if self.i >= len(self.buf):
+            return '<EOF>'
+        self.i += 1
+        return _to_token(self.buf[self.i - 1])
+
+
+    def peekn(self, n):
+        return self._read(n)
+
+
+    def getn(self, n):
+        r = self._read(n)
+        self.i += len(r)
+        return r
+
+
+    def _read(self, n):  # type: (int) -> str
+        """ Returns at most n characters before <EOL>, or all of them if n is negative. """
+        if self.i >= len(self.buf):
+            return ''
+
+        if n < 0:
+            end = self.buf.find(_EOL, self.i)
+            return self.buf[self.i:end if end >= 0 else len(self.buf)]
+
+        r = self.buf[self.i:self.i + n]
+        end = r.find(_EOL)
+        return r if end < 0 else r[:end]
+
+
+    def getstr(self, begin, end):
+        # NOTE: <EOL> is converted to "\n", so it is the same as a slice.
+        return self.buf[begin.i:max(begin.i, end.i)]
+
+
+    def getpos(self):
+        i = self.i
+        pos = Position()
+        pos.i = i
+
+        if i == len(self.buf):
+            pos.lnum = self._eof_lnum
+            pos.col = 0
+            pos.offset = self._eof_offset
+            return pos
+
+        segment = bisect.bisect_right(self._segment_indices, i) - 1
+        segment_index = self._segment_indices[segment]
+
+        if self._segment_is_ascii[segment]:
+            width = i - segment_index
+        else:
+            width = viml_len(self.buf[segment_index:i])
+
+        offset = self._segment_offsets[segment] + width
+
+        pos.lnum = self._segment_lnums[segment]
+        pos.col = self._segment_cols[segment] + width
+        # NOTE: Share the int object with the index if they are equal, because
+        #       they are equal until the first multibyte character.
+        pos.offset = i if offset == i else offset
+        return pos
+
+
+
+def _to_token(c):  # type: (str) -> str
+    return '<EOL>' if c == _EOL else c
@@ -1,4 +1,5 @@
-from vint.ast.node_type import NodeType
+from typing import Dict, Any, List, Optional, Tuple, Callable  # noqa: F401
+from vint.ast.node_type import NodeType, create_node_type_table
 
 SKIP_CHILDREN = 'SKIP_CHILDREN'
 
@@ -222,39 +223,167 @@ class UnknownNodeTypeException(BaseException):
 
 _traverser_extensions = []
 
+# NOTE: Functions that return extended child nodes by node type values.
+_child_node_extensions = {}  # type: Dict[int, List[Callable[[Dict[str, Any]], Optional[List[Dict[str, Any]]]]]]
+
 
 def register_traverser_extension(handler):
     """ Registers the specified function to traverse into extended child nodes.
+    The function is called on every node, so register_child_node_extension
+    is faster if the extended child nodes are only on the known node types.
     """
     _traverser_extensions.append(handler)
 
 
+def register_child_node_extension(node_types):
+    """ Returns a decorator to register the function that returns extended
+    child nodes of the specified node types (or None if nothing). The child
+    nodes are traversed after the other child nodes.
+    """
+    def decorator(get_child_nodes):
+        for node_type in node_types:
+            _child_node_extensions.setdefault(node_type.value, []).append(get_child_nodes)
+
+        return get_child_nodes
+
+    return decorator
+
+
+_NODE = 0
+_LIST = 1
+_NESTED_LIST = 2
+
+_ACCESSOR_KINDS = {
+    call_if_def: _NODE,
+    for_each: _LIST,
+    for_each_deeply: _NESTED_LIST,
+}
+
+# NOTE: Plans to get child nodes in a table indexed by values of node types.
+#       A plan is a tuple of property names and accessor kinds, so traverse
+#       looks up nothing else.
+_CHILD_NODE_PLANS = create_node_type_table(dict(
+    (node_type, tuple((child_type['property_name'], _ACCESSOR_KINDS[child_type['accessor']])
+                      for child_type in child_types))
+    for node_type, child_types in ChildNodeAccessorMap.items()
+))  # type: Tuple[Optional[Tuple[Tuple[str, int], ...]], ...]
+
+_ENTER = 0
+_LEAVE = 1
+_EXTEND = 2
+
+
 def traverse(node, on_enter=None, on_leave=None):
     """ Traverses the specified Vim script AST node (depth first order).
     The on_enter/on_leave handler will be called with the specified node and
     the children. You can skip traversing child nodes by returning
     SKIP_CHILDREN.
     """
-    node_type = NodeType(node['type'])
+    # NOTE: Traverse by the explicit stack instead of recursive calls, because
+    #       deeply nested expressions exceed the recursion limit.
+    stack = [(_ENTER, node)]
+
+    while stack:
+        action, node = stack.pop()
+
+        if action == _LEAVE:
+            on_leave(node)
+            continue
+
+        if action == _EXTEND:
+            for handler in _traverser_extensions:
+                handler(node, on_enter=on_enter, on_leave=on_leave)
+            continue
+
+        node_type = node['type']
+
+        try:
+            # NOTE: Negative values should not index the table from the end.
+            child_node_plan = _CHILD_NODE_PLANS[node_type] if node_type >= 0 else None
+        except (IndexError, TypeError):
+            # NOTE: Hand-made nodes can have NodeType instead of the value.
+            if not isinstance(node_type, NodeType):
+                raise UnknownNodeTypeException(node_type)
+
+            node_type = node_type.value
+            child_node_plan = _CHILD_NODE_PLANS[node_type]
+
+        if child_node_plan is None:
+            raise UnknownNodeTypeException(node_type)
+
+        if on_leave is not None:
+            stack.append((_LEAVE, node))
+
+        if on_enter is not None and on_enter(node) is SKIP_CHILDREN:
+            continue
+
+        if len(_traverser_extensions) > 0:
+            stack.append((_EXTEND, node))
+
+        child_nodes = _get_child_nodes(node, child_node_plan)
+
+        for get_child_nodes in _child_node_extensions.get(node_type, ()):
+            extended_child_nodes = get_child_nodes(node)
+
+            if extended_child_nodes is not None:
+                child_nodes.extend(extended_child_nodes)
+
+        stack.extend((_ENTER, child_node) for child_node in reversed(child_nodes))
+
+
+def _get_child_nodes(node, child_node_plan):
+    # type: (Dict[str, Any], Tuple[Tuple[str, int], ...]) -> List[Dict[str, Any]]
+    child_nodes = []
+
+    for property_name, accessor_kind in child_node_plan:
+        value = node[property_name]
+
+        # NOTE: VimLParser return an empty array if a child node is not defined.
+        if accessor_kind == _NODE:
+            if hasattr(value, 'type'):
+                child_nodes.append(value)
+        elif accessor_kind == _LIST:
+            child_nodes.extend(child_node for child_node in value if hasattr(child_node, 'type'))
+        else:
+            for nested_value in value:
+                child_nodes.extend(child_node for child_node in nested_value if hasattr(child_node, 'type'))
+
+    return child_nodes
+
+
+def traverse_by_stages(node, stages):
+    """ Traverses the specified Vim script AST node once for the stages.
+    A stage is a pair of on_enter and on_leave handlers (either can be None).
+    Handlers of the stages are called in the order on each node, so a stage
+    can depend on what the previous stages did on the node and its ancestors.
+    A stage can skip traversing child nodes by returning SKIP_CHILDREN, and it
+    does not affect the other stages.
+    """
+    staged_handlers = _StagedHandlers(stages)
+    traverse(node, on_enter=staged_handlers.on_enter, on_leave=staged_handlers.on_leave)
+
+
+class _StagedHandlers(object):
+    def __init__(self, stages):
+        # NOTE: The stack of the stages that entered each node on the path and
+        #       the stages that should enter the children of the node.
+        self._stages_stack = [(None, list(stages))]
+
 
-    if node_type not in ChildNodeAccessorMap:
-        raise UnknownNodeTypeException(node_type)
+    def on_enter(self, node):
+        _, stages = self._stages_stack[-1]
+        child_stages = [stage for stage in stages
+                        if stage[0] is None or stage[0](node) is not SKIP_CHILDREN]
 
-    if on_enter:
-        should_traverse_children = on_enter(node) is not SKIP_CHILDREN
-    else:
-        should_traverse_children = True
+        self._stages_stack.append((stages, child_stages))
 
-    if should_traverse_children:
-        for property_accessor in ChildNodeAccessorMap[node_type]:
-            accessor_func = property_accessor['accessor']
-            prop_name = property_accessor['property_name']
+        if len(child_stages) == 0:
+            return SKIP_CHILDREN
 
-            accessor_func(lambda child_node: traverse(child_node, on_enter, on_leave),
-                          node[prop_name])
 
-        for handler in _traverser_extensions:
-            handler(node, on_enter=on_enter, on_leave=on_leave)
+    def on_leave(self, node):
+        stages, _ = self._stages_stack.pop()
 
-    if on_leave:
-        on_leave(node)
+        for _, on_leave in stages:
+            if on_leave is not None:
+                on_leave(node)
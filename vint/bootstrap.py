@@ -1,8 +1,8 @@
 import importlib
-import pkgutil
 from pathlib import Path
 
 from vint.linting.cli import start_cli
+from vint.linting.policy_registry import register_policies_by_manifest
 import logging
 
 
@@ -14,7 +14,11 @@ def init_logger():
 
 
 def init_linter():
-    import_all_policies()
+    """ Register policies by the policy manifest. Policy modules are imported
+    only when the policies are enabled.
+    """
+    from vint.linting.policy_manifest import POLICY_MANIFEST
+    register_policies_by_manifest(POLICY_MANIFEST)
 
 
 def init_cli():
@@ -29,6 +33,8 @@ def import_all_policies():
       2. In policy module, register itself by using vint.linting.policy_registry
       3. After all policies registered by itself, we can get policy classes
     """
+    import pkgutil
+
     pkg_name = _get_policy_package_name_for_test()
     pkg_path_list = pkg_name.split('.')
 
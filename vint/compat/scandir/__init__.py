@@ -0,0 +1,24 @@
+try:
+    # 3.5 and later
+    from os import scandir  # noqa: F401
+except ImportError:
+    import os
+
+    class _DirEntry(object):
+        """ A minimal os.DirEntry that stats the path on each call. """
+        def __init__(self, dir_path, name):
+            self.name = name
+            self.path = os.path.join(dir_path, name)
+
+
+        def is_dir(self):
+            return os.path.isdir(self.path)
+
+
+        def is_file(self):
+            return os.path.isfile(self.path)
+
+
+
+    def scandir(path='.'):
+        return iter([_DirEntry(path, name) for name in os.listdir(path)])
@@ -1,4 +1,3 @@
-import chardet
 from typing import Optional, Dict, Any  # noqa: F401
 
 
@@ -16,6 +15,10 @@ class DecodingStrategy(object):
 class DecodingStrategyByChardet(DecodingStrategy):
     def decode(self, bytes_seq, debug_hint):
         # type: (bytes, Dict[str, Any]) -> Optional[str]
+        # NOTE: chardet is slow to import and it is rarely needed because
+        #       most files are encoded in UTF-8.
+        import chardet
+
         encoding_hint = chardet.detect(bytearray(bytes_seq))
         encoding = encoding_hint['encoding']
 
@@ -1,11 +1,13 @@
-from typing import Dict, Any, List  # noqa: F401
+from typing import Dict, Any, List, Optional, Set, Tuple, Iterator, Iterable, TYPE_CHECKING  # noqa: F401
 import sys
-from argparse import ArgumentParser
+import itertools
+from collections import deque
+from argparse import ArgumentParser, ArgumentTypeError
 from pathlib import Path
 import logging
 
-from vint.linting.linter import Linter
 from vint.linting.env import build_environment
+from vint.linting.file_filter import find_vim_script, filter_vim_script
 from vint.linting.config.config_container import ConfigContainer
 from vint.linting.config.config_cmdargs_source import ConfigCmdargsSource
 from vint.linting.config.config_default_source import ConfigDefaultSource
@@ -19,51 +21,141 @@ from vint.linting.lint_target import (
     CachedLintTarget,
 )
 from vint.linting.policy_set import PolicySet
+from vint.linting.lint_result_cache import LintResultCache, LintCacheStats, DEFAULT_MAX_CACHE_SIZE
 from vint.linting.formatter.abstract_formatter import AbstractFormatter
 from vint.linting.policy_registry import get_policy_classes
 from vint.linting.formatter.formatter import Formatter
 from vint.linting.formatter.json_formatter import JSONFormatter
+from vint.linting.formatter.json_lines_formatter import JSONLinesFormatter
 from vint.linting.formatter.statistic_formatter import StatisticFormatter
 
+# NOTE: The linter imports the parser that is slow to import, so it is
+#       imported only when linting. Then --version or --help start fast.
+if TYPE_CHECKING:
+    from vint.linting.linter import Linter  # noqa: F401
+
 _stdin_symbol = Path('-')
+_FILES_FROM_CHUNK_SIZE = 64 * 1024
+_auto_jobs_symbol = 'auto'
+
+# NOTE: Files that are linted ahead by each worker of the parallel linting. It
+#       keeps the workers busy without reading too many paths ahead.
+_PENDING_FILES_PER_JOB = 4
+
+# NOTE: Each worker process of the parallel linting has its own linter.
+_worker_linter = None  # type: Optional[Linter]
+_worker_cache = None  # type: Optional[LintResultCache]
+_worker_max_violations = None  # type: Optional[int]
+
+
+class _LintSummary(object):
+    """ A summary of the linting that callers check after iterating over
+    _lint_each_file, because the generator cannot return values on Python 2.
+    """
+    def __init__(self):
+        # NOTE: True if violations or files were skipped by the max violations.
+        self.is_truncated = False
+
+        # NOTE: True if paths of --files-from that do not exist were skipped.
+        self.has_unexistent_paths = False
+
+
 
 
 def start_cli():
     env = _build_env(sys.argv)
+
+    if env['cmdargs'].get('server'):
+        _adjust_log_level(env)
+        _start_server(env)
+
+    if env['cmdargs'].get('lsp'):
+        _adjust_log_level(env)
+        _start_language_server(env)
+
     _validate(env)
 
     _adjust_log_level(env)
 
     config_dict = _build_config_dict(env)
-    violations = _lint_all(env, config_dict)
+    cache = _build_cache(env, config_dict)
+    summary = _LintSummary()
+
+    if _is_streaming(config_dict):
+        violations_count = _print_violations_by_file(env, config_dict, cache, summary)
+    else:
+        violations = _lint_all(env, config_dict, cache, summary)
+        violations_count = len(violations)
+
+        if violations_count > 0:
+            _print_violations(violations, config_dict)
+
+    if cache is not None:
+        cache.evict()
+        _print_cache_stats_if_necessary(cache, config_dict)
 
     parser = _build_arg_parser()
 
-    if len(violations) == 0:
+    if violations_count == 0 and not summary.has_unexistent_paths:
         parser.exit(status=0)
 
-    _print_violations(violations, config_dict)
+    if summary.is_truncated:
+        logging.warning('stopped checking because of reaching max violations: {max_violations}'.format(
+            max_violations=_get_max_violations(config_dict)))
+
     parser.exit(status=1)
 
 
 def _validate(env):  # type: (Dict[str, Any]) -> None
     parser = _build_arg_parser()
     paths_to_lint = env['file_paths']
+    cmdargs = env['cmdargs']
+
+    if cmdargs.get('changed_lines_only') and not cmdargs.get('changed_since'):
+        logging.error('--changed-lines-only requires --changed-since')
+        parser.exit(status=1)
 
-    if len(paths_to_lint) == 0:
-        logging.error('nothing to check')
-        parser.print_help()
+    if cmdargs.get('null') and not cmdargs.get('files_from'):
+        logging.error('--null requires --files-from')
         parser.exit(status=1)
 
+    # NOTE: Changed files are linted if no paths are given with --changed-since.
+    if len(paths_to_lint) == 0 and not cmdargs.get('changed_since') and not cmdargs.get('files_from'):
+        _exit_by_nothing_to_check()
+
     if paths_to_lint.count(_stdin_symbol) > 1:
         logging.error('number of "-" must be less than 2')
         parser.exit(status=1)
 
+    files_from = cmdargs.get('files_from')
+    if files_from is not None:
+        if Path(files_from) == _stdin_symbol:
+            if _stdin_symbol in paths_to_lint:
+                logging.error('"-" cannot be used with --files-from -')
+                parser.exit(status=1)
+        elif not Path(files_from).is_file():
+            _exit_by_unexistent_path(Path(files_from))
+
+    # NOTE: Paths from --files-from are validated while linting.
     for path_to_lint in filter(lambda path: path != _stdin_symbol, paths_to_lint):
-        if not path_to_lint.exists() or not path_to_lint.is_file():
-            logging.error('no such file or directory: `{path}`'.format(
-                path=str(path_to_lint)))
-            parser.exit(status=1)
+        if not path_to_lint.is_file() and not path_to_lint.is_dir():
+            _exit_by_unexistent_path(path_to_lint)
+
+
+def _exit_by_unexistent_path(path):  # type: (Path) -> None
+    logging.error('no such file or directory: `{path}`'.format(
+        path=str(path)))
+    _build_arg_parser().exit(status=1)
+
+
+def _exit_by_nothing_to_check():  # type: () -> None
+    parser = _build_arg_parser()
+
+    logging.error('nothing to check')
+
+    # NOTE: The standard output may have streamed violations, so the help should not be mixed.
+    parser.print_help(sys.stderr)
+    parser.exit(status=1)
 
 
 def _build_env(argv):
@@ -97,19 +189,65 @@ def _build_arg_parser():
     parser.add_argument('-e', '--error', action='store_const', const=True, help='report only errors')
     parser.add_argument('-w', '--warning', action='store_const', const=True, help='report errors and warnings')
     parser.add_argument('-s', '--style-problem', action='store_const', const=True, help='report errors, warnings and style problems')
-    parser.add_argument('-m', '--max-violations', type=int, help='limit max violations count')
+    parser.add_argument('-m', '--max-violations', type=_parse_max_violations, help='limit max violations count')
     parser.add_argument('-c', '--color', action='store_const', const=True, help='colorize output when possible')
     parser.add_argument('--no-color', action='store_const', const=True, help='do not colorize output')
     parser.add_argument('-j', '--json', action='store_const', const=True, help='output json style')
+    parser.add_argument('--jsonl', action='store_const', const=True, help='output json lines style (always streaming)')
     parser.add_argument('-t', '--stat', action='store_const', const=True, help='output statistic info')
     parser.add_argument('--enable-neovim', action='store_const', const=True, help='enable Neovim syntax')
     parser.add_argument('-f', '--format', help='set output format')
     parser.add_argument('--stdin-display-name', type=str, help='specify a file path that is used for reporting when linting standard inputs')
+    parser.add_argument('--jobs', type=_parse_jobs, help='lint files by N processes in parallel ("auto" means the number of CPUs)')
+    parser.add_argument('--cache', action='store_const', const=True, help='reuse lint results of unchanged files')
+    parser.add_argument('--cache-dir', type=str, help='specify a directory to store lint results (default: $XDG_CACHE_HOME/vint)')
+    parser.add_argument('--cache-stats', action='store_const', const=True, help='output cache hits and misses to standard error')
+    parser.add_argument('--stream', action='store_const', const=True, help='output violations of each file as soon as the file is checked')
+    parser.add_argument('--server', action='store_const', const=True, help='run a lint server that keeps policies and configs loaded')
+    parser.add_argument('--client', action='store_const', const=True, help='lint by the lint server (lint in this process if the server is not running)')
+    parser.add_argument('--socket', type=str, help='specify a socket path of the lint server (default: $XDG_CACHE_HOME/vint/server.sock)')
+    parser.add_argument('--lsp', action='store_const', const=True, help='run a language server on standard input and output')
+    parser.add_argument('--exclude', action='append', metavar='PATTERN', help='skip files and directories that match the glob pattern in directories (can be repeated)')
+    parser.add_argument('--respect-gitignore', action='store_const', const=True, help='skip files and directories that .gitignore files ignore')
+    parser.add_argument('--changed-since', metavar='REV', type=str, help='lint only files that differ from the git revision (in the given paths if any)')
+    parser.add_argument('--changed-lines-only', action='store_const', const=True, help='report only violations on lines changed since the revision of --changed-since')
+    parser.add_argument('--files-from', metavar='FILE', type=str, help='read paths to lint from the file ("-" means standard input), one path per line')
+    parser.add_argument('-0', '--null', action='store_const', const=True, help='paths of --files-from are separated by NUL characters instead of newlines')
     parser.add_argument('files', nargs='*', help='file or directory path to lint')
 
     return parser
 
 
+def _parse_max_violations(value):  # type: (str) -> int
+    try:
+        max_violations = int(value)
+    except ValueError:
+        max_violations = 0
+
+    # NOTE: Reporting no violations with 0 would make every run pass.
+    if max_violations < 1:
+        raise ArgumentTypeError('must be a positive integer: `{value}`'.format(value=value))
+
+    return max_violations
+
+
+def _parse_jobs(value):  # type: (str) -> Any
+    if value == _auto_jobs_symbol:
+        return value
+
+    try:
+        jobs = int(value)
+    except ValueError:
+        jobs = 0
+
+    if jobs < 1:
+        raise ArgumentTypeError('must be a positive integer or "{auto}": `{value}`'.format(
+            auto=_auto_jobs_symbol,
+            value=value))
+
+    return jobs
+
+
 def _build_config_dict(env):  # type: (Dict[str, Any]) -> Dict[str, Any]
     config = ConfigContainer(
         ConfigDefaultSource(env),
@@ -121,21 +259,538 @@ def _build_config_dict(env):  # type: (Dict[str, Any]) -> Dict[str, Any]
     return config.get_config_dict()
 
 
-def _lint_all(env, config_dict):  # type: (Dict[str, Any], Dict[str, Any]) -> List[Dict[str, Any]]
-    paths_to_lint = env['file_paths']
+def _lint_all(env, config_dict, cache=None, summary=None):
+    # type: (Dict[str, Any], Dict[str, Any], Optional[LintResultCache], Optional[_LintSummary]) -> List[Dict[str, Any]]
     violations = []
-    linter = _build_linter(config_dict)
+
+    for violations_of_file in _lint_each_file(env, config_dict, cache, summary):
+        violations += violations_of_file
+
+    return violations
+
+
+def _lint_each_file(env, config_dict, cache=None, summary=None):
+    # type: (Dict[str, Any], Dict[str, Any], Optional[LintResultCache], Optional[_LintSummary]) -> Iterator[List[Dict[str, Any]]]
+    """ Yields violations of each file in the order of the paths.
+    It stops when the number of violations reaches the max violations, and
+    then the summary tells whether any violations or files were skipped.
+    """
+    if summary is None:
+        summary = _LintSummary()
+
+    changed_since = get_config_value(config_dict, ['cmdargs', 'changed_since'])
+    changed_line_numbers = None  # type: Optional[Dict[str, Optional[Set[int]]]]
+
+    if changed_since is None:
+        paths_to_lint = _find_files_to_lint(env, config_dict, summary)
+    else:
+        paths_to_lint = _find_changed_files_to_lint(env, config_dict, changed_since, summary)
+
+        if get_config_value(config_dict, ['cmdargs', 'changed_lines_only'], False):
+            changed_line_numbers = _get_changed_line_numbers(env, changed_since)
+
+    jobs = _get_jobs(config_dict)
+    max_violations = _get_max_violations(config_dict)
+
+    # NOTE: Count paths taken by the linting to know whether any files are left.
+    paths_cursor = _PathsCursor(paths_to_lint)
+    paths_to_lint = paths_cursor  # type: Iterable[Path]
+    is_parallel = False
+
+    if jobs > 1:
+        # NOTE: Starting workers is not worth it for a file, so take the first
+        #       two paths to know whether there are several files.
+        first_paths = list(itertools.islice(paths_cursor, 2))
+        paths_to_lint = itertools.chain(first_paths, paths_cursor)
+        is_parallel = len(first_paths) > 1
+
+    if get_config_value(config_dict, ['cmdargs', 'client'], False):
+        violations_by_file = _lint_each_file_on_server(env, paths_to_lint, config_dict, cache)
+    elif is_parallel:
+        violations_by_file = _lint_each_file_in_parallel(paths_to_lint, config_dict, jobs, cache)
+    else:
+        violations_by_file = _lint_each_file_serially(paths_to_lint, config_dict, cache)
+
+    violations_count = 0
+    files_count = 0
+
+    try:
+        for violations_of_file in violations_by_file:
+            files_count += 1
+
+            if changed_line_numbers is not None:
+                violations_of_file = _filter_violations_on_changed_lines(violations_of_file, changed_line_numbers)
+
+            # NOTE: Each file is linted with one more than the max violations (or
+            #       without it for --changed-lines-only), so the excess from the
+            #       previous files should be removed here after filtering changed lines.
+            is_dropped = False
+            if max_violations is not None:
+                is_dropped = len(violations_of_file) > max_violations - violations_count
+                violations_of_file = violations_of_file[:max_violations - violations_count]
+
+            violations_count += len(violations_of_file)
+
+            # NOTE: Do not check the rest of files if the violations are enough.
+            #       Paths taken ahead by workers are not checked either.
+            if _has_reached_max_violations(violations_count, max_violations):
+                summary.is_truncated = is_dropped \
+                    or paths_cursor.taken_count > files_count \
+                    or paths_cursor.has_next()
+
+                yield violations_of_file
+                return
+
+            yield violations_of_file
+    finally:
+        violations_by_file.close()
+
+
+class _PathsCursor(object):
+    """ An iterator of paths that counts the taken paths, and can tell whether
+    any paths are left without taking them.
+    """
+    def __init__(self, paths):  # type: (Iterable[Path]) -> None
+        self._paths = iter(paths)
+        self._peeked_paths = []  # type: List[Path]
+        self.taken_count = 0
+
+
+    def __iter__(self):
+        return self
+
+
+    def __next__(self):  # type: () -> Path
+        path = self._peeked_paths.pop() if self._peeked_paths else next(self._paths)
+        self.taken_count += 1
+        return path
+
+
+    # NOTE: For Python 2.
+    next = __next__
+
+
+    def has_next(self):  # type: () -> bool
+        if not self._peeked_paths:
+            try:
+                self._peeked_paths.append(next(self._paths))
+            except StopIteration:
+                return False
+
+        return True
+
+
+
+def _find_files_to_lint(env, config_dict, summary):
+    # type: (Dict[str, Any], Dict[str, Any], _LintSummary) -> Iterator[Path]
+    """ Yields files to lint in the given paths as soon as they are found.
+    It exits if no files are found.
+    """
+    exclude_patterns = _get_exclude_patterns(config_dict)
+    respect_gitignore = get_config_value(config_dict, ['cmdargs', 'respect_gitignore'], False)
+    files_count = 0
+
+    for path in find_vim_script(_iterate_given_paths(env, config_dict, summary), exclude_patterns, respect_gitignore):
+        files_count += 1
+        yield path
+
+    if files_count == 0:
+        _exit_by_nothing_to_check()
+
+
+def _iterate_given_paths(env, config_dict, summary):
+    # type: (Dict[str, Any], Dict[str, Any], _LintSummary) -> Iterator[Path]
+    """ Yields the paths on the command line and then paths in the file of
+    --files-from. The paths in the file are read and validated lazily, so
+    linting starts before reading all of them. Paths in the file that do not
+    exist are skipped, and the summary tells it.
+    """
+    for path in env['file_paths']:
+        yield path
+
+    files_from = get_config_value(config_dict, ['cmdargs', 'files_from'])
+    if files_from is None:
+        return
+
+    is_null_separated = get_config_value(config_dict, ['cmdargs', 'null'], False)
+
+    for path in _read_paths(Path(files_from), is_null_separated):
+        if not path.is_file() and not path.is_dir():
+            # NOTE: Do not exit here, because violations of the previous
+            #       paths would be lost if they are not streamed.
+            logging.error('no such file or directory: `{path}`'.format(path=str(path)))
+            summary.has_unexistent_paths = True
+            continue
+
+        yield path
+
+
+def _read_paths(files_from, is_null_separated):  # type: (Path, bool) -> Iterator[Path]
+    separator = b'\0' if is_null_separated else b'\n'
+
+    if files_from == _stdin_symbol:
+        # NOTE: See the comment of _build_lint_target about sys.stdin.buffer.
+        is_python_3 = hasattr(sys.stdin, 'buffer')
+        file_obj = sys.stdin.buffer if is_python_3 else sys.stdin
+    else:
+        file_obj = files_from.open('rb')
+
+    try:
+        rest = b''
+
+        for chunk in iter(lambda: file_obj.read(_FILES_FROM_CHUNK_SIZE), b''):
+            lines = (rest + chunk).split(separator)
+            rest = lines.pop()
+
+            for line in lines:
+                path = _decode_path(line)
+                if path is not None:
+                    yield path
+
+        path = _decode_path(rest)
+        if path is not None:
+            yield path
+    finally:
+        if files_from != _stdin_symbol:
+            file_obj.close()
+
+
+def _decode_path(line):  # type: (bytes) -> Optional[Path]
+    line = line.rstrip(b'\r\n')
+    if len(line) == 0:
+        return None
+
+    encoding = sys.getfilesystemencoding() or 'utf-8'
+
+    try:
+        # NOTE: Undecodable bytes in paths are kept as surrogates in Python 3.
+        return Path(line.decode(encoding, 'surrogateescape'))
+    except LookupError:
+        return Path(line.decode(encoding, 'replace'))
+
+
+def _find_changed_files_to_lint(env, config_dict, changed_since, summary):
+    # type: (Dict[str, Any], Dict[str, Any], str, _LintSummary) -> List[Path]
+    """ Returns Vim script files that differ from the revision. If paths are
+    given, only changed files in the paths are returned.
+    """
+    from vint.linting.git_diff import get_changed_file_paths, GitError
+
+    try:
+        changed_paths = get_changed_file_paths(changed_since, env.get('cwd'))
+    except GitError as err:
+        logging.error(str(err))
+        _build_arg_parser().exit(status=1)
+
+    paths_to_lint = list(filter_vim_script(changed_paths, _get_exclude_patterns(config_dict)))
+
+    given_paths = [path.resolve() for path in _iterate_given_paths(env, config_dict, summary)
+                   if path != _stdin_symbol]
+    if len(given_paths) > 0:
+        paths_to_lint = [path for path in paths_to_lint
+                         if any(_is_same_or_under(path.resolve(), given_path) for given_path in given_paths)]
+
+    logging.debug('{count} changed files since `{revision}`'.format(
+        count=len(paths_to_lint),
+        revision=changed_since))
+
+    return paths_to_lint
+
+
+def _get_changed_line_numbers(env, changed_since):
+    # type: (Dict[str, Any], str) -> Dict[str, Optional[Set[int]]]
+    from vint.linting.git_diff import get_changed_line_numbers, GitError
+
+    try:
+        return get_changed_line_numbers(changed_since, env.get('cwd'))
+    except GitError as err:
+        logging.error(str(err))
+        _build_arg_parser().exit(status=1)
+
+
+def _filter_violations_on_changed_lines(violations, changed_line_numbers):
+    # type: (List[Dict[str, Any]], Dict[str, Optional[Set[int]]]) -> List[Dict[str, Any]]
+    filtered_violations = []
+
+    for violation in violations:
+        position = violation['position']
+        path = str(position['path'])
+
+        if path not in changed_line_numbers:
+            continue
+
+        # NOTE: All lines of untracked files are changed.
+        line_numbers = changed_line_numbers[path]
+        if line_numbers is None or position['line'] in line_numbers:
+            filtered_violations.append(violation)
+
+    return filtered_violations
+
+
+def _is_same_or_under(path, dir_path):  # type: (Path, Path) -> bool
+    return path == dir_path or dir_path in path.parents
+
+
+def _get_exclude_patterns(config_dict):  # type: (Dict[str, Any]) -> List[str]
+    exclude_patterns = get_config_value(config_dict, ['cmdargs', 'exclude'], [])
+
+    # NOTE: YAML configs may have a pattern as a string instead of a list.
+    if not isinstance(exclude_patterns, list):
+        return [exclude_patterns]
+
+    return exclude_patterns
+
+
+def _lint_each_file_serially(paths_to_lint, config_dict, cache):
+    # type: (Iterable[Path], Dict[str, Any], Optional[LintResultCache]) -> Iterator[List[Dict[str, Any]]]
+    max_violations = _get_max_violations_per_file(config_dict)
+    linter = _build_linter(config_dict, cache)
 
     for path in paths_to_lint:
         lint_target = _build_lint_target(path, config_dict)
-        violations += linter.lint(lint_target)
+        yield linter.lint(lint_target, max_violations)
+
+
+def _lint_each_file_on_server(env, paths_to_lint, config_dict, cache):
+    # type: (Dict[str, Any], Iterable[Path], Dict[str, Any], Optional[LintResultCache]) -> Iterator[List[Dict[str, Any]]]
+    """ Lint the files by the lint server.
+    The files are linted in this process instead if the server is not
+    running or the server cannot lint them.
+    """
+    from vint.linting.server import LintClient, LintServerError
+
+    max_violations = _get_max_violations_per_file(config_dict)
+    linter = None  # type: Optional[Linter]
+
+    # NOTE: The server lints files with the max violations in the command line arguments.
+    cmdargs = dict(env['cmdargs'], max_violations=max_violations)
+
+    try:
+        client = LintClient(_get_socket_path(env, config_dict))  # type: Optional[LintClient]
+    except LintServerError as err:
+        logging.debug('lint in this process: {err}'.format(err=err))
+        client = None
+
+    try:
+        for path in paths_to_lint:
+            lint_target = _build_lint_target(path, config_dict)
+            violations = None  # type: Optional[List[Dict[str, Any]]]
+
+            if client is not None:
+                try:
+                    violations = client.lint(lint_target.path, lint_target.read(), env['cwd'], cmdargs)
+                except LintServerError as err:
+                    logging.debug('lint in this process: {err}'.format(err=err))
+                    client.close()
+                    client = None
+
+            if violations is None:
+                if linter is None:
+                    linter = _build_linter(config_dict, cache)
+
+                violations = linter.lint(lint_target, max_violations)
+
+            yield violations
+    finally:
+        if client is not None:
+            client.close()
+
+
+def _lint_each_file_in_parallel(paths_to_lint, config_dict, jobs, cache):
+    # type: (Iterable[Path], Dict[str, Any], int, Optional[LintResultCache]) -> Iterator[List[Dict[str, Any]]]
+    """ Lint the files by the process pool as soon as the paths are found.
+    The violations are ordered by the specified paths regardless of the
+    scheduling, so the result is the same as _lint_each_file_serially.
+    """
+    max_violations = _get_max_violations_per_file(config_dict)
+    max_pending_files_count = jobs * _PENDING_FILES_PER_JOB
+
+    import multiprocessing
+
+    pool = multiprocessing.Pool(processes=jobs,
+                                initializer=_init_worker,
+                                initargs=(config_dict, cache))
+
+    # NOTE: Results of the files on the workers in the order of the paths.
+    #       Standard inputs are linted in this process, so they are kept as
+    #       the stdin symbol until the previous files are done.
+    pending_results = deque()  # type: deque
+
+    try:
+        for path in paths_to_lint:
+            if path == _stdin_symbol:
+                pending_results.append(_stdin_symbol)
+            else:
+                pending_results.append(pool.apply_async(_lint_file_on_worker, (path,)))
+
+            # NOTE: Yield done files while reading paths to output them as soon as possible.
+            while len(pending_results) >= max_pending_files_count \
+                    or (len(pending_results) > 0 and _is_pending_result_ready(pending_results[0])):
+                yield _get_violations_of_pending_result(pending_results.popleft(), config_dict, max_violations, cache)
+
+        while len(pending_results) > 0:
+            yield _get_violations_of_pending_result(pending_results.popleft(), config_dict, max_violations, cache)
+
+        pool.close()
+    finally:
+        # NOTE: Workers may be still running if the caller stopped iterating.
+        pool.terminate()
+        pool.join()
+
+
+def _is_pending_result_ready(pending_result):  # type: (Any) -> bool
+    return pending_result is _stdin_symbol or pending_result.ready()
+
+
+def _get_violations_of_pending_result(pending_result, config_dict, max_violations, cache):
+    # type: (Any, Dict[str, Any], Optional[int], Optional[LintResultCache]) -> List[Dict[str, Any]]
+    if pending_result is _stdin_symbol:
+        # NOTE: Standard inputs cannot be shared with workers.
+        linter = _build_linter(config_dict, cache)
+        return linter.lint(_build_lint_target(_stdin_symbol, config_dict), max_violations)
+
+    violations_of_file, cache_stats = pending_result.get()
+
+    if cache is not None:
+        cache.stats.merge(cache_stats)
+
+    return violations_of_file
+
+
+def _init_worker(config_dict, cache):
+    # type: (Dict[str, Any], Optional[LintResultCache]) -> None
+    # NOTE: Policies are not registered yet if the worker is spawned (not forked).
+    from vint.bootstrap import init_logger, init_linter
+    init_logger()
+    init_linter()
+
+    _adjust_log_level({'cmdargs': config_dict.get('cmdargs', {})})
+
+    global _worker_linter, _worker_cache, _worker_max_violations
+    _worker_cache = cache
+    _worker_max_violations = _get_max_violations_per_file(config_dict)
+    _worker_linter = _build_linter(config_dict, cache)
+
+
+def _lint_file_on_worker(path):  # type: (Path) -> Tuple[List[Dict[str, Any]], LintCacheStats]
+    # NOTE: Cache stats on workers should be returned to the main process.
+    cache_stats = LintCacheStats()
+    if _worker_cache is not None:
+        _worker_cache.stats = cache_stats
+
+    lint_target = LintTargetFile(path)
+    violations = _worker_linter.lint(CachedLintTarget(lint_target), _worker_max_violations)
+
+    return violations, cache_stats
+
+
+def _get_jobs(config_dict):  # type: (Dict[str, Any]) -> int
+    jobs = get_config_value(config_dict, ['cmdargs', 'jobs'], 1)
+
+    if jobs == _auto_jobs_symbol:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+
+    return jobs
 
-    return violations
 
+def _get_max_violations(config_dict):  # type: (Dict[str, Any]) -> Optional[int]
+    return get_config_value(config_dict, ['cmdargs', 'max-violations'])
+
+
+def _get_max_violations_per_file(config_dict):  # type: (Dict[str, Any]) -> Optional[int]
+    """ Returns the max violations to pass to linters. It is one more than
+    the max violations to know whether violations are skipped.
+    """
+    # NOTE: Violations on unchanged lines are removed after linting, so linting
+    #       with the limit may drop violations on changed lines.
+    if get_config_value(config_dict, ['cmdargs', 'changed_lines_only'], False):
+        return None
+
+    max_violations = _get_max_violations(config_dict)
+    if max_violations is None:
+        return None
+
+    return max_violations + 1
+
+
+def _has_reached_max_violations(violations_count, max_violations):
+    # type: (int, Optional[int]) -> bool
+    return max_violations is not None and violations_count >= max_violations
+
+
+def _get_socket_path(env, config_dict):  # type: (Dict[str, Any], Dict[str, Any]) -> Path
+    from vint.linting.server import get_default_socket_path
+
+    socket_path = get_config_value(config_dict, ['cmdargs', 'socket'])
+    if socket_path is None:
+        return get_default_socket_path(env)
+
+    return Path(socket_path)
+
+
+def _start_server(env):  # type: (Dict[str, Any]) -> None
+    from vint.linting.server import LintServer, LintServerError
+
+    parser = _build_arg_parser()
+    config_dict = ConfigCmdargsSource(env).get_config_dict()
+    server = LintServer(_get_socket_path(env, config_dict))
+
+    try:
+        server.serve_forever()
+    except LintServerError as err:
+        logging.error(str(err))
+        parser.exit(status=1)
+    except KeyboardInterrupt:
+        pass
+
+    parser.exit(status=0)
+
+
+def _start_language_server(env):  # type: (Dict[str, Any]) -> None
+    from vint.linting.language_server import LanguageServer
+
+    parser = _build_arg_parser()
+    config_dict = _build_config_dict(env)
+
+    # NOTE: Standard inputs and outputs should be binary to count bytes of messages.
+    is_python_3 = hasattr(sys.stdin, 'buffer')
+    reader = sys.stdin.buffer if is_python_3 else sys.stdin
+    writer = sys.stdout.buffer if is_python_3 else sys.stdout
+
+    server = LanguageServer(_build_linter(config_dict), reader, writer, _get_max_violations(config_dict))
+    parser.exit(status=server.serve())
+
+
+def _build_cache(env, config_dict):  # type: (Dict[str, Any], Dict[str, Any]) -> Optional[LintResultCache]
+    if not get_config_value(config_dict, ['cmdargs', 'cache'], False):
+        return None
+
+    cache_dir = get_config_value(config_dict, ['cmdargs', 'cache_dir'])
+    if cache_dir is None:
+        cache_dir_path = Path(env['xdg_cache_home'], 'vint')
+    else:
+        cache_dir_path = Path(cache_dir)
+
+    max_size = get_config_value(config_dict, ['cmdargs', 'cache_max_size'], DEFAULT_MAX_CACHE_SIZE)
+
+    return LintResultCache(cache_dir_path, _get_version(), max_size)
+
+
+def _print_cache_stats_if_necessary(cache, config_dict):
+    # type: (LintResultCache, Dict[str, Any]) -> None
+    if not get_config_value(config_dict, ['cmdargs', 'cache_stats'], False):
+        return
+
+    sys.stderr.write('vint cache: {stats}\n'.format(stats=cache.stats))
+
+
+def _build_linter(config_dict, cache=None):
+    # type: (Dict[str, Any], Optional[LintResultCache]) -> Linter
+    from vint.linting.linter import Linter
 
-def _build_linter(config_dict):  # type: (Dict[str, Any]) -> Linter
     policy_set = PolicySet(get_policy_classes())
-    linter = Linter(policy_set, config_dict)
+    linter = Linter(policy_set, config_dict, cache)
     return linter
 
 
@@ -146,12 +801,54 @@ def _print_violations(violations, config_dict):  # type: (List[Dict[str, Any]],
     print(output)
 
 
+def _print_violations_by_file(env, config_dict, cache, summary=None):
+    # type: (Dict[str, Any], Dict[str, Any], Optional[LintResultCache], Optional[_LintSummary]) -> int
+    """ Print violations of each file as soon as the file is linted, and
+    return the number of the violations.
+    """
+    formatter = _build_formatter(config_dict)
+    violations_count = 0
+
+    _write_to_stdout(formatter.start_streaming())
+
+    try:
+        for violations_of_file in _lint_each_file(env, config_dict, cache, summary):
+            violations_count += len(violations_of_file)
+            _write_to_stdout(formatter.format_violations_of_file(violations_of_file))
+    except BaseException:
+        # NOTE: Linting may exit on the way, for example by unexistent paths.
+        _write_to_stdout(formatter.abort_streaming())
+        raise
+
+    _write_to_stdout(formatter.end_streaming())
+
+    return violations_count
+
+
+def _write_to_stdout(output):  # type: (str) -> None
+    if len(output) == 0:
+        return
+
+    sys.stdout.write(output)
+    sys.stdout.flush()
+
+
+def _is_streaming(config_dict):  # type: (Dict[str, Any]) -> bool
+    # NOTE: JSON lines are designed for incremental consumption, so always stream it.
+    if get_config_value(config_dict, ['cmdargs', 'jsonl'], False):
+        return True
+
+    return get_config_value(config_dict, ['cmdargs', 'stream'], False)
+
+
 def _build_formatter(config_dict):  # type: (Dict[str, Any]) -> AbstractFormatter
     if 'cmdargs' not in config_dict:
         return Formatter(config_dict)
 
     cmdargs = config_dict['cmdargs']
-    if 'json' in cmdargs and cmdargs['json']:
+    if 'jsonl' in cmdargs and cmdargs['jsonl']:
+        return JSONLinesFormatter()
+    elif 'json' in cmdargs and cmdargs['json']:
         return JSONFormatter()
     elif 'stat' in cmdargs and cmdargs['stat']:
         return StatisticFormatter(config_dict)
@@ -5,7 +5,7 @@ from vint.linting.config.config_source import ConfigSource
 class ConfigAbstractDynamicSource(ConfigSource):
     """ A abstract class for ConfigSource that dynamically changed when linting. """
     def __init__(self):
-        pass
+        self._version = 0
 
 
     def get_config_dict(self):
@@ -14,5 +14,13 @@ class ConfigAbstractDynamicSource(ConfigSource):
 
 
     def update_by_node(self, node):
-        # type: (Dict[str, Any]) -> None
+        # type: (Dict[str, Any]) -> bool
+        """ Update the config by the node, and return whether the config was changed.
+        Subclasses should increase the version when the config was changed.
+        """
         raise NotImplementedError()
+
+
+    def get_version(self):
+        # type: () -> int
+        return self._version
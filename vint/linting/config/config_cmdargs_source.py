@@ -28,6 +28,7 @@ class ConfigCmdargsSource(ConfigSource):
 
         config_dict = self._normalize_color(env, config_dict)
         config_dict = self._normalize_json(env, config_dict)
+        config_dict = self._normalize_jsonl(env, config_dict)
         config_dict = self._normalize_stat(env, config_dict)
         config_dict = self._normalize_verbose(env, config_dict)
         config_dict = self._normalize_severity(env, config_dict)
@@ -35,6 +36,13 @@ class ConfigCmdargsSource(ConfigSource):
         config_dict = self._normalize_format(env, config_dict)
         config_dict = self._normalize_env(env, config_dict)
         config_dict = self._normalize_stdin_filename(env, config_dict)
+        config_dict = self._normalize_jobs(env, config_dict)
+        config_dict = self._normalize_cache(env, config_dict)
+        config_dict = self._normalize_stream(env, config_dict)
+        config_dict = self._normalize_client(env, config_dict)
+        config_dict = self._normalize_exclude(env, config_dict)
+        config_dict = self._normalize_changed_since(env, config_dict)
+        config_dict = self._normalize_files_from(env, config_dict)
 
         return config_dict
 
@@ -49,6 +57,10 @@ class ConfigCmdargsSource(ConfigSource):
         return config_dict
 
 
+    def _normalize_jsonl(self, env, config_dict):
+        return self._pass_config_by_key('jsonl', env, config_dict)
+
+
     def _normalize_stat(self, env, config_dict):
         return self._pass_config_by_key('stat', env, config_dict)
 
@@ -80,7 +92,15 @@ class ConfigCmdargsSource(ConfigSource):
 
 
     def _normalize_max_violations(self, env, config_dict):
-        return self._pass_config_by_key('max-violations', env, config_dict)
+        env_cmdargs = env['cmdargs']
+
+        # NOTE: argparse stores --max-violations as max_violations.
+        max_violations = env_cmdargs.get('max_violations', env_cmdargs.get('max-violations'))
+
+        if max_violations is not None:
+            config_dict['cmdargs']['max-violations'] = max_violations
+
+        return config_dict
 
 
     def _normalize_format(self, env, config_dict):
@@ -120,3 +140,36 @@ class ConfigCmdargsSource(ConfigSource):
     def _normalize_stdin_filename(self, env, config_dict):
         return self._pass_config_by_key('stdin_display_name', env, config_dict)
 
+
+    def _normalize_jobs(self, env, config_dict):
+        return self._pass_config_by_key('jobs', env, config_dict)
+
+
+    def _normalize_cache(self, env, config_dict):
+        config_dict = self._pass_config_by_key('cache', env, config_dict)
+        config_dict = self._pass_config_by_key('cache_dir', env, config_dict)
+        return self._pass_config_by_key('cache_stats', env, config_dict)
+
+
+    def _normalize_stream(self, env, config_dict):
+        return self._pass_config_by_key('stream', env, config_dict)
+
+
+    def _normalize_client(self, env, config_dict):
+        config_dict = self._pass_config_by_key('client', env, config_dict)
+        return self._pass_config_by_key('socket', env, config_dict)
+
+
+    def _normalize_exclude(self, env, config_dict):
+        config_dict = self._pass_config_by_key('exclude', env, config_dict)
+        return self._pass_config_by_key('respect_gitignore', env, config_dict)
+
+
+    def _normalize_changed_since(self, env, config_dict):
+        config_dict = self._pass_config_by_key('changed_since', env, config_dict)
+        return self._pass_config_by_key('changed_lines_only', env, config_dict)
+
+
+    def _normalize_files_from(self, env, config_dict):
+        config_dict = self._pass_config_by_key('files_from', env, config_dict)
+        return self._pass_config_by_key('null', env, config_dict)
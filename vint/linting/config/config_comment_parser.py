@@ -1,5 +1,5 @@
-from vint.ast.node_type import NodeType
-from typing import Dict, Any, Optional  # noqa: F401
+from vint.ast.node_type import NodeType, get_node_type
+from typing import Dict, Any, Optional, List, Tuple  # noqa: F401
 import re
 CONFIG_COMMENT_PATTERN = re.compile(r'^\s*vint:\s*')
 POLICY_SWITCH_PATTERN = re.compile(r'(?:^|\s)[-+]\S+')
@@ -15,7 +15,7 @@ class ConfigComment:
 
 def parse_config_comment_node_if_exists(node):
     # type: (Dict[str, Any]) -> Optional[ConfigComment]
-    if NodeType(node['type']) is not NodeType.COMMENT:
+    if get_node_type(node) is not NodeType.COMMENT:
         return None
 
     comment_node = node
@@ -56,3 +56,19 @@ def parse_config_comment(comment_content):
 def is_config_comment(comment_content):
     # type: (str) -> bool
     return CONFIG_COMMENT_PATTERN.match(comment_content) is not None
+
+
+def find_config_comments(comment_nodes):
+    # type: (List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], ConfigComment]]
+    """ Returns pairs of comment nodes and their config comments in the same
+    order as the comment nodes. Other comments are excluded.
+    """
+    config_comments = []
+
+    for comment_node in comment_nodes:
+        config_comment = parse_config_comment(comment_node['str'])
+
+        if config_comment is not None:
+            config_comments.append((comment_node, config_comment))
+
+    return config_comments
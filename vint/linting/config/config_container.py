@@ -1,6 +1,7 @@
-from typing import Dict, Any  # noqa: F401
+from typing import Dict, Any, Optional  # noqa: F401
 from functools import reduce
 from vint.linting.config.config_source import ConfigSource
+from vint.utils.frozen_dict import FrozenDict, freeze_dict_deeply  # noqa: F401
 
 
 def merge_dict_deeply(posterior, prior):
@@ -26,12 +27,33 @@ class ConfigContainer(ConfigSource):
     def __init__(self, *config_sources):
         self.config_sources = config_sources
 
+        # NOTE: Merging config dicts is slow, so the merged config dict is
+        #       cached until a version of the sources is changed.
+        self._merged_config_dict = None  # type: Optional[FrozenDict]
+        self._merged_version = None  # type: Optional[int]
+
 
     def get_config_dict(self):
+        # type: () -> FrozenDict
+        """ Returns the merged config dict. It is immutable because it is cached. """
+        version = self.get_version()
+
+        if self._merged_config_dict is not None and version == self._merged_version:
+            return self._merged_config_dict
+
         config_dicts_ordered_by_prior_asc = [config_source.get_config_dict()
                                              for config_source in self.config_sources]
 
         result = reduce(merge_dict_deeply, config_dicts_ordered_by_prior_asc, {})
         result['source_name'] = self.__class__.__name__
 
-        return result
+        self._merged_config_dict = freeze_dict_deeply(result)
+        self._merged_version = version
+
+        return self._merged_config_dict
+
+
+    def get_version(self):
+        # type: () -> int
+        # NOTE: Versions never decrease, so the sum is changed when any version is changed.
+        return sum(config_source.get_version() for config_source in self.config_sources)
@@ -1,6 +1,5 @@
-from typing import Dict, Any  # noqa: F401
+from typing import Dict, Any, List  # noqa: F401
 from pathlib import Path
-import yaml
 import logging
 from vint.linting.config.config_source import ConfigSource
 from vint.linting.level import Level
@@ -10,7 +9,11 @@ from vint.linting.level import Level
 class ConfigFileSource(ConfigSource):
     def __init__(self, env):
         # type: (Dict[str, Any]) -> None
+        # NOTE: PyYAML is slow to import, so import it only when reading configs.
+        import yaml
+
         config_file_path = self.get_file_path(env)
+        self.config_file_path = config_file_path
 
         with config_file_path.open() as file_obj:
             config_yaml = yaml.safe_load(file_obj)
@@ -61,6 +64,14 @@ class ConfigFileSource(ConfigSource):
         raise NotImplementedError()
 
 
+    def get_file_path_candidates(self, env):
+        # type: (Dict[str, Any]) -> List[Path]
+        """ Returns paths where the config file is looked up in the priority
+        order. Config files that appear on the paths change the config.
+        """
+        return [self.get_file_path(env)]
+
+
     def get_config_dict(self):
         # type: () -> Dict[str, Any]
         return self._config_dict
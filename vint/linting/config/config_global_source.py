@@ -18,6 +18,11 @@ class ConfigGlobalSource(ConfigFileSource):
 
         return VOID_CONFIG_PATH
 
+
+    def get_file_path_candidates(self, env):
+        return ConfigGlobalSource._get_filenames_candidates(env)
+
+
     @classmethod
     def _get_filenames_candidates(cls, env):
         # type: (Dict[str, str]) -> [Path]
@@ -42,6 +42,7 @@ class ConfigNextLineCommentSource(ConfigAbstractDynamicSource):
     def update_by_node(self, node):
         lnum_of_node = node['pos']['lnum']
         is_line_changed = lnum_of_node > self._current_lnum
+        prev_config_dict = self._config_dict
 
         if is_line_changed:
             if lnum_of_node - self._current_lnum == 1:
@@ -67,14 +68,20 @@ class ConfigNextLineCommentSource(ConfigAbstractDynamicSource):
             self._current_lnum = lnum_of_node
             self._config_dict_for_next_line = self._empty_config_dict
 
+        is_config_changed = self._config_dict is not prev_config_dict
+        if is_config_changed:
+            self._version += 1
+
         config_comment = parse_config_comment_node_if_exists(node)
 
         if config_comment is None:
-            return
+            return is_config_changed
 
         if not config_comment.is_only_next_line:
             # Config comment affects over lines should be handled by an other class.
-            return
+            return is_config_changed
 
+        # NOTE: The config for the next line does not change the current config.
         self._config_dict_for_next_line = config_comment.config_dict
         self._config_dict_for_next_line['source_name'] = self.__class__.__name__
+        return is_config_changed
@@ -1,3 +1,4 @@
+from typing import Dict, Any, List  # noqa: F401
 from pathlib import Path
 from vint.asset import get_asset_path
 from vint.linting.config.config_file_source import ConfigFileSource
@@ -11,14 +12,18 @@ PROJECT_CONFIG_FILENAMES = [
 
 class ConfigProjectSource(ConfigFileSource):
     def get_file_path(self, env):
-        cwd = Path(env['cwd'])
-        path_list_to_search = [cwd] + list(cwd.parents)
+        for proj_conf_path_tmp in self.get_file_path_candidates(env):
+            if proj_conf_path_tmp.is_file():
+                return proj_conf_path_tmp
 
-        for project_path in path_list_to_search:
-            for basename in PROJECT_CONFIG_FILENAMES:
-                proj_conf_path_tmp = project_path / basename
+        return get_asset_path('void_config.yaml')
 
-                if proj_conf_path_tmp.is_file():
-                    return proj_conf_path_tmp
 
-        return get_asset_path('void_config.yaml')
+    def get_file_path_candidates(self, env):
+        # type: (Dict[str, Any]) -> List[Path]
+        cwd = Path(env['cwd'])
+        path_list_to_search = [cwd] + list(cwd.parents)
+
+        return [project_path / basename
+                for project_path in path_list_to_search
+                for basename in PROJECT_CONFIG_FILENAMES]
@@ -13,3 +13,11 @@ class ConfigSource(object):
     def get_config_dict(self):
         # type: () -> Dict[str, Any]
         raise NotImplementedError()
+
+
+    def get_version(self):
+        # type: () -> int
+        """ Returns the number that is increased when the config dict is
+        changed. Sources that never change the config dict return 0.
+        """
+        return 0
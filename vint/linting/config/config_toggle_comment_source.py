@@ -40,11 +40,11 @@ class ConfigToggleCommentSource(ConfigAbstractDynamicSource):
         config_comment = parse_config_comment_node_if_exists(node)
 
         if config_comment is None:
-            return
+            return False
 
         if config_comment.is_only_next_line:
             # Config comment only affects to next line should be handled by an other class.
-            return
+            return False
 
         logging.debug("{cls}: update config to {config_dict} at {lnum}".format(
             cls=self.__class__.__name__,
@@ -54,3 +54,5 @@ class ConfigToggleCommentSource(ConfigAbstractDynamicSource):
 
         self._config_dict = config_comment.config_dict
         self._config_dict['source_name'] = self.__class__.__name__
+        self._version += 1
+        return True
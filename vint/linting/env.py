@@ -1,7 +1,6 @@
 import os
 import os.path
 from pathlib import Path
-from vint.linting.file_filter import find_vim_script
 
 
 def build_environment(cmdargs):
@@ -9,6 +8,7 @@ def build_environment(cmdargs):
         'cmdargs': cmdargs,
         'home_path': _get_home_path(),
         'xdg_config_home': _get_xdg_config_home(),
+        'xdg_cache_home': _get_xdg_cache_home(),
         'cwd': _get_cwd(),
         'file_paths': _get_file_paths(cmdargs),
     }
@@ -23,12 +23,13 @@ def _get_home_path():
 
 
 def _get_file_paths(cmdargs):
+    """ Returns the given paths. Vim script files in the directories are
+    found while linting, because configs can exclude them.
+    """
     if 'files' not in cmdargs:
         return []
 
-    found_file_paths = find_vim_script(map(Path, cmdargs['files']))
-
-    return found_file_paths
+    return [Path(file_path) for file_path in cmdargs['files']]
 
 
 def _get_xdg_config_home():
@@ -36,3 +37,10 @@ def _get_xdg_config_home():
         "XDG_CONFIG_HOME",
         str(_get_home_path().joinpath(".config"))
     ))
+
+
+def _get_xdg_cache_home():
+    return Path(os.environ.get(
+        "XDG_CACHE_HOME",
+        str(_get_home_path().joinpath(".cache"))
+    ))
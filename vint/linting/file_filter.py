@@ -1,41 +1,135 @@
+from typing import List, Iterable, Iterator, Optional, Callable, Tuple  # noqa: F401
+import os
 import re
+import fnmatch
+from pathlib import Path
+from vint.compat.scandir import scandir
+from vint.linting.gitignore import (
+    GitIgnore,  # noqa: F401
+    GitIgnoreCache,
+    GIT_DIR_NAME,
+    is_ignored_by_gitignores,
+)
 
 VIM_SCRIPT_FILE_NAME_PATTERNS = r'(?:^[\._]g?vimrc$|.*\.vim$)'
 
+_match_vim_script_file_name = re.compile(VIM_SCRIPT_FILE_NAME_PATTERNS).match
 
-def find_vim_script(file_paths):
-    vim_script_file_paths = []
+
+def find_vim_script(file_paths, exclude_patterns=None, respect_gitignore=False):
+    # type: (Iterable[Path], Optional[List[str]], bool) -> Iterator[Path]
+    """ Yields Vim script file paths in the given paths. Directories are
+    walked in the order of the names, and files in the directories are
+    yielded as soon as they are found.
+
+    Files and directories under the directories that match any of the
+    exclude glob patterns are skipped without descending into them. The
+    patterns are matched to both the path (such as "vendor/*") and the
+    name (such as "node_modules"). Given paths are never excluded.
+
+    If respect_gitignore is True, files and directories that .gitignore
+    files ignore are also skipped. The .gitignore files in the walked
+    directories and their ancestors in the working tree are read.
+    """
+    is_excluded = _compile_exclude_patterns(exclude_patterns or [])
+    gitignore_cache = GitIgnoreCache() if respect_gitignore else None
 
     for file_path in file_paths:
-        if file_path.is_dir():
-            vim_script_file_paths += _find_vim_script_into_dir(file_path)
+        if not file_path.is_dir():
+            yield file_path
+            continue
+
+        # NOTE: Found paths should be relative to the current directory like
+        #       "vendor/a.vim" instead of "./vendor/a.vim" when given ".".
+        dir_path = str(file_path)
+        if dir_path == os.curdir:
+            dir_path = ''
+
+        if gitignore_cache is None:
+            gitignores = None
         else:
-            vim_script_file_paths.append(file_path)
+            gitignores = gitignore_cache.get_ancestor_gitignores(dir_path)
+
+        for vim_script_file_path in _find_vim_script_into_dir(dir_path, is_excluded, gitignore_cache, gitignores):
+            yield Path(vim_script_file_path)
+
+
+def filter_vim_script(file_paths, exclude_patterns=None):
+    # type: (Iterable[Path], Optional[List[str]]) -> Iterator[Path]
+    """ Yields Vim script file paths in the given file paths. Paths that
+    match any of the exclude glob patterns, or that are in directories that
+    match any of them, are skipped like find_vim_script.
+    """
+    is_excluded = _compile_exclude_patterns(exclude_patterns or [])
+
+    for file_path in file_paths:
+        if not _match_vim_script_file_name(file_path.name):
+            continue
+
+        parts = file_path.parts
+        is_excluded_path = any(is_excluded('/'.join(parts[:index + 1]), parts[index])
+                               for index in range(len(parts)))
+
+        if not is_excluded_path:
+            yield file_path
+
 
-    return vim_script_file_paths
+def _find_vim_script_into_dir(dir_path, is_excluded, gitignore_cache, gitignores):
+    # type: (str, Callable[[str, str], bool], Optional[GitIgnoreCache], Optional[List[Tuple[GitIgnore, str]]]) -> Iterator[str]
+    """ Yields Vim script files in the directory. Gitignores are pairs of
+    .gitignore files that apply to the directory and path prefixes of the
+    directory from the directories that have the files.
+    """
+    if gitignore_cache is not None:
+        gitignore = gitignore_cache.get(dir_path or os.curdir)
 
+        if gitignore is not None:
+            gitignores = gitignores + [(gitignore, '')]
 
-def _find_vim_script_into_dir(dir_path):
-    if not dir_path.is_dir():
-        return []
+    try:
+        # NOTE: Directory entries know their types, so checking types of them
+        #       does not need a stat call for each entry on most platforms.
+        entries = sorted(scandir(dir_path or os.curdir), key=lambda entry: entry.name)
+    except OSError:
+        return
 
-    vim_script_file_paths = []
+    for entry in entries:
+        entry_path = os.path.join(dir_path, entry.name)
 
-    for file_path in dir_path.iterdir():
-        if _is_vim_script(file_path):
-            vim_script_file_paths.append(file_path)
+        # NOTE: Separators are normalized to match patterns such as "vendor/*" on Windows.
+        if is_excluded(entry_path.replace(os.sep, '/'), entry.name):
             continue
 
-        if file_path.is_dir():
-            vim_script_file_paths += _find_vim_script_into_dir(file_path)
+        is_dir = entry.is_dir()
+
+        if gitignores is not None:
+            if entry.name == GIT_DIR_NAME or is_ignored_by_gitignores(gitignores, entry.name, is_dir):
+                continue
+
+        if is_dir:
+            if gitignores is None:
+                child_gitignores = None
+            else:
+                child_gitignores = [(gitignore, prefix + entry.name + '/') for gitignore, prefix in gitignores]
+
+            for vim_script_file_path in _find_vim_script_into_dir(entry_path, is_excluded,
+                                                                  gitignore_cache, child_gitignores):
+                yield vim_script_file_path
             continue
 
-    return sorted(vim_script_file_paths)
+        if entry.is_file() and _match_vim_script_file_name(entry.name):
+            yield entry_path
+
+
+def _compile_exclude_patterns(exclude_patterns):
+    # type: (List[str]) -> Callable[[str, str], bool]
+    if len(exclude_patterns) == 0:
+        return lambda path, name: False
 
+    exclude_regex = re.compile('|'.join(fnmatch.translate(pattern.rstrip('/'))
+                                        for pattern in exclude_patterns))
 
-def _is_vim_script(file_path):
-    if not file_path.is_file():
-        return False
+    def is_excluded(path, name):  # type: (str, str) -> bool
+        return exclude_regex.match(name) is not None or exclude_regex.match(path) is not None
 
-    file_name = file_path.name
-    return bool(re.match(VIM_SCRIPT_FILE_NAME_PATTERNS, file_name))
+    return is_excluded
@@ -3,4 +3,29 @@ from typing import List, Dict, Any  # noqa: F401
 
 class AbstractFormatter(object):
     def format_violations(self, violations):  # type: (List[Dict[str, Any]]) -> str
-        raise NotImplementedError
\ No newline at end of file
+        raise NotImplementedError
+
+
+    def start_streaming(self):  # type: () -> str
+        """ Returns an output that should be written before any violations when streaming. """
+        return ''
+
+
+    def format_violations_of_file(self, violations):  # type: (List[Dict[str, Any]]) -> str
+        """ Returns an output for violations of a file when streaming.
+        The output should be written as soon as the file is linted.
+        """
+        raise NotImplementedError
+
+
+    def end_streaming(self):  # type: () -> str
+        """ Returns an output that should be written after all violations when streaming. """
+        return ''
+
+
+    def abort_streaming(self):  # type: () -> str
+        """ Returns an output that should be written instead of end_streaming
+        when the streaming is aborted by errors. The output should keep the
+        streamed output well-formed.
+        """
+        return ''
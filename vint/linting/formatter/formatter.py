@@ -1,20 +1,21 @@
 from typing import List, Dict, Any  # noqa: F401
 from pathlib import Path
-from ansicolor import Colors, colorize
 from vint.linting.formatter.abstract_formatter import AbstractFormatter
 
 
 DEFAULT_FORMAT = '{file_path}:{line_number}:{column_number}: {description} (see {reference})'
 
+# NOTE: Values are names of ansicolor.Colors. ansicolor is imported only
+#       when colorizing, because most outputs are not colorized.
 FORMAT_COLOR_MAP = {
-    'file_path': Colors.Red,
-    'file_name': Colors.Red,
-    'line_number': Colors.White,
-    'column_number': Colors.White,
-    'severity': Colors.Red,
-    'description': Colors.White,
-    'policy_name': Colors.White,
-    'reference': Colors.White,
+    'file_path': 'Red',
+    'file_name': 'Red',
+    'line_number': 'White',
+    'column_number': 'White',
+    'severity': 'Red',
+    'description': 'White',
+    'policy_name': 'White',
+    'reference': 'White',
 }
 
 
@@ -43,6 +44,13 @@ class Formatter(AbstractFormatter):
         return '\n'.join(formatted_lines)
 
 
+    def format_violations_of_file(self, violations):  # type: (List[Dict[str, Any]]) -> str
+        sorted_violations = _sort_violations(violations)
+
+        return ''.join(self.format_violation(violation) + '\n'
+                       for violation in sorted_violations)
+
+
     def format_violation(self, violation):  # type: (Dict[str, Any]) -> str
         if self._should_be_colorized:
             formatter_map = _get_colorize_formatter_map(violation)
@@ -55,12 +63,14 @@ class Formatter(AbstractFormatter):
 
 
 def _get_colorize_formatter_map(violation):
+    from ansicolor import Colors, colorize
+
     formatter_map = _get_formatter_map(violation)
     colorized_formatter_map = {}
 
     for key, value in formatter_map.items():
         if key in FORMAT_COLOR_MAP:
-            Color = FORMAT_COLOR_MAP[key]
+            Color = getattr(Colors, FORMAT_COLOR_MAP[key])
             colorized_formatter_map[key] = colorize(str(value), Color())
         else:
             colorized_formatter_map[key] = value
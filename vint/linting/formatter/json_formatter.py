@@ -8,13 +8,48 @@ from vint.linting.formatter.abstract_formatter import AbstractFormatter
 class JSONFormatter(AbstractFormatter):
     def __init__(self):  # type: () -> None
         super(JSONFormatter, self).__init__()
-        pass
+        self._has_streamed_violations = False
 
 
     def format_violations(self, violations):  # type: (List[Dict[str, Any]]) -> str
         return json.dumps(_normalize_violations(violations))
 
 
+    def start_streaming(self):  # type: () -> str
+        # NOTE: The opening bracket is written with the first violation, so nothing
+        #       is written if the streaming is aborted before any violations.
+        return ''
+
+
+    def format_violations_of_file(self, violations):  # type: (List[Dict[str, Any]]) -> str
+        # NOTE: Write array elements incrementally, so the whole output is a valid JSON
+        #       that is the same as format_violations when the streaming is ended.
+        output = ''
+
+        for normalized_violation in _normalize_violations(violations):
+            output += ', ' if self._has_streamed_violations else '['
+
+            output += json.dumps(normalized_violation)
+            self._has_streamed_violations = True
+
+        return output
+
+
+    def end_streaming(self):  # type: () -> str
+        if not self._has_streamed_violations:
+            return '[]\n'
+
+        return ']\n'
+
+
+    def abort_streaming(self):  # type: () -> str
+        # NOTE: Close the array to keep the output a valid JSON.
+        if not self._has_streamed_violations:
+            return ''
+
+        return ']\n'
+
+
 
 def _normalize_violations(violations):  # type: (List[Dict[str, Any]]) -> List[Dict[str, Any]]
     line_number = lambda violation: violation['position']['line']
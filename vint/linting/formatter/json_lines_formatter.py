@@ -0,0 +1,20 @@
+from typing import List, Dict, Any  # noqa: F401
+import json
+from vint.linting.formatter.abstract_formatter import AbstractFormatter
+from vint.linting.formatter.json_formatter import _normalize_violations
+
+
+
+class JSONLinesFormatter(AbstractFormatter):
+    """ A formatter for JSON Lines. Each line is a JSON object of a violation,
+    so consumers can read violations before the linting is finished.
+    See http://jsonlines.org/
+    """
+    def format_violations(self, violations):  # type: (List[Dict[str, Any]]) -> str
+        return '\n'.join(json.dumps(normalized_violation)
+                         for normalized_violation in _normalize_violations(violations))
+
+
+    def format_violations_of_file(self, violations):  # type: (List[Dict[str, Any]]) -> str
+        return ''.join(json.dumps(normalized_violation) + '\n'
+                       for normalized_violation in _normalize_violations(violations))
@@ -3,8 +3,27 @@ from vint.linting.formatter.formatter import Formatter
 
 
 class StatisticFormatter(Formatter):
+    def __init__(self, config_dict):  # type: (Dict[str, Any]) -> None
+        super(StatisticFormatter, self).__init__(config_dict)
+        self._streamed_violations_count = 0
+
+
     def format_violations(self, violations):  # type: (List[Dict[str, Any]]) -> str
         violations_count = len(violations)
 
         output = super(StatisticFormatter, self).format_violations(violations) + '\n'
-        return output + 'Total violations: {count}'.format(count=violations_count)
+        return output + _format_statistic(violations_count)
+
+
+    def format_violations_of_file(self, violations):  # type: (List[Dict[str, Any]]) -> str
+        self._streamed_violations_count += len(violations)
+        return super(StatisticFormatter, self).format_violations_of_file(violations)
+
+
+    def end_streaming(self):  # type: () -> str
+        return _format_statistic(self._streamed_violations_count) + '\n'
+
+
+
+def _format_statistic(violations_count):  # type: (int) -> str
+    return 'Total violations: {count}'.format(count=violations_count)
@@ -0,0 +1,104 @@
+from typing import Dict, List, Optional, Set  # noqa: F401
+import re
+import codecs
+import subprocess
+from pathlib import Path
+
+_HUNK_HEADER_PATTERN = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+
+
+class GitError(Exception):
+    pass
+
+
+
+def get_changed_file_paths(revision, cwd=None):  # type: (str, Optional[Path]) -> List[Path]
+    """ Returns paths of files in the working tree that differ from the
+    revision, and untracked files that are not ignored. Deleted files are
+    not included. Paths are relative to the current directory, and only
+    files under the current directory are returned.
+    """
+    _verify_revision(revision, cwd)
+
+    changed_paths = _run_git(['diff', '--name-only', '-z', '--diff-filter=d', '--relative', revision, '--'], cwd)
+    untracked_paths = _run_git(['ls-files', '--others', '--exclude-standard', '-z'], cwd)
+
+    return [Path(path) for path in (changed_paths + untracked_paths).split('\0') if path != '']
+
+
+def get_changed_line_numbers(revision, cwd=None):
+    # type: (str, Optional[Path]) -> Dict[str, Optional[Set[int]]]
+    """ Returns line numbers of lines in the working tree that were added or
+    modified since the revision by file paths. Line numbers of untracked files
+    are None because all lines are new.
+    """
+    _verify_revision(revision, cwd)
+
+    diff = _run_git(['diff', '-U0', '--no-color', '--no-ext-diff', '--relative',
+                     '--src-prefix=a/', '--dst-prefix=b/', revision, '--'], cwd)
+
+    changed_line_numbers = {}  # type: Dict[str, Optional[Set[int]]]
+    line_numbers = None  # type: Optional[Set[int]]
+
+    for line in diff.splitlines():
+        if line.startswith('+++ '):
+            path = _unquote_path(line[len('+++ '):])
+
+            if path.startswith('b/'):
+                line_numbers = changed_line_numbers.setdefault(str(Path(path[len('b/'):])), set())
+            else:
+                # NOTE: Deleted files have "+++ /dev/null".
+                line_numbers = None
+            continue
+
+        matched = _HUNK_HEADER_PATTERN.match(line)
+        if matched is None or line_numbers is None:
+            continue
+
+        start_line_number = int(matched.group(1))
+        lines_count = 1 if matched.group(2) is None else int(matched.group(2))
+        line_numbers.update(range(start_line_number, start_line_number + lines_count))
+
+    for path in _run_git(['ls-files', '--others', '--exclude-standard', '-z'], cwd).split('\0'):
+        if path != '':
+            changed_line_numbers[str(Path(path))] = None
+
+    return changed_line_numbers
+
+
+def _verify_revision(revision, cwd):  # type: (str, Optional[Path]) -> None
+    # NOTE: Revisions should not be options of git such as "--output=<file>".
+    if revision.startswith('-'):
+        raise GitError('invalid revision: `{revision}`'.format(revision=revision))
+
+    # NOTE: Check the revision first, because git diff prints the long usage for some errors.
+    _run_git(['rev-parse', '--verify', revision + '^{commit}'], cwd)
+
+
+def _run_git(args, cwd):  # type: (List[str], Optional[Path]) -> str
+    command = ['git', '-c', 'core.quotePath=false'] + args
+
+    try:
+        process = subprocess.Popen(command,
+                                   cwd=None if cwd is None else str(cwd),
+                                   stdout=subprocess.PIPE,
+                                   stderr=subprocess.PIPE)
+    except OSError as err:
+        raise GitError('cannot run git: {err}'.format(err=err))
+
+    stdout, stderr = process.communicate()
+
+    if process.returncode != 0:
+        raise GitError('`{command}` failed: {stderr}'.format(
+            command=' '.join(command),
+            stderr=stderr.decode('utf-8', 'replace').strip()))
+
+    return stdout.decode('utf-8', 'replace')
+
+
+def _unquote_path(path):  # type: (str) -> str
+    # NOTE: Git quotes paths that have special characters such as tabs like C strings.
+    if not (path.startswith('"') and path.endswith('"')):
+        return path
+
+    return codecs.escape_decode(path[1:-1].encode('utf-8'))[0].decode('utf-8', 'replace')
@@ -0,0 +1,197 @@
+from typing import Any, Dict, List, Optional, Tuple  # noqa: F401
+import os
+import re
+
+GITIGNORE_FILE_NAME = '.gitignore'
+GIT_DIR_NAME = '.git'
+
+
+class GitIgnore(object):
+    """ Compiled patterns of a .gitignore file. Paths to match are relative
+    to the directory that has the file, and they are separated by "/".
+    SEE: https://git-scm.com/docs/gitignore
+    """
+    def __init__(self, lines):  # type: (List[str]) -> None
+        self._rules = []  # type: List[Tuple[Any, bool, bool]]
+
+        for line in lines:
+            rule = _compile_line(line)
+
+            if rule is not None:
+                self._rules.append(rule)
+
+        # NOTE: The last matching pattern decides the result.
+        self._rules.reverse()
+
+
+    @classmethod
+    def from_file(cls, file_path):  # type: (str) -> GitIgnore
+        with open(file_path, 'rb') as file_obj:
+            lines = file_obj.read().decode('utf-8', 'replace').splitlines()
+
+        return cls(lines)
+
+
+    def match(self, path, is_dir):  # type: (str, bool) -> Optional[bool]
+        """ Returns True if the path is ignored, False if the path is
+        re-included by a negative pattern, or None if no patterns match.
+        """
+        for match_path, is_negative, is_dir_only in self._rules:
+            if is_dir_only and not is_dir:
+                continue
+
+            if match_path(path):
+                return not is_negative
+
+        return None
+
+
+
+class GitIgnoreCache(object):
+    """ A cache of compiled .gitignore files by directories. Directories
+    that have no .gitignore files are also cached.
+    """
+    def __init__(self):
+        self._gitignores = {}  # type: Dict[str, Optional[GitIgnore]]
+
+
+    def get(self, dir_path):  # type: (str) -> Optional[GitIgnore]
+        if dir_path in self._gitignores:
+            return self._gitignores[dir_path]
+
+        gitignore = _load_gitignore(os.path.join(dir_path, GITIGNORE_FILE_NAME))
+        self._gitignores[dir_path] = gitignore
+        return gitignore
+
+
+    def get_ancestor_gitignores(self, dir_path):
+        # type: (str) -> List[Tuple[GitIgnore, str]]
+        """ Returns pairs of .gitignore files that apply to files in the
+        directory and the path prefixes of the directory from the directories
+        that have the files. The directory itself is not included. The pairs
+        are ordered from the root of the working tree, so later pairs have
+        higher precedence. It returns no pairs out of working trees.
+        """
+        ancestor_gitignores = []
+        current_path = os.path.abspath(dir_path or os.curdir)
+        prefix = ''
+
+        while not os.path.exists(os.path.join(current_path, GIT_DIR_NAME)):
+            parent_path, name = os.path.split(current_path)
+            if parent_path == current_path:
+                return []
+
+            prefix = name + '/' + prefix
+            current_path = parent_path
+
+            gitignore = self.get(current_path)
+            if gitignore is not None:
+                ancestor_gitignores.append((gitignore, prefix))
+
+        # NOTE: Patterns in .git/info/exclude have the lowest precedence.
+        info_exclude = _load_gitignore(os.path.join(current_path, GIT_DIR_NAME, 'info', 'exclude'))
+        if info_exclude is not None:
+            ancestor_gitignores.append((info_exclude, prefix))
+
+        ancestor_gitignores.reverse()
+        return ancestor_gitignores
+
+
+
+def is_ignored_by_gitignores(gitignores, name, is_dir):
+    # type: (List[Tuple[GitIgnore, str]], str, bool) -> bool
+    """ Returns whether the entry is ignored. Gitignores are pairs of
+    .gitignore files and path prefixes of the directory that has the entry.
+    Later pairs have higher precedence.
+    """
+    for gitignore, prefix in reversed(gitignores):
+        is_ignored = gitignore.match(prefix + name, is_dir)
+
+        if is_ignored is not None:
+            return is_ignored
+
+    return False
+
+
+def _load_gitignore(file_path):  # type: (str) -> Optional[GitIgnore]
+    if not os.path.isfile(file_path):
+        return None
+
+    try:
+        return GitIgnore.from_file(file_path)
+    except (IOError, OSError):
+        return None
+
+
+def _compile_line(line):  # type: (str) -> Optional[Tuple[Any, bool, bool]]
+    # NOTE: Trailing spaces are ignored unless they are escaped by backslashes.
+    line = re.sub(r'(?<!\\) +$', '', line)
+
+    if line == '' or line.startswith('#'):
+        return None
+
+    is_negative = line.startswith('!')
+    if is_negative:
+        line = line[1:]
+
+    is_dir_only = line.endswith('/')
+    line = line.rstrip('/')
+
+    if line == '':
+        return None
+
+    # NOTE: Patterns that have separators at the beginning or the middle are
+    #       relative to the directory. Others match names at any level.
+    is_anchored = '/' in line
+    segments = line.lstrip('/').split('/')
+    regex = '' if is_anchored else '(?:.*/)?'
+
+    for index, segment in enumerate(segments):
+        is_last = index == len(segments) - 1
+
+        if segment == '**':
+            regex += '.*' if is_last else '(?:.*/)?'
+        else:
+            regex += _translate_segment(segment) + ('' if is_last else '/')
+
+    return re.compile(regex + r'\Z', re.DOTALL).match, is_negative, is_dir_only
+
+
+def _translate_segment(segment):  # type: (str) -> str
+    regex = ''
+    index = 0
+
+    while index < len(segment):
+        char = segment[index]
+        index += 1
+
+        if char == '*':
+            regex += '[^/]*'
+        elif char == '?':
+            regex += '[^/]'
+        elif char == '\\' and index < len(segment):
+            regex += re.escape(segment[index])
+            index += 1
+        elif char == '[':
+            # NOTE: "]" just after "[" or "[!" is a member of the set.
+            end_index = index
+            if end_index < len(segment) and segment[end_index] in '!^':
+                end_index += 1
+            if end_index < len(segment) and segment[end_index] == ']':
+                end_index += 1
+            end_index = segment.find(']', end_index)
+
+            if end_index < 0:
+                regex += re.escape(char)
+                continue
+
+            members = segment[index:end_index].replace('\\', '\\\\')
+            if members[:1] in ('!', '^'):
+                members = '^' + members[1:]
+
+            regex += '[' + members + ']'
+            index = end_index + 1
+        else:
+            regex += re.escape(char)
+
+    return regex
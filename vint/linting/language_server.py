@@ -0,0 +1,368 @@
+from typing import Dict, Any, List, Optional, Set  # noqa: F401
+import json
+import time
+import hashlib
+import logging
+import threading
+from pathlib import Path
+from io import BufferedIOBase  # noqa: F401
+
+try:
+    import queue
+except ImportError:
+    # NOTE: The module was renamed in Python 3.
+    import Queue as queue  # type: ignore
+
+try:
+    from urllib.parse import urlparse, unquote
+except ImportError:
+    from urlparse import urlparse  # type: ignore
+    from urllib import unquote  # type: ignore
+
+from vint._bundles import vimlparser
+from vint.linting.linter import Linter  # noqa: F401
+from vint.linting.level import Level
+from vint.linting.lint_target import LintTargetBuffer
+
+
+DEFAULT_DEBOUNCE_DELAY = 0.3
+
+# SEE: https://microsoft.github.io/language-server-protocol/specification
+_TEXT_DOCUMENT_SYNC_KIND_FULL = 1
+_METHOD_NOT_FOUND = -32601
+_INTERNAL_ERROR = -32603
+
+_DIAGNOSTIC_SEVERITIES = {
+    Level.ERROR: 1,
+    Level.WARNING: 2,
+    Level.STYLE_PROBLEM: 3,
+}
+
+_ENCODING = 'utf-8'
+
+
+class TextDocument(object):
+    """ A class for documents that are opened by the client. """
+    def __init__(self, uri, text):
+        # type: (str, str) -> None
+        self.uri = uri
+        self.path = _uri_to_path(uri)
+        self.text = text
+        self.ast = None  # type: Optional[Dict[str, Any]]
+        self.ast_text = None  # type: Optional[str]
+        self.linted_text_hash = None  # type: Optional[str]
+
+
+    def get_text_hash(self):  # type: () -> str
+        return hashlib.sha1(self.text.encode(_ENCODING)).hexdigest()
+
+
+class LanguageServer(object):
+    """ A class for language servers that publish violations as diagnostics.
+    The server keeps opened documents and their latest ASTs. Changes of
+    documents are debounced, and only documents that are changed since the
+    last linting are linted again.
+    """
+    def __init__(self, linter, reader, writer, max_violations=None, debounce_delay=DEFAULT_DEBOUNCE_DELAY):
+        # type: (Linter, BufferedIOBase, BufferedIOBase, Optional[int], float) -> None
+        self._linter = linter
+        self._reader = reader
+        self._writer = writer
+        self._max_violations = max_violations
+        self._debounce_delay = debounce_delay
+
+        self._messages = queue.Queue()  # type: queue.Queue
+        self._documents = {}  # type: Dict[str, TextDocument]
+        self._changed_uris = set()  # type: Set[str]
+        self._lint_deadline = None  # type: Optional[float]
+
+
+    def serve(self):  # type: () -> int
+        """ Serve until the exit notification, and return the exit status. """
+        # NOTE: Handle messages on another thread to debounce changes while waiting for messages.
+        #       Messages are read on the main thread, because a thread blocked by reading
+        #       the standard input prevents the interpreter from exiting.
+        handler_thread = threading.Thread(target=self._handle_messages)
+        handler_thread.start()
+
+        try:
+            return self._read_messages()
+        finally:
+            self._messages.put(None)
+            handler_thread.join()
+
+
+    def _read_messages(self):  # type: () -> int
+        """ Read messages until the exit notification, and return the exit status. """
+        is_shutdown_requested = False
+
+        while True:
+            try:
+                message = _read_message(self._reader)
+            except ValueError as err:
+                logging.debug('{cls}: ignore the invalid message: {err}'.format(
+                    cls=self.__class__.__name__,
+                    err=err))
+                continue
+
+            if message is None:
+                # NOTE: The client exited without the exit notification.
+                return 1
+
+            method = message.get('method')
+
+            if method == 'exit':
+                return 0 if is_shutdown_requested else 1
+
+            if method == 'shutdown':
+                is_shutdown_requested = True
+
+            self._messages.put(message)
+
+
+    def _handle_messages(self):  # type: () -> None
+        while True:
+            try:
+                message = self._messages.get(timeout=self._get_time_to_lint())
+            except queue.Empty:
+                self._lint_changed_documents()
+                continue
+
+            if message is None:
+                return
+
+            # NOTE: Broken messages should not stop handling the following
+            #       messages, or requests such as shutdown never get responses.
+            try:
+                self._handle_message(message)
+            except Exception as err:
+                error_message = '{type}: {err}'.format(type=type(err).__name__, err=err)
+
+                logging.error('{cls}: cannot handle `{method}`: {error_message}'.format(
+                    cls=self.__class__.__name__,
+                    method=message.get('method'),
+                    error_message=error_message))
+
+                if 'id' in message:
+                    self._respond_error(message, _INTERNAL_ERROR, error_message)
+
+
+    def _get_time_to_lint(self):  # type: () -> Optional[float]
+        if self._lint_deadline is None:
+            return None
+
+        return max(0.0, self._lint_deadline - time.time())
+
+
+    def _handle_message(self, message):  # type: (Dict[str, Any]) -> None
+        method = message.get('method')
+        params = message.get('params', {})
+
+        if method == 'initialize':
+            self._respond(message, {
+                'capabilities': {
+                    'textDocumentSync': {
+                        'openClose': True,
+                        'change': _TEXT_DOCUMENT_SYNC_KIND_FULL,
+                    },
+                },
+                'serverInfo': {'name': 'vint'},
+            })
+        elif method == 'shutdown':
+            self._respond(message, None)
+        elif method == 'textDocument/didOpen':
+            text_document = params['textDocument']
+            uri = text_document['uri']
+
+            self._documents[uri] = TextDocument(uri, text_document['text'])
+            self._lint_document(self._documents[uri])
+        elif method == 'textDocument/didChange':
+            uri = params['textDocument']['uri']
+
+            if uri in self._documents:
+                # NOTE: The server requires full texts, so the last change has the whole text.
+                self._documents[uri].text = params['contentChanges'][-1]['text']
+                self._changed_uris.add(uri)
+                self._lint_deadline = time.time() + self._debounce_delay
+        elif method == 'textDocument/didClose':
+            uri = params['textDocument']['uri']
+
+            self._documents.pop(uri, None)
+            self._changed_uris.discard(uri)
+            self._publish_diagnostics(uri, [])
+        elif 'id' in message:
+            self._respond_error(message, _METHOD_NOT_FOUND, 'method not found: {method}'.format(method=method))
+
+
+    def _lint_changed_documents(self):  # type: () -> None
+        changed_uris = self._changed_uris
+        self._changed_uris = set()
+        self._lint_deadline = None
+
+        for uri in sorted(changed_uris):
+            try:
+                self._lint_document(self._documents[uri])
+            except Exception as err:
+                logging.error('{cls}: cannot check `{uri}`: {type}: {err}'.format(
+                    cls=self.__class__.__name__,
+                    uri=uri,
+                    type=type(err).__name__,
+                    err=err))
+
+
+    def _lint_document(self, document):  # type: (TextDocument) -> None
+        text_hash = document.get_text_hash()
+
+        # NOTE: Changes may be undone before linting.
+        if text_hash == document.linted_text_hash:
+            return
+
+        logging.debug('{cls}: checking `{uri}`'.format(
+            cls=self.__class__.__name__,
+            uri=document.uri))
+
+        try:
+            document.ast = self._parse_document(document)
+            document.ast_text = document.text
+        except vimlparser.VimLParserException as exception:
+            document.ast = None
+            document.ast_text = None
+            violations = [self._linter.create_parse_error(document.path, str(exception))]
+        else:
+            # NOTE: Some policies read bytes of the lint target.
+            lint_target = LintTargetBuffer(document.path, document.text.encode(_ENCODING))
+            violations = self._linter.lint_ast(document.ast, lint_target, self._max_violations)
+
+        document.linted_text_hash = text_hash
+
+        lines = document.text.split('\n')
+        self._publish_diagnostics(document.uri, [_violation_to_diagnostic(violation, lines) for violation in violations])
+
+
+    def _parse_document(self, document):  # type: (TextDocument) -> Dict[str, Any]
+        if document.ast is None:
+            return self._linter.parse_string(document.text)
+
+        # NOTE: Parse only changed statements to lint large files while typing.
+        return self._linter.parse_string_incrementally(document.ast, document.ast_text, document.text)
+
+
+    def _publish_diagnostics(self, uri, diagnostics):
+        # type: (str, List[Dict[str, Any]]) -> None
+        self._send({
+            'jsonrpc': '2.0',
+            'method': 'textDocument/publishDiagnostics',
+            'params': {
+                'uri': uri,
+                'diagnostics': diagnostics,
+            },
+        })
+
+
+    def _respond(self, request, result):  # type: (Dict[str, Any], Any) -> None
+        self._send({
+            'jsonrpc': '2.0',
+            'id': request['id'],
+            'result': result,
+        })
+
+
+    def _respond_error(self, request, code, error_message):
+        # type: (Dict[str, Any], int, str) -> None
+        self._send({
+            'jsonrpc': '2.0',
+            'id': request['id'],
+            'error': {
+                'code': code,
+                'message': error_message,
+            },
+        })
+
+
+    def _send(self, message):  # type: (Dict[str, Any]) -> None
+        body = json.dumps(message).encode(_ENCODING)
+        header = 'Content-Length: {length}\r\n\r\n'.format(length=len(body)).encode('ascii')
+
+        self._writer.write(header + body)
+        self._writer.flush()
+
+
+
+def _read_message(reader):  # type: (BufferedIOBase) -> Optional[Dict[str, Any]]
+    """ Returns a message, or None if the stream is closed. """
+    content_length = None
+
+    while True:
+        header_line = reader.readline()
+
+        if not header_line:
+            return None
+
+        header_line = header_line.strip()
+
+        if not header_line:
+            break
+
+        name, _, value = header_line.decode('ascii').partition(':')
+
+        if name.strip().lower() == 'content-length':
+            content_length = int(value)
+
+    if content_length is None:
+        raise ValueError('Content-Length is missing')
+
+    body = reader.read(content_length)
+
+    if len(body) < content_length:
+        return None
+
+    message = json.loads(body.decode(_ENCODING))
+
+    if not isinstance(message, dict):
+        raise ValueError('message is not an object')
+
+    return message
+
+
+
+def _violation_to_diagnostic(violation, lines):  # type: (Dict[str, Any], List[str]) -> Dict[str, Any]
+    # NOTE: Positions of LSP are 0-based.
+    line_index = max(0, violation['position']['line'] - 1)
+    line = lines[line_index] if line_index < len(lines) else ''
+
+    position = {
+        'line': line_index,
+        'character': _get_utf16_character(line, violation['position']['column']),
+    }
+
+    return {
+        'range': {
+            'start': position,
+            'end': position,
+        },
+        'severity': _DIAGNOSTIC_SEVERITIES[violation['level']],
+        'code': violation['name'],
+        'source': 'vint',
+        'message': '{description} (see {reference})'.format(
+            description=violation['description'],
+            reference=violation['reference']),
+    }
+
+
+
+def _get_utf16_character(line, column):  # type: (str, int) -> int
+    """ Returns the 0-based offset in UTF-16 code units that LSP uses from the
+    1-based byte column of vint.
+    """
+    line_prefix = line.encode(_ENCODING)[:max(0, column - 1)].decode(_ENCODING, 'ignore')
+    return len(line_prefix.encode('utf-16-le')) // 2
+
+
+def _uri_to_path(uri):  # type: (str) -> Path
+    parsed_uri = urlparse(uri)
+
+    if parsed_uri.scheme != 'file':
+        # NOTE: Unsaved buffers have no file paths.
+        return Path(uri)
+
+    return Path(unquote(parsed_uri.path))
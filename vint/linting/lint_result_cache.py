@@ -0,0 +1,213 @@
+from typing import Dict, Any, List, Optional  # noqa: F401
+import os
+import json
+import errno
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from vint.linting.level import Level
+
+
+DEFAULT_MAX_CACHE_SIZE = 64 * 1024 * 1024
+CACHE_FILE_EXTNAME = '.json'
+
+# NOTE: Evict entries until the cache size become lower than the ratio of
+#       the max size. It prevents evictions on every run.
+_EVICTION_TARGET_RATIO = 0.8
+
+
+class LintCacheStats(object):
+    def __init__(self, hits=0, misses=0):
+        # type: (int, int) -> None
+        self.hits = hits
+        self.misses = misses
+
+
+    def merge(self, other):  # type: (LintCacheStats) -> None
+        self.hits += other.hits
+        self.misses += other.misses
+
+
+    def __str__(self):
+        total = self.hits + self.misses
+        hit_rate = 100.0 * self.hits / total if total > 0 else 0.0
+
+        return '{hits} hits, {misses} misses ({hit_rate:.1f}% hit rate)'.format(
+            hits=self.hits,
+            misses=self.misses,
+            hit_rate=hit_rate)
+
+
+class LintResultCache(object):
+    """ A class for content-addressed caches of lint results.
+    The cache stores violations of a file under the key that is a hash of
+    the file content, the file path and the fingerprint of what affects the
+    lint results.
+    So changed files or changed configs never hit stale results.
+
+    Cache files are written atomically, so concurrent runs can share the
+    cache directory. Broken or vanished cache files are treated as misses.
+    """
+    def __init__(self, cache_dir, version, max_size=DEFAULT_MAX_CACHE_SIZE):
+        # type: (Path, str, int) -> None
+        self._cache_dir = cache_dir
+        self._version = version
+        self._max_size = max_size
+        self.stats = LintCacheStats()
+
+
+    def build_key(self, content_bytes, path, fingerprint):
+        # type: (bytes, Path, Dict[str, Any]) -> str
+        """ Returns a cache key by the file content, the path and the fingerprint.
+        The fingerprint should contain anything that affects lint results.
+        """
+        hasher = hashlib.sha256(content_bytes)
+
+        # NOTE: Some policies depend on paths such as "autoload" directories,
+        #       so the same contents on other paths should not share results.
+        fingerprint_with_version = dict(fingerprint, version=self._version, path=path.as_posix())
+        serialized_fingerprint = json.dumps(fingerprint_with_version, sort_keys=True, default=str)
+        hasher.update(serialized_fingerprint.encode('utf-8'))
+
+        return hasher.hexdigest()
+
+
+    def get(self, key, path):
+        # type: (str, Path) -> Optional[List[Dict[str, Any]]]
+        """ Returns cached violations for the path, or None if not cached. """
+        cache_file_path = self._get_cache_file_path(key)
+
+        try:
+            with cache_file_path.open('r') as f:
+                serialized_violations = json.load(f)
+
+            violations = [deserialize_violation(serialized_violation, path)
+                          for serialized_violation in serialized_violations]
+        except (IOError, OSError, ValueError, KeyError, TypeError):
+            self.stats.misses += 1
+            return None
+
+        # NOTE: Update mtime to make evictions least recently used order.
+        try:
+            os.utime(str(cache_file_path), None)
+        except OSError:
+            pass
+
+        self.stats.hits += 1
+        return violations
+
+
+    def put(self, key, violations):
+        # type: (str, List[Dict[str, Any]]) -> None
+        cache_file_path = self._get_cache_file_path(key)
+        serialized_violations = [serialize_violation(violation) for violation in violations]
+
+        try:
+            _make_dirs(cache_file_path.parent)
+
+            # NOTE: Write to a temporary file at first, and then rename it to
+            #       prevent other processes from reading incomplete files.
+            fd, tmp_path = tempfile.mkstemp(dir=str(cache_file_path.parent), suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(serialized_violations, f)
+
+                _replace(tmp_path, str(cache_file_path))
+            except Exception:
+                os.remove(tmp_path)
+                raise
+        except (IOError, OSError) as err:
+            logging.debug('{cls}: cannot write the cache: {err}'.format(
+                cls=self.__class__.__name__,
+                err=err))
+
+
+    def evict(self):  # type: () -> None
+        """ Remove least recently used cache files until the cache size become lower than the max size. """
+        cache_files = []
+        total_size = 0
+
+        for dir_path, _, file_names in os.walk(str(self._cache_dir)):
+            for file_name in file_names:
+                if not file_name.endswith(CACHE_FILE_EXTNAME):
+                    continue
+
+                file_path = os.path.join(dir_path, file_name)
+
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+
+                cache_files.append((stat.st_mtime, stat.st_size, file_path))
+                total_size += stat.st_size
+
+        if total_size <= self._max_size:
+            return
+
+        target_size = self._max_size * _EVICTION_TARGET_RATIO
+
+        for _, size, file_path in sorted(cache_files):
+            if total_size <= target_size:
+                break
+
+            try:
+                os.remove(file_path)
+            except OSError:
+                # NOTE: Other processes may remove it.
+                continue
+
+            total_size -= size
+
+
+    def _get_cache_file_path(self, key):  # type: (str) -> Path
+        # NOTE: Use sub directories to avoid too many files in a directory.
+        return Path(self._cache_dir, key[:2], key + CACHE_FILE_EXTNAME)
+
+
+
+def serialize_violation(violation):  # type: (Dict[str, Any]) -> Dict[str, Any]
+    # NOTE: The path is not stored because the same content can be at other paths.
+    return {
+        'name': violation['name'],
+        'level': violation['level'].name,
+        'description': violation['description'],
+        'reference': violation['reference'],
+        'line': violation['position']['line'],
+        'column': violation['position']['column'],
+    }
+
+
+
+def deserialize_violation(serialized_violation, path):
+    # type: (Dict[str, Any], Path) -> Dict[str, Any]
+    return {
+        'name': serialized_violation['name'],
+        'level': Level[serialized_violation['level']],
+        'description': serialized_violation['description'],
+        'reference': serialized_violation['reference'],
+        'position': {
+            'line': serialized_violation['line'],
+            'column': serialized_violation['column'],
+            'path': path,
+        },
+    }
+
+
+
+def _make_dirs(dir_path):  # type: (Path) -> None
+    try:
+        os.makedirs(str(dir_path))
+    except OSError as err:
+        # NOTE: Other processes may create it at the same time.
+        if err.errno != errno.EEXIST:
+            raise
+
+
+
+def _replace(src, dst):  # type: (str, str) -> None
+    # NOTE: os.replace is not defined in Python 2. But os.rename is
+    #       atomic and overwrite the destination on POSIX.
+    replace = getattr(os, 'replace', os.rename)
+    replace(src, dst)
@@ -35,6 +35,18 @@ class LintTargetBufferedStream(AbstractLintTarget):
         return self._buffered_io.read()
 
 
+class LintTargetBuffer(AbstractLintTarget):
+    """ A class for lint targets that are on memory such as editor buffers. """
+    def __init__(self, alternate_path, content_bytes):
+        # type: (Path, bytes) -> None
+        super(LintTargetBuffer, self).__init__(alternate_path)
+        self._content_bytes = content_bytes
+
+
+    def read(self):  # type: () -> bytes
+        return self._content_bytes
+
+
 class CachedLintTarget(AbstractLintTarget):
     def __init__(self, lint_target):
         # type: (AbstractLintTarget) -> None
@@ -1,25 +1,31 @@
-from typing import Dict, Any, List  # noqa: F401
+from typing import Dict, Any, List, Optional, Set, Tuple  # noqa: F401
 import re
 import logging
-from typing import Dict, List, Any  # noqa: F401
 from pathlib import Path
 from vint._bundles import vimlparser
 from vint.encodings.decoder import EncodingDetectionError
 from vint.ast.parsing import Parser
-from vint.ast.node_type import NodeType
+from vint.ast.node_type import NodeType, create_node_type_table  # noqa: F401
 from vint.ast.traversing import traverse
+from vint.ast.node_index import NodeIndex, get_node_index, attach_node_index, find_comment_nodes  # noqa: F401
 from vint.ast.plugin.scope_plugin import ScopePlugin
-from vint.linting.lint_target import AbstractLintTarget
+from vint.linting.lint_target import AbstractLintTarget, CachedLintTarget
+from vint.linting.lint_result_cache import LintResultCache
 from vint.linting.config.config_container import ConfigContainer
 from vint.linting.config.config_dict_source import ConfigDictSource
 from vint.linting.config.config_abstract_dynamic_source import ConfigAbstractDynamicSource
 from vint.linting.config.config_toggle_comment_source import ConfigToggleCommentSource
 from vint.linting.config.config_next_line_comment_source import ConfigNextLineCommentSource
 from vint.linting.config.config_util import get_config_value
+from vint.linting.config.config_comment_parser import ConfigComment, find_config_comments  # noqa: F401
 from vint.linting.level import Level
 from vint.linting.policy_set import PolicySet
 
 
+class _MaxViolationsReached(Exception):
+    pass
+
+
 class Linter(object):
     """ A class for Linters.
     This class provides a linting algorithm that know how to lint by Policy
@@ -35,8 +41,8 @@ class Linter(object):
     are found in traversing. The Linter class collect violations that are
     returned by policies.
     """
-    def __init__(self, policy_set, config_dict_global):
-        # type: (PolicySet, Dict[str, Any]) -> None
+    def __init__(self, policy_set, config_dict_global, cache=None):
+        # type: (PolicySet, Dict[str, Any], Optional[LintResultCache]) -> None
         self._is_debug = get_config_value(config_dict_global, ['cmdargs', 'verbose'], False)
 
         self._plugins = {
@@ -47,22 +53,39 @@ class Linter(object):
         self._config_dict_global = config_dict_global
         self._parser = self.build_parser()
 
-        self._listeners_map = {}
+        # NOTE: Files to lint are parsed without plugins, and plugins run only
+        #       if enabled policies require them. See _process_by_plugins.
+        self._parser_without_plugins = Parser(enable_neovim=self._is_neovim_enabled())
+        self._plugin_names_required_globally = None  # type: Optional[Set[str]]
 
+        # NOTE: Listening policies are in a table indexed by values of node
+        #       types to find them without NodeType(node['type']).
+        self._listeners_table = ()  # type: Tuple[Tuple[Any, ...], ...]
+
+        # NOTE: The global config is never changed, so listeners tables only depend on
+        #       the policy switches of dynamic configs.
+        self._listeners_table_cache = {}  # type: Dict[Any, Tuple[Tuple[Any, ...], ...]]
+
+        self._cache = cache
+        self._max_violations = None  # type: Optional[int]
+        self._cache_fingerprint = self._build_cache_fingerprint() if cache is not None else None
 
-    def build_parser(self):
-        enable_neovim = get_config_value(self._config_dict_global, ['cmdargs', 'env', 'neovim'], False)
 
-        parser = Parser([self._plugins['scope']], enable_neovim=enable_neovim)
+    def build_parser(self):
+        parser = Parser([self._plugins['scope']], enable_neovim=self._is_neovim_enabled(), build_node_index=True)
         return parser
 
 
+    def _is_neovim_enabled(self):  # type: () -> bool
+        return get_config_value(self._config_dict_global, ['cmdargs', 'env', 'neovim'], False)
+
+
     def _parse_vimlparser_error(self, err_message):
         match = re.match(r'vimlparser: (?P<description>.*): line (?P<line_number>\d+) col (?P<column_number>\d+)$', err_message)
         return match.groupdict()
 
 
-    def _create_parse_error(self, path, err_message):
+    def create_parse_error(self, path, err_message):
         parser_error = self._parse_vimlparser_error(err_message)
         return {
             'name': 'SyntaxError',
@@ -91,16 +114,68 @@ class Linter(object):
         }
 
 
-    def lint(self, lint_target):  # type: (AbstractLintTarget) -> List[Dict[str, Any]]
+    def _build_cache_fingerprint(self):  # type: () -> Dict[str, Any]
+        """ Returns a fingerprint of anything that affects lint results except file contents. """
+        config_dict = self._config_dict_global
+
+        self._policy_set.update_by_config(config_dict)
+        enabled_policy_names = sorted(policy.name for policy in self._policy_set.get_enabled_policies())
+
+        return {
+            'severity': get_config_value(config_dict, ['cmdargs', 'severity']),
+            'neovim': get_config_value(config_dict, ['cmdargs', 'env', 'neovim'], False),
+            'policies': config_dict.get('policies', {}),
+            'enabled_policies': enabled_policy_names,
+        }
+
+
+    def lint(self, lint_target, max_violations=None):
+        # type: (AbstractLintTarget, Optional[int]) -> List[Dict[str, Any]]
+        """ Returns violations in the lint target.
+        Linting stops when the number of violations reaches max_violations.
+        """
         logging.debug('checking: `{file_path}`'.format(file_path=lint_target.path))
 
+        self._max_violations = max_violations
+
+        if self._cache is None:
+            return self._lint_without_cache(lint_target)
+
+        # NOTE: Prevent reading the file twice for the cache key and the parser.
+        if not isinstance(lint_target, CachedLintTarget):
+            lint_target = CachedLintTarget(lint_target)
+
+        cache_key = self._cache.build_key(lint_target.read(), lint_target.path, self._cache_fingerprint)
+        cached_violations = self._cache.get(cache_key, lint_target.path)
+
+        if cached_violations is not None:
+            logging.debug('{cls}: using cached result for `{file_path}`'.format(
+                cls=self.__class__.__name__,
+                file_path=lint_target.path))
+            return cached_violations
+
+        violations = self._lint_without_cache(lint_target)
+
+        # NOTE: Truncated results should not be reused on runs without the limit.
+        if not self._is_truncated(violations):
+            self._cache.put(cache_key, violations)
+
+        return violations
+
+
+    def _is_truncated(self, violations):  # type: (List[Dict[str, Any]]) -> bool
+        return self._max_violations is not None and len(violations) >= self._max_violations
+
+
+    def _lint_without_cache(self, lint_target):  # type: (AbstractLintTarget) -> List[Dict[str, Any]]
         try:
-            root_ast = self._parser.parse(lint_target)
+            root_ast = self._parser_without_plugins.parse(lint_target)
+            self._process_by_plugins(root_ast, lint_target)
         except vimlparser.VimLParserException as exception:
-            parse_error = self._create_parse_error(lint_target.path, str(exception))
+            parse_error = self.create_parse_error(lint_target.path, str(exception))
             return [parse_error]
         except EncodingDetectionError as exception:
-            decoding_error = self._create_decoding_error(lint_target, str(exception))
+            decoding_error = self._create_decoding_error(lint_target.path, str(exception))
             return [decoding_error]
 
         self._traverse(root_ast, lint_target)
@@ -108,6 +183,82 @@ class Linter(object):
         return self._violations
 
 
+    def _process_by_plugins(self, root_ast, lint_target):
+        # type: (Dict[str, Any], AbstractLintTarget) -> None
+        # NOTE: The plugins fill the index in their traversals to include the
+        #       nodes that they attached, so find comments without the index here.
+        config_comments = find_config_comments(find_comment_nodes(root_ast))
+        required_plugin_names = self._get_required_plugin_names(config_comments)
+
+        logging.debug('{cls}: run plugins {plugin_names} for `{file_path}`'.format(
+            cls=self.__class__.__name__,
+            plugin_names=sorted(required_plugin_names),
+            file_path=lint_target.path))
+
+        scope_plugin = self._plugins['scope']
+        node_index = NodeIndex()
+
+        if 'scope' in required_plugin_names:
+            scope_plugin.process_and_index(root_ast, node_index)
+        else:
+            # NOTE: Policies that do not need scopes also check contents of strings.
+            scope_plugin.attach_sub_expressions(root_ast, node_index)
+
+        attach_node_index(root_ast, node_index)
+
+
+    def _get_required_plugin_names(self, config_comments):
+        # type: (List[Tuple[Dict[str, Any], ConfigComment]]) -> Set[str]
+        if self._plugin_names_required_globally is None:
+            self._plugin_names_required_globally = self._collect_required_plugin_names(
+                self._policy_set.get_policies_enabled_by_config(self._config_dict_global))
+
+        # NOTE: Config comments can enable policies that the global config disables.
+        policy_names_enabled_by_comments = set(
+            policy_name
+            for _, config_comment in config_comments
+            for policy_name, policy_config in config_comment.config_dict['policies'].items()
+            if policy_config.get('enabled', False)
+        )
+        policies_enabled_by_comments = self._policy_set.get_policies_by_names(policy_names_enabled_by_comments)
+
+        return self._plugin_names_required_globally | self._collect_required_plugin_names(policies_enabled_by_comments)
+
+
+    @classmethod
+    def _collect_required_plugin_names(cls, policies):  # type: (List[Any]) -> Set[str]
+        return set(plugin_name for policy in policies for plugin_name in policy.required_plugins)
+
+
+    def parse_string(self, string):  # type: (str) -> Dict[str, Any]
+        """ Returns the AST of the string processed by the plugins of the linter.
+        It raises vimlparser.VimLParserException if the string is invalid.
+        """
+        return self._parser.parse_string(string)
+
+
+    def parse_string_incrementally(self, previous_ast, previous_string, string):
+        # type: (Dict[str, Any], str, str) -> Dict[str, Any]
+        """ Returns the AST of the string by reusing the AST of the previous string.
+        The previous AST must be the latest one returned by parse_string or
+        this method. It raises vimlparser.VimLParserException if the string is invalid.
+        """
+        return self._parser.parse_string_incrementally(previous_ast, previous_string, string)
+
+
+    def lint_ast(self, root_ast, lint_target, max_violations=None):
+        # type: (Dict[str, Any], AbstractLintTarget, Optional[int]) -> List[Dict[str, Any]]
+        """ Returns violations in the AST that is returned by parse_string.
+        It is for callers that parse contents by themselves such as editors.
+        The AST must be the latest one returned by parse_string, because
+        plugins keep states of the latest AST.
+        """
+        self._max_violations = max_violations
+        self._traverse(root_ast, lint_target)
+
+        return self._violations
+
+
     def _traverse(self, root_ast, lint_target):
         if self._is_debug:
             logging.debug('{cls}: checking `{file_path}`'.format(
@@ -119,36 +270,62 @@ class Linter(object):
                 config_dict=self._config_dict_global
             ))
 
-        self._prepare_for_traversal()
+        # NOTE: ASTs from other parsers do not have the index.
+        node_index = get_node_index(root_ast)
+        if node_index is None:
+            node_index = attach_node_index(root_ast)
+
+        self._prepare_for_traversal(node_index)
 
         lint_context = {
             'lint_target': lint_target,
             'root_node': root_ast,
+            'node_index': node_index,
             'stack_trace': [],
             'plugins': self._plugins,
             'config': self._config.get_config_dict(),
         }
 
-        traverse(root_ast,
-                 on_enter=lambda node: self._handle_enter(node, lint_context),
-                 on_leave=lambda node: self._handle_leave(node, lint_context))
+        try:
+            traverse(root_ast,
+                     on_enter=lambda node: self._handle_enter(node, lint_context),
+                     on_leave=lambda node: self._handle_leave(node, lint_context))
+        except _MaxViolationsReached:
+            logging.debug('{cls}: stop checking `{file_path}` because of max violations'.format(
+                cls=self.__class__.__name__,
+                file_path=lint_target.path))
 
 
-    def _prepare_for_traversal(self):
+    def _prepare_for_traversal(self, node_index):  # type: (NodeIndex) -> None
         self._dynamic_configs = [
             ConfigToggleCommentSource(),
             ConfigNextLineCommentSource(is_debug=self._is_debug),
         ]  # type: List[ConfigAbstractDynamicSource]
 
+        # NOTE: Dynamic configs change only at config comments, and at the
+        #       first node of each line if there are next-line config comments.
+        #       Find them before traversal to skip the other nodes, so files
+        #       without config comments skip dynamic configs entirely.
+        config_comments = find_config_comments(node_index.get_nodes(NodeType.COMMENT))
+        self._config_comment_node_ids = set(id(node) for node, _ in config_comments)  # type: Set[int]
+        self._has_next_line_config_comment = any(config_comment.is_only_next_line
+                                                 for _, config_comment in config_comments)
+        self._last_lnum = 0
+
         config_dict_source = ConfigDictSource(self._config_dict_global.copy())
         self._config = ConfigContainer(config_dict_source, *self._dynamic_configs)
 
         self._violations = []  # type: List[Dict[str, Any]]
-        self._update_listeners_map()
+        self._update_listeners_table()
+
+        # NOTE: Some policies keep states across nodes. The states should not
+        #       leak to the next file, or results depend on the order of files.
+        self._policy_set.reset_policies()
 
 
     def _handle_enter(self, node, lint_context):
-        self._refresh_policies_if_necessary(node)
+        if len(self._config_comment_node_ids) > 0:
+            self._refresh_policies_if_necessary(node)
 
         if self._is_debug:
             logging.debug("{cls}: checking {pos}".format(
@@ -166,12 +343,7 @@ class Linter(object):
 
 
     def _fire_listeners(self, node, lint_context):
-        node_type = NodeType(node['type'])
-
-        if node_type not in self._listeners_map:
-            return
-
-        listening_policies = self._listeners_map[node_type]
+        listening_policies = self._listeners_table[node['type']]
 
         for listening_policy in listening_policies:
             violation = listening_policy.get_violation_if_found(node, lint_context)
@@ -179,12 +351,31 @@ class Linter(object):
             if violation is not None:
                 self._violations.append(violation)
 
+                if self._is_truncated(self._violations):
+                    raise _MaxViolationsReached()
+
 
     def _refresh_policies_if_necessary(self, node):
+        lnum = node['pos']['lnum']
+        is_line_changed = lnum > self._last_lnum
+
+        if is_line_changed:
+            self._last_lnum = lnum
+
+        is_line_boundary = is_line_changed and self._has_next_line_config_comment
+
+        if not is_line_boundary and id(node) not in self._config_comment_node_ids:
+            return
+
+        is_config_changed = False
+
         for dynamic_config in self._dynamic_configs:
-            dynamic_config.update_by_node(node)
+            # NOTE: Every dynamic config should be notified the node, so do not break here.
+            if dynamic_config.update_by_node(node):
+                is_config_changed = True
 
-        self._update_listeners_map()
+        if is_config_changed:
+            self._update_listeners_table()
 
 
     def _update_enabled_policies(self):
@@ -195,17 +386,45 @@ class Linter(object):
         policy_set.update_by_config(config_dict)
 
 
-    def _update_listeners_map(self):
+    def _get_dynamic_policy_switches(self):
+        """ Returns a hashable fingerprint of the policy switches of dynamic configs. """
+        policy_switches = []
+
+        for dynamic_config in self._dynamic_configs:
+            policies = dynamic_config.get_config_dict().get('policies', {})
+
+            policy_switches.append(tuple(sorted(
+                (policy_name, policy.get('enabled'))
+                for policy_name, policy in policies.items()
+            )))
+
+        return tuple(policy_switches)
+
+
+    def _update_listeners_table(self):
+        policy_switches = self._get_dynamic_policy_switches()
+
+        if policy_switches in self._listeners_table_cache:
+            self._listeners_table = self._listeners_table_cache[policy_switches]
+            return
+
         self._update_enabled_policies()
 
-        self._listeners_map = {}
+        listeners_map = {}  # type: Dict[NodeType, List[Any]]
         policy_set = self._policy_set
 
         for policy in policy_set.get_enabled_policies():
             listened_node_types = policy.listen_node_types()
 
             for listened_node_type in listened_node_types:
-                if listened_node_type not in self._listeners_map:
-                    self._listeners_map[listened_node_type] = [policy]
+                if listened_node_type not in listeners_map:
+                    listeners_map[listened_node_type] = [policy]
                 else:
-                    self._listeners_map[listened_node_type].append(policy)
+                    listeners_map[listened_node_type].append(policy)
+
+        listeners_table = create_node_type_table(
+            dict((node_type, tuple(policies)) for node_type, policies in listeners_map.items()),
+            default=())
+
+        self._listeners_table_cache[policy_switches] = listeners_table
+        self._listeners_table = listeners_table
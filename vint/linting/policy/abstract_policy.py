@@ -3,6 +3,10 @@ class AbstractPolicy(object):
     reference = None
     level = None
 
+    # NOTE: Names of AST plugins that the policy requires such as 'scope'.
+    #       Linters run plugins only if enabled policies require them.
+    required_plugins = []
+
 
     def __init__(self):
         self.name = self.__class__.__name__
@@ -46,6 +50,13 @@ class AbstractPolicy(object):
         return policy_config
 
 
+    def reset(self):
+        """ Resets states of the policy. Linters call it before linting each
+        file, so policies that keep states across nodes should override it.
+        """
+        pass
+
+
     def get_violation_if_found(self, node, lint_context):
         """ Returns a violation if the node is invalid. """
         if self.is_valid(node, lint_context):
@@ -1,5 +1,5 @@
 import re
-from vint.ast.node_type import NodeType
+from vint.ast.node_type import NodeType, get_node_type
 from vint.linting.level import Level
 from vint.linting.policy.abstract_policy import AbstractPolicy
 from vint.linting.policy_registry import register_policy
@@ -36,7 +36,7 @@ class ProhibitAbbreviationOption(AbstractPolicy):
         Abbreviation options are invalid.
         """
 
-        node_type = NodeType(node['type'])
+        node_type = get_node_type(node)
 
         if node_type is NodeType.OPTION:
             # Remove & at head
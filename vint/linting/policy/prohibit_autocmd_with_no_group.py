@@ -15,6 +15,10 @@ class ProhibitAutocmdWithNoGroup(AbstractPolicy):
     is_inside_of_augroup = False
 
 
+    def reset(self):
+        self.is_inside_of_augroup = False
+
+
     def listen_node_types(self):
         return [NodeType.EXCMD]
 
@@ -15,6 +15,11 @@ class ProhibitEncodingOptionAfterScriptEncoding(AbstractPolicy):
     has_encoding_opt_after_scriptencoding = False
 
 
+    def reset(self):
+        self.was_scriptencoding_found = False
+        self.has_encoding_opt_after_scriptencoding = False
+
+
     def listen_node_types(self):
         return [NodeType.EXCMD]
 
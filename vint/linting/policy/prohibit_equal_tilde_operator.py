@@ -1,7 +1,7 @@
 from vint.linting.policy.abstract_policy import AbstractPolicy
 from vint.linting.policy.reference.googlevimscriptstyleguide import get_reference_source
 from vint.linting.level import Level
-from vint.ast.node_type import NodeType
+from vint.ast.node_type import NodeType, get_node_type
 from vint.linting.policy_registry import register_policy
 
 
@@ -67,12 +67,12 @@ class ProhibitEqualTildeOperator(AbstractPolicy):
             False-positive case is: '1' =~ 1
             False-negative case is: ('1') =~ 1
         """
-        node_type = NodeType(node['type'])
+        node_type = get_node_type(node)
 
         left_node = node['left']
         right_node = node['right']
-        left_type = NodeType(left_node['type'])
-        right_type = NodeType(node['right']['type'])
+        left_type = get_node_type(left_node)
+        right_type = get_node_type(node['right'])
 
         is_valid = True
         if left_type is NodeType.STRING:
@@ -13,6 +13,7 @@ from vint.ast.plugin.scope_plugin import (
 class ProhibitImplicitScopeBuiltinVariable(AbstractPolicy):
     reference = ':help local-variable'
     level = Level.WARNING
+    required_plugins = ['scope']
 
 
     def listen_node_types(self):
@@ -12,6 +12,7 @@ from vint.ast.plugin.scope_plugin import (
 class ProhibitImplicitScopeVariable(AbstractPolicy):
     reference = 'Anti-pattern of vimrc (Scope of identifier)'
     level = Level.STYLE_PROBLEM
+    required_plugins = ['scope']
 
 
     def listen_node_types(self):
@@ -1,4 +1,4 @@
-from vint.ast.node_type import NodeType
+from vint.ast.node_type import NodeType, get_node_type
 from vint.linting.level import Level
 from vint.linting.policy.abstract_policy import AbstractPolicy
 from vint.linting.policy_registry import register_policy
@@ -6,11 +6,9 @@ from vint.linting.policy_registry import register_policy
 
 @register_policy
 class ProhibitInvalidMapCall(AbstractPolicy):
-    def __init__(self):
-        super(ProhibitInvalidMapCall, self).__init__()
-        self.description = 'Number of arguments for map() must be 2 (if not, it will throw E118 or E119)'
-        self.reference = ':help map()'
-        self.level = Level.ERROR
+    description = 'Number of arguments for map() must be 2 (if not, it will throw E118 or E119)'
+    reference = ':help map()'
+    level = Level.ERROR
 
 
     def listen_node_types(self):
@@ -20,7 +18,7 @@ class ProhibitInvalidMapCall(AbstractPolicy):
     def is_valid(self, node, lint_context):
         left_node = node['left']
 
-        if NodeType(left_node['type']) != NodeType.IDENTIFIER:
+        if get_node_type(left_node) != NodeType.IDENTIFIER:
             return True
 
         if left_node['value'] != 'map':
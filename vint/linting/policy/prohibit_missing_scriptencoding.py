@@ -1,7 +1,7 @@
 import chardet
 
 from vint.ast.node_type import NodeType
-from vint.ast.traversing import traverse, SKIP_CHILDREN
+from vint.ast.node_index import NodeIndex  # noqa: F401
 from vint.linting.level import Level
 from vint.linting.lint_target import AbstractLintTarget
 from vint.linting.policy.abstract_policy import AbstractPolicy
@@ -14,8 +14,6 @@ class ProhibitMissingScriptEncoding(AbstractPolicy):
     reference = ':help :scriptencoding'
     level = Level.WARNING
 
-    has_scriptencoding = False
-
     def listen_node_types(self):
         return [NodeType.TOPLEVEL]
 
@@ -25,27 +23,15 @@ class ProhibitMissingScriptEncoding(AbstractPolicy):
 
         This policy prohibit scriptencoding missing when multibyte char exists.
         """
-        traverse(node, on_enter=self._check_scriptencoding)
+        node_index = lint_context['node_index']  # type: NodeIndex
+        has_scriptencoding = len(node_index.get_excommands('scriptencoding')) > 0
 
-        if self.has_scriptencoding:
+        if has_scriptencoding:
             return True
 
         return not _has_multibyte_char(lint_context)
 
 
-    def _check_scriptencoding(self, node):
-        # TODO: Use BREAK when implemented
-        if self.has_scriptencoding:
-            return SKIP_CHILDREN
-
-        node_type = NodeType(node['type'])
-
-        if node_type is not NodeType.EXCMD:
-            return
-
-        self.has_scriptencoding = node['str'].startswith('scripte')
-
-
 def _has_multibyte_char(lint_context):
     lint_target = lint_context['lint_target']  # type: AbstractLintTarget
     byte_seq = lint_target.read()
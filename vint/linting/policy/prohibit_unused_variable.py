@@ -11,6 +11,7 @@ from vint.ast.plugin.scope_plugin import ScopeVisibility
 class ProhibitUnusedVariable(AbstractPolicy):
     reference = ':help E738'
     level = Level.WARNING
+    required_plugins = ['scope']
 
 
     def listen_node_types(self):
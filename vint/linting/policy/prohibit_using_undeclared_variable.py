@@ -10,6 +10,7 @@ class ProhibitUsingUndeclaredVariable(AbstractPolicy):
     description = 'Variable is not declared'
     reference = ':help E738'
     level = Level.WARNING
+    required_plugins = ['scope']
 
     def listen_node_types(self):
         return [NodeType.IDENTIFIER]
@@ -0,0 +1,110 @@
+# NOTE: This file is generated by dev_tool/generate_policy_manifest.py.
+#       Do not edit it by hand, and regenerate it when policies are changed.
+
+POLICY_MANIFEST = [
+    {
+        'name': 'ProhibitAbbreviationOption',
+        'module': 'vint.linting.policy.prohibit_abbreviation_option',
+        'level': 'STYLE_PROBLEM',
+        'listen_node_types': ['EXCMD', 'OPTION'],
+        'required_plugins': [],
+    },
+    {
+        'name': 'ProhibitAutocmdWithNoGroup',
+        'module': 'vint.linting.policy.prohibit_autocmd_with_no_group',
+        'level': 'WARNING',
+        'listen_node_types': ['EXCMD'],
+        'required_plugins': [],
+    },
+    {
+        'name': 'ProhibitCommandRelyOnUser',
+        'module': 'vint.linting.policy.prohibit_command_rely_on_user',
+        'level': 'WARNING',
+        'listen_node_types': ['EXCMD'],
+        'required_plugins': [],
+    },
+    {
+        'name': 'ProhibitCommandWithUnintendedSideEffect',
+        'module': 'vint.linting.policy.prohibit_command_with_unintended_side_effect',
+        'level': 'WARNING',
+        'listen_node_types': ['EXCMD'],
+        'required_plugins': [],
+    },
+    {
+        'name': 'ProhibitEncodingOptionAfterScriptEncoding',
+        'module': 'vint.linting.policy.prohibit_encoding_opt_after_scriptencoding',
+        'level': 'WARNING',
+        'listen_node_types': ['EXCMD'],
+        'required_plugins': [],
+    },
+    {
+        'name': 'ProhibitEqualTildeOperator',
+        'module': 'vint.linting.policy.prohibit_equal_tilde_operator',
+        'level': 'WARNING',
+        'listen_node_types': ['EQUAL', 'NEQUAL', 'GREATER', 'GEQUAL', 'SMALLER', 'SEQUAL', 'MATCH', 'NOMATCH', 'IS', 'ISNOT'],
+        'required_plugins': [],
+    },
+    {
+        'name': 'ProhibitImplicitScopeBuiltinVariable',
+        'module': 'vint.linting.policy.prohibit_implicit_scope_builtin_variable',
+        'level': 'WARNING',
+        'listen_node_types': ['IDENTIFIER'],
+        'required_plugins': ['scope'],
+    },
+    {
+        'name': 'ProhibitImplicitScopeVariable',
+        'module': 'vint.linting.policy.prohibit_implicit_scope_variable',
+        'level': 'STYLE_PROBLEM',
+        'listen_node_types': ['IDENTIFIER'],
+        'required_plugins': ['scope'],
+    },
+    {
+        'name': 'ProhibitInvalidMapCall',
+        'module': 'vint.linting.policy.prohibit_invalid_map_call',
+        'level': 'ERROR',
+        'listen_node_types': ['CALL'],
+        'required_plugins': [],
+    },
+    {
+        'name': 'ProhibitMissingScriptEncoding',
+        'module': 'vint.linting.policy.prohibit_missing_scriptencoding',
+        'level': 'WARNING',
+        'listen_node_types': ['TOPLEVEL'],
+        'required_plugins': [],
+    },
+    {
+        'name': 'ProhibitNoAbortFunction',
+        'module': 'vint.linting.policy.prohibit_no_abort_function',
+        'level': 'WARNING',
+        'listen_node_types': ['FUNCTION'],
+        'required_plugins': [],
+    },
+    {
+        'name': 'ProhibitSetNoCompatible',
+        'module': 'vint.linting.policy.prohibit_set_nocompatible',
+        'level': 'WARNING',
+        'listen_node_types': ['EXCMD'],
+        'required_plugins': [],
+    },
+    {
+        'name': 'ProhibitUnnecessaryDoubleQuote',
+        'module': 'vint.linting.policy.prohibit_unnecessary_double_quote',
+        'level': 'WARNING',
+        'listen_node_types': ['STRING'],
+        'required_plugins': [],
+    },
+    {
+        'name': 'ProhibitUnusedVariable',
+        'module': 'vint.linting.policy.prohibit_unused_variable',
+        'level': 'WARNING',
+        'listen_node_types': ['IDENTIFIER'],
+        'required_plugins': ['scope'],
+    },
+    {
+        'name': 'ProhibitUsingUndeclaredVariable',
+        'module': 'vint.linting.policy.prohibit_using_undeclared_variable',
+        'level': 'WARNING',
+        'listen_node_types': ['IDENTIFIER'],
+        'required_plugins': ['scope'],
+    },
+]
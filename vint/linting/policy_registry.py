@@ -1,3 +1,8 @@
+from typing import Dict, Any, List, Optional  # noqa: F401
+import importlib
+from vint.ast.node_type import NodeType
+from vint.linting.level import Level
+
 # For dynamic policy module import
 _policy_class_map = {}
 
@@ -10,3 +15,102 @@ def register_policy(PolicyClass):
 
 def get_policy_classes():
     return _policy_class_map.values()
+
+
+class LazyPolicyClass(object):
+    """ A stand-in of a policy class that is described by a policy manifest
+    entry. It knows the name, level, listening node types and required
+    plugins of the policy, so instantiating it does not import the policy
+    module. See LazyPolicy.
+    """
+    def __init__(self, manifest_entry):  # type: (Dict[str, Any]) -> None
+        self.__name__ = manifest_entry['name']
+        self.module_name = manifest_entry['module']
+        self.level = Level[manifest_entry['level']]
+        self.listen_node_type_names = manifest_entry['listen_node_types']
+        self.required_plugins = manifest_entry['required_plugins']
+
+
+    def __call__(self):  # type: () -> LazyPolicy
+        return LazyPolicy(self)
+
+
+    def import_policy_class(self):
+        importlib.import_module(self.module_name)
+
+        # NOTE: The policy module registered the actual class by the same name.
+        return _policy_class_map[self.__name__]
+
+
+
+class LazyPolicy(object):
+    """ A stand-in of a policy that answers listener lookups by the policy
+    manifest. It imports the policy module when the policy is used at first,
+    so policies that listen to node types that files do not have are never
+    imported.
+    """
+    def __init__(self, lazy_policy_class):  # type: (LazyPolicyClass) -> None
+        self.name = lazy_policy_class.__name__
+        self.level = lazy_policy_class.level
+        self.required_plugins = lazy_policy_class.required_plugins
+        self._lazy_policy_class = lazy_policy_class
+        self._listen_node_types = None  # type: Optional[List[NodeType]]
+        self._policy = None  # type: Any
+
+
+    def listen_node_types(self):  # type: () -> List[NodeType]
+        if self._listen_node_types is None:
+            self._listen_node_types = [NodeType[node_type_name]
+                                       for node_type_name in self._lazy_policy_class.listen_node_type_names]
+
+        return self._listen_node_types
+
+
+    def reset(self):  # type: () -> None
+        # NOTE: Policies that are not used yet have no states to reset.
+        if self._policy is not None:
+            self._policy.reset()
+
+
+    def __getattr__(self, name):
+        if self._policy is None:
+            self._policy = self._lazy_policy_class.import_policy_class()()
+
+        value = getattr(self._policy, name)
+
+        # NOTE: Cache methods such as get_violation_if_found to call them
+        #       without __getattr__ for each node.
+        if callable(value):
+            setattr(self, name, value)
+
+        return value
+
+
+
+def register_policies_by_manifest(policy_manifest):  # type: (List[Dict[str, Any]]) -> None
+    """ Register policies described by the manifest without importing the
+    policy modules. Policies that are already registered are kept.
+    """
+    for manifest_entry in policy_manifest:
+        if manifest_entry['name'] not in _policy_class_map:
+            register_policy(LazyPolicyClass(manifest_entry))
+
+
+def build_policy_manifest(policy_classes):  # type: (List[Any]) -> List[Dict[str, Any]]
+    """ Returns a policy manifest of the policy classes in the order of the
+    module names. It is used to generate vint/linting/policy_manifest.py.
+    """
+    policy_manifest = []
+
+    for PolicyClass in policy_classes:
+        policy = PolicyClass()
+
+        policy_manifest.append({
+            'name': PolicyClass.__name__,
+            'module': PolicyClass.__module__,
+            'level': policy.level.name,
+            'listen_node_types': [node_type.name for node_type in policy.listen_node_types()],
+            'required_plugins': list(policy.required_plugins),
+        })
+
+    return sorted(policy_manifest, key=lambda manifest_entry: (manifest_entry['module'], manifest_entry['name']))
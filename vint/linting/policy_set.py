@@ -4,23 +4,36 @@ from vint.linting.level import is_level_enabled
 
 class PolicySet(object):
     def __init__(self, policy_classes):
-        self._all_policies_map = PolicySet.create_all_policies_map(policy_classes)
+        # NOTE: Policies are instantiated on demand, because instantiating
+        #       a lazy policy class imports the policy module.
+        self._policy_classes_map = {PolicyClass.__name__: PolicyClass for PolicyClass in policy_classes}
+        self._all_policies_map = {}
         self.enabled_policies = []
 
 
-    @classmethod
-    def create_all_policies_map(cls, policy_classes):
-        policy_map = {PolicyClass.__name__: PolicyClass() for PolicyClass in policy_classes}
+    def _is_policy_exists(self, name):
+        return name in self._policy_classes_map
 
-        return policy_map
 
+    def _get_policy(self, name):
+        policy = self._all_policies_map.get(name)
 
-    def _is_policy_exists(self, name):
-        return name in self._all_policies_map
+        if policy is None:
+            PolicyClass = self._policy_classes_map[name]
+            policy = PolicyClass()
+            self._all_policies_map[name] = policy
 
+        return policy
 
-    def _get_policy(self, name):
-        return self._all_policies_map[name]
+
+    def _get_policy_level(self, name):
+        # NOTE: Some policies define the level only on instances.
+        level = getattr(self._policy_classes_map[name], 'level', None)
+
+        if level is None:
+            return self._get_policy(name).level
+
+        return level
 
 
     def _warn_unexistent_policy(self, policy_name):
@@ -32,10 +45,10 @@ class PolicySet(object):
         severity = config_dict['cmdargs']['severity']
         policy_enabling_map = {}
 
-        for policy_name, policy in self._all_policies_map.items():
-            policy_enabling_map[policy_name] = is_level_enabled(policy.level, severity)
+        for policy_name in self._policy_classes_map:
+            policy_enabling_map[policy_name] = is_level_enabled(self._get_policy_level(policy_name), severity)
 
-        prior_policy_enabling_map = config_dict['policies']
+        prior_policy_enabling_map = config_dict.get('policies', {})
 
         for policy_name, policy in prior_policy_enabling_map.items():
             if 'enabled' in policy:
@@ -67,6 +80,30 @@ class PolicySet(object):
                 self.enabled_policies.append(enabled_policy)
 
 
+    def get_policies_enabled_by_config(self, config_dict):
+        """ Returns policies that the config dictionary enables without
+        updating the enabled policies.
+        """
+        policy_enabling_map = self._get_enabling_map(config_dict)
+
+        return [self._get_policy(policy_name)
+                for policy_name, is_policy_enabled in policy_enabling_map.items()
+                if is_policy_enabled and self._is_policy_exists(policy_name)]
+
+
+    def get_policies_by_names(self, policy_names):
+        """ Returns policies that have the names. Unknown names are ignored. """
+        return [self._get_policy(policy_name)
+                for policy_name in policy_names
+                if self._is_policy_exists(policy_name)]
+
+
+    def reset_policies(self):
+        """ Resets states of the instantiated policies. """
+        for policy in self._all_policies_map.values():
+            policy.reset()
+
+
     def get_enabled_policies(self):
         """ Returns enabled policies. """
         return self.enabled_policies
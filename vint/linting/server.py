@@ -0,0 +1,318 @@
+from typing import Dict, Any, List, Optional, Tuple  # noqa: F401
+import os
+import json
+import errno
+import base64
+import socket
+import logging
+import threading
+from pathlib import Path
+
+try:
+    import socketserver
+except ImportError:
+    # NOTE: The module was renamed in Python 3.
+    import SocketServer as socketserver  # type: ignore
+
+from vint.linting.linter import Linter
+from vint.linting.env import build_environment
+from vint.linting.config.config_container import ConfigContainer
+from vint.linting.config.config_file_source import ConfigFileSource  # noqa: F401
+from vint.linting.config.config_cmdargs_source import ConfigCmdargsSource
+from vint.linting.config.config_default_source import ConfigDefaultSource
+from vint.linting.config.config_global_source import ConfigGlobalSource
+from vint.linting.config.config_project_source import ConfigProjectSource
+from vint.linting.config.config_util import get_config_value
+from vint.linting.lint_target import LintTargetBuffer
+from vint.linting.lint_result_cache import serialize_violation, deserialize_violation
+from vint.linting.policy_set import PolicySet
+from vint.linting.policy_registry import get_policy_classes
+
+
+SOCKET_FILENAME = 'server.sock'
+
+# NOTE: Only these command line arguments affect lint results. Other arguments
+#       such as output formats are handled by clients.
+LINT_CMDARG_NAMES = (
+    'error',
+    'warning',
+    'style_problem',
+    'max_violations',
+    'enable_neovim',
+)
+
+_ENCODING = 'utf-8'
+
+
+class LintServerError(Exception):
+    pass
+
+
+class LintServerUnavailableError(LintServerError):
+    pass
+
+
+class LintServer(object):
+    """ A class for lint servers that keep linters warm.
+    Building linters needs importing policies, loading config files and
+    instantiating policies. The server does them once for each pair of a
+    working directory and command line arguments, and reuses the linter
+    while the loaded config files are unchanged.
+
+    The protocol is newline delimited JSON over a Unix domain socket. A
+    request is an object such as:
+        {"cwd": "/path/to/project", "cmdargs": {"error": true},
+         "path": "path/to/file.vim", "content": "<base64 encoded bytes>"}
+    The "content" is optional. The server reads the path (relative to the cwd)
+    if it is omitted. A response is {"violations": [...]} or {"error": "..."}.
+    """
+    def __init__(self, socket_path):
+        # type: (Path) -> None
+        self._socket_path = socket_path
+
+        # NOTE: Linters are not thread safe. Connections are handled by threads,
+        #       so only one request can use linters at a time.
+        self._lock = threading.Lock()
+        self._warm_linters = {}  # type: Dict[str, Tuple[Linter, Dict[str, Any], List[Tuple[Path, float]]]]
+        self._server = None  # type: Optional[_ThreadingUnixStreamServer]
+
+
+    def serve_forever(self):  # type: () -> None
+        self._remove_stale_socket()
+
+        socket_dir = self._socket_path.parent
+        if not socket_dir.exists():
+            os.makedirs(str(socket_dir), 0o700)
+
+        # NOTE: Other users should not be able to read files through the server.
+        #       The socket is created without permissions for them, because
+        #       changing the permissions after binding leaves a window to connect.
+        previous_umask = os.umask(0o177)
+        try:
+            server = _ThreadingUnixStreamServer(str(self._socket_path), _LintRequestHandler)
+        finally:
+            os.umask(previous_umask)
+
+        server.lint_server = self
+        self._server = server
+
+        logging.debug('{cls}: listening on `{socket_path}`'.format(
+            cls=self.__class__.__name__,
+            socket_path=self._socket_path))
+
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            _remove_file_if_exists(self._socket_path)
+
+
+    def shutdown(self):  # type: () -> None
+        """ Stop serve_forever. It must be called from another thread. """
+        if self._server is not None:
+            self._server.shutdown()
+
+
+    def handle_request(self, request):  # type: (Dict[str, Any]) -> Dict[str, Any]
+        try:
+            cwd = Path(request['cwd'])
+            cmdargs = request.get('cmdargs', {})
+            path = Path(request['path'])
+
+            if 'content' in request:
+                content_bytes = base64.b64decode(request['content'])
+            else:
+                with Path(cwd, path).open('rb') as f:
+                    content_bytes = f.read()
+
+            with self._lock:
+                linter, config_dict = self._get_linter(cwd, cmdargs)
+                max_violations = get_config_value(config_dict, ['cmdargs', 'max-violations'])
+
+                violations = linter.lint(LintTargetBuffer(path, content_bytes), max_violations)
+
+        except Exception as err:
+            logging.debug('{cls}: cannot handle the request: {err}'.format(
+                cls=self.__class__.__name__,
+                err=err))
+            return {'error': '{type}: {err}'.format(type=type(err).__name__, err=err)}
+
+        return {'violations': [_serialize_violation_with_path(violation) for violation in violations]}
+
+
+    def _get_linter(self, cwd, cmdargs):
+        # type: (Path, Dict[str, Any]) -> Tuple[Linter, Dict[str, Any]]
+        linter_key = json.dumps([str(cwd), cmdargs], sort_keys=True)
+
+        if linter_key in self._warm_linters:
+            linter, config_dict, config_file_mtimes = self._warm_linters[linter_key]
+
+            if config_file_mtimes == _get_mtimes(path for path, _ in config_file_mtimes):
+                return linter, config_dict
+
+            logging.debug('{cls}: reloading changed config files'.format(cls=self.__class__.__name__))
+
+        env = build_environment(cmdargs)
+        env['cwd'] = cwd
+
+        global_source = ConfigGlobalSource(env)
+        project_source = ConfigProjectSource(env)
+
+        config = ConfigContainer(
+            ConfigDefaultSource(env),
+            global_source,
+            project_source,
+            ConfigCmdargsSource(env),
+        )
+        config_dict = config.get_config_dict()
+
+        linter = Linter(PolicySet(get_policy_classes()), config_dict)
+
+        # NOTE: Config files that are created later on the lookup paths should
+        #       also be loaded, so watch the paths that have higher priorities
+        #       than the loaded files too.
+        config_file_paths = _get_config_file_paths_to_watch(global_source, env) \
+            + _get_config_file_paths_to_watch(project_source, env)
+
+        self._warm_linters[linter_key] = (linter, config_dict, _get_mtimes(config_file_paths))
+        return linter, config_dict
+
+
+    def _remove_stale_socket(self):  # type: () -> None
+        if not self._socket_path.exists():
+            return
+
+        try:
+            client = LintClient(self._socket_path)
+            client.close()
+        except LintServerUnavailableError:
+            # NOTE: The previous server exited without removing the socket.
+            _remove_file_if_exists(self._socket_path)
+            return
+
+        raise LintServerError('another server is listening on `{socket_path}`'.format(
+            socket_path=self._socket_path))
+
+
+class LintClient(object):
+    """ A class for clients of LintServer. """
+    def __init__(self, socket_path):
+        # type: (Path) -> None
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            self._socket.connect(str(socket_path))
+        except socket.error as err:
+            self._socket.close()
+            raise LintServerUnavailableError('cannot connect to `{socket_path}`: {err}'.format(
+                socket_path=socket_path,
+                err=err))
+
+        self._reader = self._socket.makefile('rb')
+
+
+    def lint(self, path, content_bytes, cwd, cmdargs):
+        # type: (Path, bytes, Path, Dict[str, Any]) -> List[Dict[str, Any]]
+        request = {
+            'cwd': str(cwd),
+            'cmdargs': _pick_lint_cmdargs(cmdargs),
+            'path': str(path),
+            'content': base64.b64encode(content_bytes).decode('ascii'),
+        }
+
+        try:
+            self._socket.sendall(_encode_message(request))
+            response_line = self._reader.readline()
+        except socket.error as err:
+            raise LintServerUnavailableError('the server is disconnected: {err}'.format(err=err))
+
+        if not response_line:
+            raise LintServerUnavailableError('the server is disconnected')
+
+        response = json.loads(response_line.decode(_ENCODING))
+
+        if 'error' in response:
+            raise LintServerError(response['error'])
+
+        return [deserialize_violation(serialized_violation, path)
+                for serialized_violation in response['violations']]
+
+
+    def close(self):  # type: () -> None
+        self._reader.close()
+        self._socket.close()
+
+
+class _ThreadingUnixStreamServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class _LintRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        # NOTE: A client can send requests on a connection one by one.
+        for request_line in self.rfile:
+            try:
+                request = json.loads(request_line.decode(_ENCODING))
+            except ValueError as err:
+                response = {'error': 'invalid request: {err}'.format(err=err)}
+            else:
+                response = self.server.lint_server.handle_request(request)
+
+            self.wfile.write(_encode_message(response))
+            self.wfile.flush()
+
+
+
+def get_default_socket_path(env):  # type: (Dict[str, Any]) -> Path
+    return Path(env['xdg_cache_home'], 'vint', SOCKET_FILENAME)
+
+
+
+def _pick_lint_cmdargs(cmdargs):  # type: (Dict[str, Any]) -> Dict[str, Any]
+    return {name: cmdargs[name] for name in LINT_CMDARG_NAMES
+            if cmdargs.get(name) is not None}
+
+
+
+def _serialize_violation_with_path(violation):  # type: (Dict[str, Any]) -> Dict[str, Any]
+    return dict(serialize_violation(violation), path=str(violation['position']['path']))
+
+
+
+def _encode_message(message):  # type: (Dict[str, Any]) -> bytes
+    return (json.dumps(message) + '\n').encode(_ENCODING)
+
+
+
+def _get_config_file_paths_to_watch(config_source, env):
+    # type: (ConfigFileSource, Dict[str, Any]) -> List[Path]
+    paths = []  # type: List[Path]
+
+    for path in config_source.get_file_path_candidates(env):
+        paths.append(path)
+
+        if path == config_source.config_file_path:
+            break
+
+    return paths
+
+
+def _get_mtimes(paths):  # type: (Any) -> List[Tuple[Path, Optional[float]]]
+    mtimes = []
+
+    for path in paths:
+        try:
+            mtimes.append((path, path.stat().st_mtime))
+        except OSError:
+            mtimes.append((path, None))
+
+    return mtimes
+
+
+
+def _remove_file_if_exists(path):  # type: (Path) -> None
+    try:
+        os.remove(str(path))
+    except OSError as err:
+        if err.errno != errno.ENOENT:
+            raise
@@ -0,0 +1,39 @@
+from typing import Dict, Any  # noqa: F401
+
+
+class FrozenDict(dict):
+    """ A dict that cannot be changed. It is still a dict, so it can be
+    serialized to JSON and compared with dicts. copy() returns a mutable dict.
+    """
+    def _raise_immutable_error(self, *args, **kwargs):
+        raise TypeError('{cls} is immutable'.format(cls=self.__class__.__name__))
+
+
+    __setitem__ = _raise_immutable_error
+    __delitem__ = _raise_immutable_error
+    clear = _raise_immutable_error
+    pop = _raise_immutable_error
+    popitem = _raise_immutable_error
+    setdefault = _raise_immutable_error
+    update = _raise_immutable_error
+
+    # NOTE: "|=" of dicts is available since Python 3.9.
+    __ior__ = _raise_immutable_error
+
+
+    def copy(self):  # type: () -> Dict[Any, Any]
+        return dict(self)
+
+
+    def __reduce__(self):
+        # NOTE: The default pickling of dict subclasses calls __setitem__.
+        return (self.__class__, (dict(self),))
+
+
+
+def freeze_dict_deeply(dict_to_freeze):  # type: (Dict[Any, Any]) -> FrozenDict
+    """ Returns a FrozenDict that has frozen dicts instead of nested dicts.
+    Other values such as lists are not frozen.
+    """
+    return FrozenDict((key, freeze_dict_deeply(value) if isinstance(value, dict) else value)
+                      for key, value in dict_to_freeze.items())